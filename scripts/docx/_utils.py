@@ -28,12 +28,6 @@ def get_config():
 
 
 def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    """获取 tenant_access_token"""
-    import requests
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-    data = response.json()
-    if data.get("code") != 0:
-        print(f"❌ 获取 token 失败: {data.get('msg')}")
-        return None
-    return data.get("tenant_access_token")
+    """获取 tenant_access_token（使用 feishu_cli.auth 的共享缓存）"""
+    from feishu_cli.auth import get_tenant_access_token as _get_tenant_access_token
+    return _get_tenant_access_token(app_id, app_secret)
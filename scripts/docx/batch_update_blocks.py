@@ -7,8 +7,8 @@ API 文档: https://open.feishu.cn/document/server-docs/docs/docs/docx-v1/docume
 import argparse
 import json
 import os
-import requests
 import sys
+import uuid
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -31,10 +31,8 @@ except ImportError:
         return SimpleConfig()
 
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-    return response.json().get("tenant_access_token")
+from feishu_cli import ratelimit, transport
+from feishu_cli.auth import get_tenant_access_token
 
 
 def batch_update_blocks(app_id: str, app_secret: str, document_id: str, updates: list):
@@ -45,11 +43,13 @@ def batch_update_blocks(app_id: str, app_secret: str, document_id: str, updates:
 
     body = {"requests": updates}
 
-    response = requests.post(url, headers=headers, json=body)
+    # client_token 保证写操作幂等，网络错误 / 5xx 时可安全重试
+    params = {"client_token": str(uuid.uuid4())}
+    response = transport.post(url, headers=headers, params=params, json=body, family=ratelimit.DOCX_WRITE)
 
     try:
         result = response.json()
-    except:
+    except ValueError:
         print(f"❌ 请求失败: HTTP {response.status_code}")
         return None
 
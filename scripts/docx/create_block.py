@@ -8,8 +8,8 @@ SDK 文档: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/server-side-sd
 import argparse
 import json
 import os
-import requests
 import sys
+import uuid
 from pathlib import Path
 
 # 添加项目根目录到路径
@@ -39,11 +39,9 @@ except ImportError:
         return SimpleConfig()
 
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    """获取 tenant_access_token"""
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-    return response.json().get("tenant_access_token")
+from feishu_cli import ratelimit, transport
+from feishu_cli.auth import get_tenant_access_token
+from feishu_cli.blocks import build_children_body
 
 
 def create_block(
@@ -77,58 +75,14 @@ def create_block(
         "Content-Type": "application/json"
     }
 
-    # 块类型映射
-    block_configs = {
-        "text": {
-            "block_type": 2,
-            "body": {"text": {"elements": [{"text_run": {"content": content}}]}}
-        },
-        "heading": {
-            "block_type": {1: 3, 2: 4, 3: 5}.get(level, 3),
-            "body_key": {1: "heading1", 2: "heading2", 3: "heading3"}.get(level, "heading1"),
-            "body": {"elements": [{"text_run": {"content": content}}]}
-        },
-        "bullet": {
-            "block_type": 8,
-            "body": {"bullet": {"elements": [{"text_run": {"content": content}}]}}
-        },
-        "ordered": {
-            "block_type": 7,
-            "body": {"orderedList": {"elements": [{"text_run": {"content": content}}]}}
-        },
-        "code": {
-            "block_type": 10,
-            "body": {"code": {"language": "python", "elements": [{"text_run": {"content": content}}]}}
-        },
-        "quote": {
-            "block_type": 12,
-            "body": {"quote": {"elements": [{"text_run": {"content": content}}]}}
-        },
-        "todo": {
-            "block_type": 13,
-            "body": {"todo": {"elements": [{"text_run": {"content": content}}], "checked": False}}
-        }
-    }
-
-    if block_type not in block_configs:
+    body = build_children_body(block_type, content, level)
+    if body is None:
         print(f"❌ 不支持的块类型: {block_type}")
         return None
 
-    config = block_configs[block_type]
-    body = {"index": -1, "children": []}
-
-    if block_type == "heading":
-        body["children"].append({
-            "block_type": config["block_type"],
-            config["body_key"]: config["body"]
-        })
-    else:
-        body["children"].append({
-            "block_type": config["block_type"],
-            **config["body"]
-        })
-
-    response = requests.post(url, headers=headers, json=body)
+    # client_token 保证写操作幂等，网络错误 / 5xx 时可安全重试
+    params = {"client_token": str(uuid.uuid4())}
+    response = transport.post(url, headers=headers, params=params, json=body, family=ratelimit.DOCX_WRITE)
     result = response.json()
 
     if result.get("code") != 0:
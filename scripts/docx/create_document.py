@@ -10,6 +10,7 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 import lark_oapi as lark
 from lark_oapi.api.docx.v1 import *
@@ -42,11 +43,16 @@ except ImportError:
         return SimpleConfig()
 
 
+from feishu_cli import ratelimit, retry
+from feishu_cli.client import get_client
+
+
 def create_document(
     app_id: str,
     app_secret: str,
     title: str,
-    folder_token: str = None
+    folder_token: str = None,
+    client: Optional[lark.Client] = None
 ):
     """
     创建飞书文档
@@ -56,16 +62,12 @@ def create_document(
         app_secret: 应用密钥
         title: 文档标题
         folder_token: 文件夹 token（可选，指定创建位置）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
 
     Returns:
         dict: 包含 document_id 和 index_type 的创建结果
     """
-    # 创建 client
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    client = client or get_client(app_id, app_secret)
 
     # 构造请求体
     body_builder = CreateDocumentRequestBody.builder().title(title)
@@ -78,7 +80,11 @@ def create_document(
     request = CreateDocumentRequest.builder().request_body(body_builder.build()).build()
 
     # 发起请求
-    response: CreateDocumentResponse = client.docx.v1.document.create(request)
+    response: CreateDocumentResponse = retry.call_sdk(
+        lambda: client.docx.v1.document.create(request),
+        idempotent=False,
+        family=ratelimit.DOCX_WRITE
+    )
 
     # 处理失败返回
     if not response.success():
@@ -7,7 +7,6 @@ API 文档: https://open.feishu.cn/document/server-docs/docs/docs/docx-v1/docume
 import argparse
 import json
 import os
-import requests
 import sys
 from pathlib import Path
 
@@ -31,10 +30,8 @@ except ImportError:
         return SimpleConfig()
 
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-    return response.json().get("tenant_access_token")
+from feishu_cli import ratelimit, transport
+from feishu_cli.auth import get_tenant_access_token
 
 
 def delete_block(app_id: str, app_secret: str, document_id: str, block_id: str):
@@ -44,7 +41,7 @@ def delete_block(app_id: str, app_secret: str, document_id: str, block_id: str):
     url = f"https://open.feishu.cn/open-apis/docx/v1/documents/{document_id}/blocks/{block_id}"
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    response = requests.delete(url, headers=headers)
+    response = transport.delete(url, headers=headers, family=ratelimit.DOCX_WRITE)
 
     if response.status_code == 204:
         return True
@@ -54,7 +51,7 @@ def delete_block(app_id: str, app_secret: str, document_id: str, block_id: str):
         if result.get("code") != 0:
             print(f"❌ 删除失败: {result.get('code')} - {result.get('msg')}")
             return False
-    except:
+    except ValueError:
         pass
 
     return False
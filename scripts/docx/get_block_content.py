@@ -6,7 +6,6 @@ API 文档: https://open.feishu.cn/document/server-docs/docs/docs/docx-v1/docume
 
 import argparse
 import os
-import requests
 import sys
 from pathlib import Path
 
@@ -30,17 +29,15 @@ except ImportError:
         return SimpleConfig()
 
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-    return response.json().get("tenant_access_token")
+from feishu_cli import ratelimit, transport
+from feishu_cli.auth import get_tenant_access_token
 
 
 def get_block_content(app_id: str, app_secret: str, document_id: str, block_id: str):
     access_token = get_tenant_access_token(app_id, app_secret)
     url = f"https://open.feishu.cn/open-apis/docx/v1/documents/{document_id}/blocks/{block_id}"
     headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
-    response = requests.get(url, headers=headers)
+    response = transport.get(url, headers=headers, family=ratelimit.DOCX_READ)
     result = response.json()
     if result.get("code") != 0:
         print(f"❌ 获取失败: {result.get('code')} - {result.get('msg')}")
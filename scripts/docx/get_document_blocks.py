@@ -5,8 +5,9 @@ API 文档: https://open.feishu.cn/document/server-docs/docs/docs/docx-v1/docume
 """
 
 import argparse
+import contextlib
+import json
 import os
-import requests
 import sys
 from pathlib import Path
 
@@ -30,18 +31,27 @@ except ImportError:
         return SimpleConfig()
 
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-    return response.json().get("tenant_access_token")
+from feishu_cli import ratelimit, transport
+from feishu_cli.auth import get_tenant_access_token
+from feishu_cli.paging import PagingError, iter_pages
 
 
-def get_document_blocks(app_id: str, app_secret: str, document_id: str, page_size: int = 500):
+def get_document_blocks(
+    app_id: str,
+    app_secret: str,
+    document_id: str,
+    page_size: int = 500,
+    page_token: str = None,
+    revision: int = -1
+):
+    """获取文档的一页块，返回的 data 包含 items、has_more、page_token"""
     access_token = get_tenant_access_token(app_id, app_secret)
     url = f"https://open.feishu.cn/open-apis/docx/v1/documents/{document_id}/blocks"
     headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
-    params = {"page_size": page_size, "document_revision_id": -1}
-    response = requests.get(url, headers=headers, params=params)
+    params = {"page_size": page_size, "document_revision_id": revision}
+    if page_token:
+        params["page_token"] = page_token
+    response = transport.get(url, headers=headers, params=params, family=ratelimit.DOCX_READ)
     result = response.json()
     if result.get("code") != 0:
         print(f"❌ 获取失败: {result.get('code')} - {result.get('msg')}")
@@ -49,15 +59,66 @@ def get_document_blocks(app_id: str, app_secret: str, document_id: str, page_siz
     return result.get("data")
 
 
+def iter_document_blocks(
+    app_id: str,
+    app_secret: str,
+    document_id: str,
+    revision: int = -1,
+    page_size: int = 500,
+    prefetch: int = 1
+):
+    """
+    逐页遍历文档的全部块
+
+    调用方处理当前页时，下一页已在后台请求。
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        document_id: 文档 ID
+        revision: 文档版本，-1 表示最新版本
+        page_size: 分页大小，最大 500
+        prefetch: 预取页数，0 表示不预取
+
+    Yields:
+        dict: 块
+
+    Raises:
+        PagingError: 某一页获取失败
+    """
+    def fetch(page_token):
+        return get_document_blocks(app_id, app_secret, document_id, page_size, page_token, revision)
+
+    for page in iter_pages(fetch, prefetch=prefetch):
+        yield from page.get("items") or []
+
+
 def main():
     parser = argparse.ArgumentParser(description="获取文档所有块")
     parser.add_argument("--document-id", "-d", required=True, help="文档 ID")
+    parser.add_argument("--all", "-a", action="store_true", help="获取全部分页，以 NDJSON 逐行输出到 stdout")
+    parser.add_argument("--revision", "-r", type=int, default=-1, help="文档版本（默认最新）")
     args = parser.parse_args()
 
     config = get_config()
     if not config.validate_credentials():
         sys.exit(1)
 
+    if args.all:
+        out = sys.stdout
+        count = 0
+        # stdout 只输出 NDJSON，提示信息转到 stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                for block in iter_document_blocks(config.app_id, config.app_secret, args.document_id, args.revision):
+                    out.write(json.dumps(block, ensure_ascii=False) + "\n")
+                    count += 1
+            except PagingError:
+                print(f"❌ 获取失败（已输出 {count} 个块）")
+                sys.exit(1)
+        print(f"✅ 共 {count} 个块", file=sys.stderr)
+        sys.exit(0)
+
     result = get_document_blocks(config.app_id, config.app_secret, args.document_id)
     if result and result.get("items"):
         items = result.get("items", [])
@@ -10,6 +10,7 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 import lark_oapi as lark
 from lark_oapi.api.docx.v1 import *
@@ -41,10 +42,15 @@ except ImportError:
         return SimpleConfig()
 
 
+from feishu_cli import ratelimit, retry
+from feishu_cli.client import get_client
+
+
 def get_document(
     app_id: str,
     app_secret: str,
-    document_id: str
+    document_id: str,
+    client: Optional[lark.Client] = None
 ):
     """
     获取文档基本信息
@@ -53,18 +59,18 @@ def get_document(
         app_id: 应用 ID
         app_secret: 应用密钥
         document_id: 文档 ID
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
 
     Returns:
         dict: 包含文档基本信息的字典
     """
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    client = client or get_client(app_id, app_secret)
 
     request = GetDocumentRequest.builder().document_id(document_id).build()
-    response: GetDocumentResponse = client.docx.v1.document.get(request)
+    response: GetDocumentResponse = retry.call_sdk(
+        lambda: client.docx.v1.document.get(request),
+        family=ratelimit.DOCX_READ
+    )
 
     if not response.success():
         print(f"❌ 获取失败: {response.code} - {response.msg}")
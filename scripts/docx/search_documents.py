@@ -6,7 +6,6 @@
 
 import argparse
 import os
-import requests
 import sys
 from pathlib import Path
 
@@ -18,13 +17,8 @@ except ImportError:
     from _utils import get_config
 
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-    data = response.json()
-    if data.get("code") != 0:
-        return None
-    return data.get("tenant_access_token")
+from feishu_cli import transport
+from feishu_cli.auth import get_tenant_access_token
 
 
 def search_documents(app_id: str, app_secret: str, query: str = ""):
@@ -37,7 +31,7 @@ def search_documents(app_id: str, app_secret: str, query: str = ""):
     headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
     body = {"query": query, "search_type": "doc", "page_size": 10}
 
-    response = requests.post(url, headers=headers, json=body)
+    response = transport.post(url, headers=headers, json=body)
 
     if response.status_code != 200:
         print(f"❌ 搜索失败: HTTP {response.status_code}")
@@ -6,19 +6,26 @@ SDK 文档: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/server-side-sd
 """
 
 import json
+import sys
+from pathlib import Path
+from typing import Optional
+
 import lark_oapi as lark
 from lark_oapi.api.drive.v1 import *
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# 云空间根目录 token
-ROOT_FOLDER_TOKEN = "nodcnepxRXKIeBfFFprTKnXa6Rf"
+from feishu_cli import retry
+from feishu_cli.client import get_client
+from feishu_cli.path_index import get_root_folder_token
 
 
 def create_folder(
     app_id: str,
     app_secret: str,
     folder_name: str,
-    parent_token: str = None
+    parent_token: str = None,
+    client: Optional[lark.Client] = None
 ):
     """
     创建文件夹
@@ -28,19 +35,17 @@ def create_folder(
         app_secret: 应用密钥
         folder_name: 文件夹名称
         parent_token: 父文件夹 token（可选，不填则在云空间根目录创建）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
 
     Returns:
         dict: 创建的文件夹信息，包含 token、name 等
     """
-    # 创建 client，直接配置 app_id 和 app_secret
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    client = client or get_client(app_id, app_secret)
 
-    # 如果未指定父文件夹，使用根目录
-    target_token = parent_token if parent_token else ROOT_FOLDER_TOKEN
+    # 如果未指定父文件夹，使用当前应用的云空间根目录
+    target_token = parent_token or get_root_folder_token(app_id, app_secret)
+    if not target_token:
+        return None
 
     # 构造请求对象
     request = CreateFolderFileRequest.builder() \
@@ -51,7 +56,10 @@ def create_folder(
         .build()
 
     # 发起请求
-    response: CreateFolderFileResponse = client.drive.v1.file.create_folder(request)
+    response: CreateFolderFileResponse = retry.call_sdk(
+        lambda: client.drive.v1.file.create_folder(request),
+        idempotent=False
+    )
 
     # 处理失败返回
     if not response.success():
@@ -81,7 +89,7 @@ def main():
         app_id=app_id,
         app_secret=app_secret,
         folder_name=folder_name,
-        parent_token=None  # 不指定则在根目录创建
+        parent_token=None  # 不指定则在应用云空间根目录创建
     )
 
     if result:
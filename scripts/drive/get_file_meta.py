@@ -6,15 +6,28 @@ SDK 文档: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/server-side-sd
 """
 
 import json
+import sys
+from pathlib import Path
+from typing import Optional
+
 import lark_oapi as lark
 from lark_oapi.api.drive.v1 import *
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from feishu_cli import ratelimit, retry
+from feishu_cli.client import get_client
+from feishu_cli.meta import batch_query_meta
+from feishu_cli.meta_cache import MetaCache
+
 
 def get_file_meta(
     app_id: str,
     app_secret: str,
     file_token: str,
-    file_type: str
+    file_type: str,
+    client: Optional[lark.Client] = None,
+    cache: Optional[MetaCache] = None
 ):
     """
     获取文件元数据
@@ -24,16 +37,18 @@ def get_file_meta(
         app_secret: 应用密钥
         file_token: 文件 token
         file_type: 文件类型，可选值：docx、sheet、bitable、file、folder、mindnote、doc、slide、wiki
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+        cache: 元数据缓存（可选），命中时不发请求
 
     Returns:
         dict: 文件元数据信息
     """
-    # 创建 client，直接配置 app_id 和 app_secret
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    if cache:
+        cached = cache.get(file_token, file_type)
+        if cached:
+            return cached
+
+    client = client or get_client(app_id, app_secret)
 
     # 构造请求对象
     request = BatchQueryMetaRequest.builder() \
@@ -46,7 +61,10 @@ def get_file_meta(
         .build()
 
     # 发起请求
-    response: BatchQueryMetaResponse = client.drive.v1.meta.batch_query(request)
+    response: BatchQueryMetaResponse = retry.call_sdk(
+        lambda: client.drive.v1.meta.batch_query(request),
+        family=ratelimit.META_BATCH_QUERY
+    )
 
     # 处理失败返回
     if not response.success():
@@ -62,6 +80,8 @@ def get_file_meta(
 
     # 返回第一个文件的元数据
     if response.data and hasattr(response.data, 'metas') and response.data.metas:
+        if cache:
+            cache.put_many(response.data.metas)
         return response.data.metas[0] if len(response.data.metas) > 0 else None
 
     # 检查失败列表
@@ -75,56 +95,35 @@ def get_file_meta(
 def batch_get_file_meta(
     app_id: str,
     app_secret: str,
-    file_list: list
+    file_list: list,
+    client: Optional[lark.Client] = None,
+    concurrency: int = 4,
+    cache: Optional[MetaCache] = None
 ):
     """
     批量获取文件元数据
 
+    输入会按 token 去重，并按接口上限（每次 200 个）分块并发查询。
+
     Args:
         app_id: 应用 ID
         app_secret: 应用密钥
         file_list: 文件列表，格式：[{"token": "xxx", "type": "docx"}, ...]
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+        concurrency: 并发请求数
+        cache: 元数据缓存（可选），只请求未命中的文件
 
     Returns:
-        list: 文件元数据列表
+        BatchQueryMetaResponseBody: 合并后的 metas 与 failed_list，按输入顺序排列
     """
-    # 创建 client
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
-
-    # 构造请求对象
-    request_docs = [
-        RequestDoc.builder()
-            .doc_token(item["token"])
-            .doc_type(item["type"])
-            .build()
-        for item in file_list
-    ]
-
-    request = BatchQueryMetaRequest.builder() \
-        .request_body(MetaRequest.builder()
-            .request_docs(request_docs)
-            .build()) \
-        .build()
-
-    # 发起请求
-    response: BatchQueryMetaResponse = client.drive.v1.meta.batch_query(request)
-
-    # 处理失败返回
-    if not response.success():
-        lark.logger.error(
-            f"client.drive.v1.meta.batch_query failed, code: {response.code}, msg: {response.msg}, "
-            f"log_id: {response.get_log_id()}, resp: \n"
-            f"{json.dumps(json.loads(response.raw.content), indent=4, ensure_ascii=False)}"
-        )
-        return None
-
-    # 处理业务结果
-    lark.logger.info(lark.JSON.marshal(response.data, indent=4))
-    return response.data
+    return batch_query_meta(
+        app_id,
+        app_secret,
+        [(item["token"], item["type"]) for item in file_list],
+        concurrency=concurrency,
+        client=client,
+        cache=cache
+    )
 
 
 def main():
@@ -6,15 +6,25 @@ SDK 文档: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/server-side-sd
 """
 
 import json
+import sys
+from pathlib import Path
+from typing import Optional
+
 import lark_oapi as lark
 from lark_oapi.api.drive.v1 import *
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from feishu_cli import ratelimit, retry
+from feishu_cli.client import get_client
+
 
 def get_file_statistics(
     app_id: str,
     app_secret: str,
     file_token: str,
-    file_type: str
+    file_type: str,
+    client: Optional[lark.Client] = None
 ):
     """
     获取文件统计信息
@@ -24,16 +34,12 @@ def get_file_statistics(
         app_secret: 应用密钥
         file_token: 文件 token
         file_type: 文件类型，可选值：docx、sheet、bitable、file、folder、mindnote、doc、slide、wiki
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
 
     Returns:
         dict: 文件统计信息，包含访问量、浏览量、编辑者数量等
     """
-    # 创建 client，直接配置 app_id 和 app_secret
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    client = client or get_client(app_id, app_secret)
 
     # 构造请求对象
     request = GetFileStatisticsRequest.builder() \
@@ -42,7 +48,10 @@ def get_file_statistics(
         .build()
 
     # 发起请求
-    response: GetFileStatisticsResponse = client.drive.v1.file_statistics.get(request)
+    response: GetFileStatisticsResponse = retry.call_sdk(
+        lambda: client.drive.v1.file_statistics.get(request),
+        family=ratelimit.FILE_STATISTICS
+    )
 
     # 处理失败返回
     if not response.success():
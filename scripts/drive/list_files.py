@@ -6,9 +6,19 @@ SDK 文档: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/server-side-sd
 """
 
 import json
+import sys
+from pathlib import Path
+from typing import Optional
+
 import lark_oapi as lark
 from lark_oapi.api.drive.v1 import *
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from feishu_cli import ratelimit, retry
+from feishu_cli.client import get_client
+from feishu_cli.paging import iter_pages
+
 
 def list_files(
     app_id: str,
@@ -16,7 +26,9 @@ def list_files(
     parent_token: str = None,
     order_by: str = "EditedTime",
     direction: str = "DESC",
-    page_size: int = 50
+    page_size: int = 50,
+    client: Optional[lark.Client] = None,
+    page_token: str = None
 ):
     """
     获取文件夹中的文件清单
@@ -27,17 +39,14 @@ def list_files(
         parent_token: 父文件夹 token（可选，不填则获取根目录）
         order_by: 排序字段，可选值：CreatedTime、EditedTime、ModifiedTime、Size
         direction: 排序方向，可选值：ASC（升序）、DESC（降序）
-        page_size: 每页数量，范围 1-100
+        page_size: 每页数量，范围 1-200
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+        page_token: 分页标记（可选，不填则获取第一页）
 
     Returns:
-        dict: 文件列表数据，包含 files 和 page_token
+        dict: 文件列表数据，包含 files、has_more 和 next_page_token
     """
-    # 创建 client，直接配置 app_id 和 app_secret
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    client = client or get_client(app_id, app_secret)
 
     # 构造请求对象
     request_builder = ListFileRequest.builder() \
@@ -47,12 +56,17 @@ def list_files(
 
     # 如果指定了父文件夹，添加到请求中
     if parent_token:
-        request_builder.parent_token(parent_token)
+        request_builder.folder_token(parent_token)
+    if page_token:
+        request_builder.page_token(page_token)
 
     request = request_builder.build()
 
     # 发起请求
-    response: ListFileResponse = client.drive.v1.file.list(request)
+    response: ListFileResponse = retry.call_sdk(
+        lambda: client.drive.v1.file.list(request),
+        family=ratelimit.DRIVE_LIST
+    )
 
     # 处理失败返回
     if not response.success():
@@ -68,6 +82,42 @@ def list_files(
     return response.data
 
 
+def iter_files(
+    app_id: str,
+    app_secret: str,
+    parent_token: str = None,
+    order_by: str = "EditedTime",
+    direction: str = "DESC",
+    page_size: int = 200,
+    prefetch: int = 1,
+    client: Optional[lark.Client] = None
+):
+    """
+    逐页遍历文件夹中的全部文件（后台预取下一页）
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        parent_token: 父文件夹 token（可选，不填则获取根目录）
+        order_by: 排序字段
+        direction: 排序方向
+        page_size: 每页数量，范围 1-200
+        prefetch: 预取页数，0 表示不预取
+        client: 复用的 lark.Client（可选）
+
+    Yields:
+        File: 文件 / 文件夹，某一页失败时抛出 PagingError
+    """
+    client = client or get_client(app_id, app_secret)
+
+    def fetch(page_token):
+        return list_files(app_id, app_secret, parent_token, order_by, direction, page_size,
+                          client=client, page_token=page_token)
+
+    for page in iter_pages(fetch, prefetch=prefetch):
+        yield from page.files or []
+
+
 def main():
     """使用示例"""
     # 配置应用凭据
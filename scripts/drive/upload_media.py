@@ -5,10 +5,16 @@ API 文档: https://open.feishu.cn/document/server-docs/docs/drive-v1/media/uplo
 SDK 文档: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/server-side-sdk/python--sdk/preparations-before-development
 """
 
-import json
 import os
+import sys
+from pathlib import Path
+from typing import Optional
+
 import lark_oapi as lark
-from lark_oapi.api.drive.v1 import *
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from feishu_cli import upload
 
 
 def upload_media(
@@ -20,7 +26,10 @@ def upload_media(
     file_name: str = None,
     size: int = None,
     checksum: str = None,
-    extra: str = None
+    extra: str = None,
+    client: Optional[lark.Client] = None,
+    concurrency: int = upload.DEFAULT_PART_CONCURRENCY,
+    resume: bool = True
 ):
     """
     上传素材到云文档
@@ -46,6 +55,9 @@ def upload_media(
         size: 文件大小（字节，可选，默认自动获取）
         checksum: Adler-32 校验和（可选）
         extra: 额外参数（可选，JSON 字符串格式）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+        concurrency: 分片上传时同时上传的分片数（文件超过 20MB 时自动分片）
+        resume: 分片上传中断后，重新运行是否只发送缺失的分片
 
     Returns:
         dict: 包含 file_token 的上传结果
@@ -55,68 +67,19 @@ def upload_media(
         lark.logger.error(f"文件不存在: {file_path}")
         return None
 
-    # 获取文件信息
-    if file_name is None:
-        file_name = os.path.basename(file_path)
-
-    if size is None:
-        size = os.path.getsize(file_path)
-
-    # 检查文件大小限制 (20MB)
-    max_size = 20 * 1024 * 1024  # 20MB
-    if size > max_size:
-        lark.logger.error(f"文件大小超过限制: {size} > {max_size}，请使用分片上传")
-        return None
-
-    # 创建 client
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
-
-    # 读取文件内容
-    with open(file_path, 'rb') as f:
-        file_content = f.read()
-
-    # 更新文件大小为实际读取的大小
-    actual_size = len(file_content)
-    if actual_size != size:
+    actual_size = os.path.getsize(file_path)
+    if size is not None and size != actual_size:
         lark.logger.warning(f"文件大小修正: {size} -> {actual_size}")
-        size = actual_size
-
-    # 构造请求体
-    body_builder = UploadAllMediaRequestBody.builder() \
-        .file_name(file_name) \
-        .parent_type(parent_type) \
-        .parent_node(parent_node) \
-        .size(size) \
-        .file(file_content)
-
-    # 添加可选参数
-    if checksum:
-        body_builder.checksum(checksum)
-    if extra:
-        body_builder.extra(extra)
-
-    # 构造请求对象
-    request = UploadAllMediaRequest.builder().request_body(body_builder.build()).build()
-
-    # 发起请求
-    response: UploadAllMediaResponse = client.drive.v1.media.upload_all(request)
-
-    # 处理失败返回
-    if not response.success():
-        lark.logger.error(
-            f"client.drive.v1.media.upload_all failed, code: {response.code}, msg: {response.msg}, "
-            f"log_id: {response.get_log_id()}, resp: \n"
-            f"{json.dumps(json.loads(response.raw.content), indent=4, ensure_ascii=False)}"
-        )
-        return None
 
-    # 处理业务结果
-    lark.logger.info(lark.JSON.marshal(response.data, indent=4))
-    return response.data
+    result = upload.upload_media(
+        app_id, app_secret, file_path, parent_type, parent_node,
+        file_name=file_name, checksum=checksum, extra=extra, concurrency=concurrency,
+        resume=resume, client=client
+    )
+
+    if result:
+        lark.logger.info(lark.JSON.marshal(result, indent=4))
+    return result
 
 
 def main():
@@ -6,5 +6,8 @@
 __version__ = "0.1.0"
 __author__ = "Feishu Skill Team"
 
-# 导入主函数
-from .__main__ import main
+
+def main():
+    """CLI 主入口（延迟导入，使 feishu_cli.auth 等模块可脱离 SDK 单独使用）"""
+    from .__main__ import main as _main
+    return _main()
@@ -4,9 +4,15 @@
 
 import argparse
 import sys
+import time
 
+from . import retry
 from .config import Config, get_config
-from .commands import drive, doc
+from .meta_cache import MetaCache
+from .path_index import PathIndex
+from .wiki_cache import WikiNodeCache
+from .token_store import TokenStore
+from .commands import drive, doc, wiki
 
 
 def cmd_config(args):
@@ -30,6 +36,81 @@ def cmd_config(args):
             if 'secret' in key.lower():
                 value = value[:10] + '***' if value else 'N/A'
             print(f"  {key}: {value}")
+    elif args.action == 'token':
+        return cmd_config_token(args)
+    elif args.action == 'meta-cache':
+        return cmd_config_meta_cache(args)
+    elif args.action == 'path-index':
+        return cmd_config_path_index(args)
+    elif args.action == 'wiki-cache':
+        return cmd_config_wiki_cache(args)
+    return 0
+
+
+def cmd_config_token(args):
+    """处理 config token 命令"""
+    store = TokenStore()
+
+    if args.purge:
+        removed = store.purge()
+        print(f"✅ 已清除 {removed} 个缓存 token: {store.path}")
+        return 0
+
+    entries = store.entries()
+    print(f"token 缓存: {store.path}")
+    if not entries:
+        print("  (空)")
+        return 0
+    now = time.time()
+    for app_id, entry in entries.items():
+        remaining = int(entry.get("expire", 0) - now)
+        token = entry.get("token") or ''
+        state = f"有效，剩余 {remaining // 60} 分钟" if remaining > 0 else "已过期"
+        print(f"  {app_id}: {token[:10]}*** {state}")
+    return 0
+
+
+def cmd_config_meta_cache(args):
+    """处理 config meta-cache 命令"""
+    cache = MetaCache(ttl=get_config().meta_cache_ttl)
+    if args.purge:
+        removed = cache.purge()
+        print(f"✅ 已清除 {removed} 条缓存的元数据: {cache.path}")
+        return 0
+
+    stats = cache.stats()
+    print(f"元数据缓存: {cache.path}")
+    print(f"  条目数: {stats['entries']}")
+    print(f"  有效期: {cache.ttl:.0f} 秒")
+    print(f"  累计命中: {stats['total_hits']}/{stats['total_hits'] + stats['total_misses']}"
+          f"（{stats['total_hit_rate']:.1%}）")
+    return 0
+
+
+def cmd_config_path_index(args):
+    """处理 config path-index 命令"""
+    index = PathIndex()
+    if args.purge:
+        removed = index.purge()
+        print(f"✅ 已清除 {removed} 条路径索引: {index.path}")
+        return 0
+
+    print(f"路径索引: {index.path}")
+    print(f"  条目数: {index.count()}")
+    return 0
+
+
+def cmd_config_wiki_cache(args):
+    """处理 config wiki-cache 命令"""
+    cache = WikiNodeCache(ttl=get_config().wiki_cache_ttl)
+    if args.purge:
+        removed = cache.purge()
+        print(f"✅ 已清除 {removed} 个缓存的知识库节点: {cache.path}")
+        return 0
+
+    print(f"知识库节点缓存: {cache.path}")
+    print(f"  条目数: {cache.count()}")
+    print(f"  有效期: {cache.ttl:.0f} 秒")
     return 0
 
 
@@ -44,14 +125,20 @@ def main():
   feishu drive list                    列出根目录文件
   feishu drive list -p <token> -l 10   列出指定文件夹的 10 个文件
   feishu drive create-folder "测试"     创建文件夹
+  feishu drive mkdir -p /Reports/2026/Q4  按路径创建文件夹
   feishu doc create "我的文档"          创建文档
+  feishu wiki resolve <wiki 链接>        解析知识库节点
+  feishu wiki export <space_id> ./wiki  导出知识空间为 Markdown
   feishu config set app_id xxx         设置配置
   feishu config list                   查看配置
+  feishu config token --status         查看 token 缓存
         """
     )
 
     # 添加版本参数
     parser.add_argument('--version', action='version', version='%(prog)s 0.1.0')
+    parser.add_argument('--retries', type=int, metavar='N',
+                        help='失败重试次数（覆盖配置项 max_retries）')
 
     # 创建子命令解析器
     subparsers = parser.add_subparsers(dest='module', help='功能模块')
@@ -75,13 +162,45 @@ def main():
     list_parser = config_subparsers.add_parser('list', help='列出所有配置')
     list_parser.set_defaults(func=cmd_config)
 
+    # config token
+    token_parser = config_subparsers.add_parser('token', help='管理 token 磁盘缓存')
+    token_group = token_parser.add_mutually_exclusive_group()
+    token_group.add_argument('--status', action='store_true', help='查看缓存的 token（默认）')
+    token_group.add_argument('--purge', action='store_true', help='清除所有缓存的 token')
+    token_parser.set_defaults(func=cmd_config)
+
+    # config meta-cache
+    meta_cache_parser = config_subparsers.add_parser('meta-cache', help='管理文件元数据缓存')
+    meta_cache_group = meta_cache_parser.add_mutually_exclusive_group()
+    meta_cache_group.add_argument('--status', action='store_true', help='查看条目数与命中率（默认）')
+    meta_cache_group.add_argument('--purge', action='store_true', help='清空缓存与统计')
+    meta_cache_parser.set_defaults(func=cmd_config)
+
+    # config path-index
+    path_index_parser = config_subparsers.add_parser('path-index', help='管理云空间路径索引')
+    path_index_group = path_index_parser.add_mutually_exclusive_group()
+    path_index_group.add_argument('--status', action='store_true', help='查看条目数（默认）')
+    path_index_group.add_argument('--purge', action='store_true', help='清空索引（云端目录被移动或删除后使用）')
+    path_index_parser.set_defaults(func=cmd_config)
+
+    # config wiki-cache
+    wiki_cache_parser = config_subparsers.add_parser('wiki-cache', help='管理知识库节点缓存')
+    wiki_cache_group = wiki_cache_parser.add_mutually_exclusive_group()
+    wiki_cache_group.add_argument('--status', action='store_true', help='查看条目数（默认）')
+    wiki_cache_group.add_argument('--purge', action='store_true', help='清空缓存')
+    wiki_cache_parser.set_defaults(func=cmd_config)
+
     # 注册各模块命令
     drive.build_parser(subparsers)
     doc.build_parser(subparsers)
+    wiki.build_parser(subparsers)
 
     # 解析参数
     args = parser.parse_args()
 
+    if args.retries is not None:
+        retry.configure(max_retries=args.retries)
+
     # 如果没有指定命令，显示帮助
     if not args.module and not hasattr(args, 'func'):
         parser.print_help()
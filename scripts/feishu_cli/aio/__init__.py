@@ -0,0 +1,24 @@
+"""
+飞书 CLI - asyncio 接口
+
+与同步脚本对应的协程版本，直接调用开放平台 REST 接口：
+同一事件循环内的所有调用共用一个 httpx.AsyncClient 连接池，
+tenant_access_token 通过 feishu_cli.auth 的 single-flight 缓存获取。
+
+示例:
+    from feishu_cli import aio
+
+    async def main():
+        data = await aio.list_files(app_id, app_secret, parent_token="fldxxx")
+        await aio.aclose()
+"""
+
+from .transport import aclose, api_call, get_session
+from .drive import list_files
+from .docx import create_block, get_document_blocks
+
+__all__ = [
+    'aclose', 'api_call', 'get_session',
+    'list_files',
+    'create_block', 'get_document_blocks',
+]
@@ -0,0 +1,80 @@
+"""
+飞书 CLI - 文档 asyncio 接口
+"""
+
+import uuid
+from typing import Optional
+
+from .. import ratelimit
+from ..blocks import build_children_body
+from .transport import api_call
+
+
+async def get_document_blocks(
+    app_id: str,
+    app_secret: str,
+    document_id: str,
+    page_size: int = 500,
+    page_token: Optional[str] = None
+) -> Optional[dict]:
+    """
+    获取文档的一页块
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        document_id: 文档 ID
+        page_size: 分页大小，最大 500
+        page_token: 分页标记
+
+    Returns:
+        dict: 包含 items、has_more、page_token 的块列表
+    """
+    params = {"page_size": page_size, "document_revision_id": -1}
+    if page_token:
+        params["page_token"] = page_token
+
+    return await api_call(
+        app_id, app_secret, "GET",
+        f"/docx/v1/documents/{document_id}/blocks",
+        params=params,
+        family=ratelimit.DOCX_READ
+    )
+
+
+async def create_block(
+    app_id: str,
+    app_secret: str,
+    document_id: str,
+    block_id: str,
+    block_type: str,
+    content: str,
+    level: int = 1
+) -> Optional[dict]:
+    """
+    创建块
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        document_id: 文档 ID
+        block_id: 父块 ID
+        block_type: 块类型 (text, heading, bullet, ordered, code, quote, todo)
+        content: 内容
+        level: 标题级别 (仅用于 heading 类型)
+
+    Returns:
+        dict: 创建的块信息
+    """
+    body = build_children_body(block_type, content, level)
+    if body is None:
+        print(f"❌ 不支持的块类型: {block_type}")
+        return None
+
+    return await api_call(
+        app_id, app_secret, "POST",
+        f"/docx/v1/documents/{document_id}/blocks/{block_id}/children",
+        params={"client_token": str(uuid.uuid4())},
+        json=body,
+        family=ratelimit.DOCX_WRITE
+    )
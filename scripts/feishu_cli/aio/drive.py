@@ -0,0 +1,42 @@
+"""
+飞书 CLI - 云空间 asyncio 接口
+"""
+
+from typing import Optional
+
+from .. import ratelimit
+from .transport import api_call
+
+
+async def list_files(
+    app_id: str,
+    app_secret: str,
+    parent_token: Optional[str] = None,
+    order_by: str = "EditedTime",
+    direction: str = "DESC",
+    page_size: int = 50,
+    page_token: Optional[str] = None
+) -> Optional[dict]:
+    """
+    获取文件夹中的文件清单
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        parent_token: 父文件夹 token
+        order_by: 排序字段
+        direction: 排序方向
+        page_size: 每页数量
+        page_token: 分页标记
+
+    Returns:
+        dict: 文件列表数据，包含 files、has_more、next_page_token
+    """
+    params = {"order_by": order_by, "direction": direction, "page_size": page_size}
+    if parent_token:
+        params["folder_token"] = parent_token
+    if page_token:
+        params["page_token"] = page_token
+
+    return await api_call(app_id, app_secret, "GET", "/drive/v1/files", params=params,
+                          family=ratelimit.DRIVE_LIST)
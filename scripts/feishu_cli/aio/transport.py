@@ -0,0 +1,137 @@
+"""
+飞书 CLI - asyncio HTTP 传输层
+
+每个事件循环持有一个 httpx.AsyncClient，连接池大小、超时与代理沿用同步传输层的配置，
+限速与重试策略同样与同步传输层共用。
+"""
+
+import asyncio
+import weakref
+from typing import Optional
+
+import httpx
+
+from .. import ratelimit, retry
+from ..auth import aget_tenant_access_token
+from ..transport import BASE_URL, load_settings
+
+
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_session() -> httpx.AsyncClient:
+    """获取当前事件循环共享的 AsyncClient（首次调用时创建）"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.is_closed:
+        settings = load_settings()
+        session = httpx.AsyncClient(
+            base_url=BASE_URL,
+            limits=httpx.Limits(
+                max_connections=settings["pool_size"],
+                max_keepalive_connections=settings["pool_size"]
+            ),
+            # 排队等待连接不计超时，大量并发调用只在连接池上排队
+            timeout=httpx.Timeout(
+                settings["read_timeout"],
+                connect=settings["connect_timeout"],
+                pool=None
+            ),
+            proxy=settings["proxy"]
+        )
+        _sessions[loop] = session
+    return session
+
+
+async def aclose():
+    """关闭当前事件循环的 AsyncClient"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.aclose()
+
+
+async def request(
+    method: str,
+    url: str,
+    family: Optional[str] = None,
+    idempotent: Optional[bool] = None,
+    **kwargs
+) -> httpx.Response:
+    """
+    发起请求，失败时按重试策略重试
+
+    Args:
+        method: HTTP 方法
+        url: 以 / 开头的开放平台路径，或完整 URL
+        family: 接口族（见 ratelimit），指定时先按该接口族限速
+        idempotent: 是否幂等，默认按方法判断（携带 client_token 的写请求也视为幂等）
+        **kwargs: 透传给 httpx
+
+    Returns:
+        httpx.Response: 响应对象（重试耗尽时为最后一次响应）
+    """
+    if idempotent is None:
+        idempotent = retry.is_idempotent(method, kwargs.get("params"))
+
+    policy = retry.get_policy()
+    attempt = 0
+    while True:
+        await ratelimit.aacquire(family)
+        try:
+            response = await get_session().request(method, url, **kwargs)
+        except httpx.TransportError:
+            if not idempotent or attempt >= policy.max_retries:
+                raise
+            wait = policy.delay(attempt)
+        else:
+            if attempt >= policy.max_retries:
+                return response
+            if not retry.should_retry(retry.response_failure(response), idempotent):
+                return response
+            wait = policy.delay(attempt, response.headers)
+        attempt += 1
+        await asyncio.sleep(wait)
+
+
+async def api_call(
+    app_id: str,
+    app_secret: str,
+    method: str,
+    path: str,
+    params: Optional[dict] = None,
+    json: Optional[dict] = None,
+    family: Optional[str] = None
+) -> Optional[dict]:
+    """
+    以 tenant_access_token 调用开放平台接口
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        method: HTTP 方法
+        path: 接口路径，如 /drive/v1/files
+        params: 查询参数
+        json: JSON 请求体
+        family: 接口族（见 ratelimit），指定时先按该接口族限速
+
+    Returns:
+        dict: 响应中的 data 字段，失败返回 None
+    """
+    access_token = await aget_tenant_access_token(app_id, app_secret)
+    if not access_token:
+        return None
+
+    headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+    response = await request(method, path, family=family, headers=headers, params=params, json=json)
+
+    try:
+        result = response.json()
+    except ValueError:
+        print(f"❌ 请求失败: HTTP {response.status_code}")
+        return None
+
+    if result.get("code") != 0:
+        print(f"❌ 请求失败: {result.get('code')} - {result.get('msg')}")
+        return None
+
+    return result.get("data")
@@ -0,0 +1,50 @@
+"""
+飞书 CLI - 原子写文件
+
+先写入同目录下的临时文件，再用 os.replace 替换目标文件：写入中断时目标文件要么是旧内容，
+要么是完整的新内容。上传 / 同步 / 导出清单、下载进度、遍历 checkpoint 与 token 缓存共用。
+"""
+
+import contextlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+
+def write_text(path: Union[str, Path], text: str, mode: Optional[int] = None):
+    """
+    原子地写入文本文件
+
+    Args:
+        path: 目标文件路径（所在目录需已存在）
+        text: 文件内容
+        mode: 文件权限（如 0o600），创建临时文件时即生效；不填时按 umask 使用默认权限
+    """
+    path = Path(path)
+    # 临时文件名带上进程与线程号，多个进程同时写同一文件时互不覆盖
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json(path: Union[str, Path], data, mode: Optional[int] = None, **kwargs):
+    """
+    原子地写入 JSON 文件
+
+    Args:
+        path: 目标文件路径
+        data: 可 JSON 序列化的数据
+        mode: 文件权限，见 write_text
+        **kwargs: 透传给 json.dumps，ensure_ascii 默认为 False
+    """
+    kwargs.setdefault("ensure_ascii", False)
+    write_text(path, json.dumps(data, **kwargs), mode)
@@ -1,29 +1,49 @@
 """
 飞书 CLI - 认证模块
+
+tenant_access_token 在进程内按 app_id 缓存，临近过期时自动刷新，
+所有脚本与 CLI 命令共用同一份缓存，避免每次操作前都额外请求一次鉴权接口。
+默认还会写入 ~/.feishu_tokens.json，供后续 CLI 进程复用（token_cache=off 关闭）。
+刷新是 single-flight 的：并发的线程 / 协程只会触发一次鉴权请求，其余调用方等待其结果。
 """
 
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
 import requests
-from typing import Optional
 
+from . import transport
+from .config import get_config
+from .token_store import TokenStore
+
+
+TOKEN_URL = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> Optional[str]:
+# 距离过期不足该秒数时提前刷新（token 有效期通常为 2 小时）
+REFRESH_MARGIN = 5 * 60
+# 响应中缺少 expire 时使用文档给出的有效期（秒）
+DEFAULT_TOKEN_TTL = 7200
+
+
+def fetch_tenant_access_token(app_id: str, app_secret: str) -> Optional[Tuple[str, float]]:
     """
-    获取 tenant_access_token
+    向开放平台请求新的 tenant_access_token（不经过缓存）
 
     Args:
         app_id: 应用 ID
         app_secret: 应用密钥
 
     Returns:
-        str: tenant_access_token，失败返回 None
+        tuple: (token, 过期时间戳)，失败返回 None
     """
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-
     try:
-        response = requests.post(
-            url,
+        response = transport.post(
+            TOKEN_URL,
             json={"app_id": app_id, "app_secret": app_secret},
-            timeout=10
+            timeout=10,
+            idempotent=True
         )
         result = response.json()
 
@@ -31,12 +51,209 @@ def get_tenant_access_token(app_id: str, app_secret: str) -> Optional[str]:
             print(f"❌ 获取 token 失败: {result.get('msg')}")
             return None
 
-        return result.get("tenant_access_token")
+        # 缺少 expire 时按 0 处理会得到一个立即过期的 token，每次调用都会重新获取
+        return result.get("tenant_access_token"), time.time() + (result.get("expire") or DEFAULT_TOKEN_TTL)
     except requests.RequestException as e:
         print(f"❌ 网络请求失败: {e}")
         return None
 
 
+class _Flight:
+    """一次进行中的 token 刷新，等待者共享其结果"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.token: Optional[str] = None
+
+
+class TokenProvider:
+    """tenant_access_token 缓存，按 app_id 保存 token 及其过期时间"""
+
+    def __init__(self, refresh_margin: int = REFRESH_MARGIN, store: Optional[TokenStore] = None):
+        self.refresh_margin = refresh_margin
+        self.store = store
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], asyncio.Future] = {}
+        # 统计：实际鉴权请求次数 / 合并到进行中刷新的等待次数
+        self.fetches = 0
+        self.coalesced_waits = 0
+
+    def peek(self, app_id: str) -> Optional[str]:
+        """返回仍然有效的缓存 token，不发起网络请求"""
+        with self._lock:
+            entry = self._tokens.get(app_id)
+        if entry and entry[1] - self.refresh_margin > time.time():
+            return entry[0]
+        return None
+
+    def get(self, app_id: str, app_secret: str, force_refresh: bool = False) -> Optional[str]:
+        """
+        获取 token，缓存缺失或即将过期时重新获取
+
+        Args:
+            app_id: 应用 ID
+            app_secret: 应用密钥
+            force_refresh: 忽略缓存强制刷新
+
+        Returns:
+            str: tenant_access_token，失败返回 None
+        """
+        if not force_refresh:
+            token = self.peek(app_id)
+            if token:
+                return token
+
+        with self._lock:
+            flight = self._flights.get(app_id)
+            leader = flight is None
+            if leader:
+                flight = self._flights[app_id] = _Flight()
+            else:
+                self.coalesced_waits += 1
+
+        if not leader:
+            flight.done.wait()
+            return flight.token
+
+        try:
+            flight.token = self._refresh(app_id, app_secret, force_refresh)
+        finally:
+            with self._lock:
+                self._flights.pop(app_id, None)
+            flight.done.set()
+        return flight.token
+
+    async def aget(self, app_id: str, app_secret: str, force_refresh: bool = False) -> Optional[str]:
+        """
+        get 的 asyncio 版本，同一事件循环内的并发协程共享一次刷新
+
+        刷新在默认线程池中执行，与线程调用方同样经过 single-flight 合并。
+        """
+        if not force_refresh:
+            token = self.peek(app_id)
+            if token:
+                return token
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), app_id)
+        future = self._async_flights.get(key)
+        if future is not None:
+            with self._lock:
+                self.coalesced_waits += 1
+            return await asyncio.shield(future)
+
+        future = loop.run_in_executor(None, self.get, app_id, app_secret, force_refresh)
+        self._async_flights[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._async_flights.pop(key, None)
+
+    def _refresh(self, app_id: str, app_secret: str, force_refresh: bool) -> Optional[str]:
+        """实际获取 token 并写入缓存，仅由 single-flight 的领头调用方执行"""
+        if not force_refresh:
+            # 等锁期间可能已有其他调用方刷新完成
+            token = self.peek(app_id)
+            if token:
+                return token
+
+        def fetch():
+            with self._lock:
+                self.fetches += 1
+            return fetch_tenant_access_token(app_id, app_secret)
+
+        if self.store is None:
+            fetched = fetch()
+        elif force_refresh:
+            fetched = fetch()
+            if fetched:
+                self.store.save(app_id, *fetched)
+        else:
+            # 先看磁盘缓存，缺失时在文件锁内获取，避免并发进程重复鉴权
+            fetched = self.store.load_or_fetch(app_id, fetch, self.refresh_margin)
+
+        if not fetched:
+            return None
+
+        with self._lock:
+            self._tokens[app_id] = fetched
+        return fetched[0]
+
+    def remember(self, app_id: str, token: str, expire: float):
+        """写入外部获取到的 token（如 SDK 自行获取的 token）"""
+        with self._lock:
+            self._tokens[app_id] = (token, expire)
+        if self.store is not None:
+            self.store.save(app_id, token, expire)
+
+    def stats(self) -> Dict[str, int]:
+        """返回鉴权请求统计"""
+        with self._lock:
+            return {"fetches": self.fetches, "coalesced_waits": self.coalesced_waits}
+
+    def invalidate(self, app_id: Optional[str] = None):
+        """丢弃指定 app_id（或全部）的缓存 token，包括磁盘缓存"""
+        with self._lock:
+            if app_id is None:
+                self._tokens.clear()
+            else:
+                self._tokens.pop(app_id, None)
+        if self.store is not None:
+            self.store.purge(app_id)
+
+
+_provider: Optional[TokenProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_token_provider() -> TokenProvider:
+    """获取进程级共享的 TokenProvider"""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                store = TokenStore() if get_config().token_cache_enabled else None
+                _provider = TokenProvider(store=store)
+    return _provider
+
+
+def get_tenant_access_token(app_id: str, app_secret: str, force_refresh: bool = False) -> Optional[str]:
+    """
+    获取 tenant_access_token（带缓存）
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        force_refresh: 忽略缓存强制刷新
+
+    Returns:
+        str: tenant_access_token，失败返回 None
+    """
+    return get_token_provider().get(app_id, app_secret, force_refresh=force_refresh)
+
+
+async def aget_tenant_access_token(app_id: str, app_secret: str, force_refresh: bool = False) -> Optional[str]:
+    """
+    get_tenant_access_token 的 asyncio 版本
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        force_refresh: 忽略缓存强制刷新
+
+    Returns:
+        str: tenant_access_token，失败返回 None
+    """
+    return await get_token_provider().aget(app_id, app_secret, force_refresh=force_refresh)
+
+
+def get_token_stats() -> Dict[str, int]:
+    """返回共享 TokenProvider 的统计：fetches（鉴权请求数）、coalesced_waits（合并等待数）"""
+    return get_token_provider().stats()
+
+
 def get_access_token(app_id: str, app_secret: str) -> Optional[str]:
     """
     获取 access_token（别名，与 get_tenant_access_token 相同）
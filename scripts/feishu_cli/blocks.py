@@ -0,0 +1,151 @@
+"""
+飞书 CLI - 文档块构造与读取
+
+创建块接口的请求体构造，同步脚本与 aio 接口共用；以及按页获取文档全部块
+
+API 文档: https://open.feishu.cn/document/server-docs/docs/docs/docx-v1/document-block/list
+"""
+
+import json
+from typing import Optional
+
+import lark_oapi as lark
+from lark_oapi.api.docx.v1 import ListDocumentBlockRequest
+
+from . import ratelimit, retry
+from .paging import PagingError, iter_pages
+
+
+BLOCK_TYPES = ("text", "heading", "bullet", "ordered", "code", "quote", "todo")
+
+
+def build_children_body(block_type: str, content: str, level: int = 1) -> Optional[dict]:
+    """
+    构造创建子块的请求体
+
+    Args:
+        block_type: 块类型 (text, heading, bullet, ordered, code, quote, todo)
+        content: 内容
+        level: 标题级别 (仅用于 heading 类型)
+
+    Returns:
+        dict: 请求体，不支持的块类型返回 None
+    """
+    # 块类型映射
+    block_configs = {
+        "text": {
+            "block_type": 2,
+            "body": {"text": {"elements": [{"text_run": {"content": content}}]}}
+        },
+        "heading": {
+            "block_type": {1: 3, 2: 4, 3: 5}.get(level, 3),
+            "body_key": {1: "heading1", 2: "heading2", 3: "heading3"}.get(level, "heading1"),
+            "body": {"elements": [{"text_run": {"content": content}}]}
+        },
+        "bullet": {
+            "block_type": 8,
+            "body": {"bullet": {"elements": [{"text_run": {"content": content}}]}}
+        },
+        "ordered": {
+            "block_type": 7,
+            "body": {"orderedList": {"elements": [{"text_run": {"content": content}}]}}
+        },
+        "code": {
+            "block_type": 10,
+            "body": {"code": {"language": "python", "elements": [{"text_run": {"content": content}}]}}
+        },
+        "quote": {
+            "block_type": 12,
+            "body": {"quote": {"elements": [{"text_run": {"content": content}}]}}
+        },
+        "todo": {
+            "block_type": 13,
+            "body": {"todo": {"elements": [{"text_run": {"content": content}}], "checked": False}}
+        }
+    }
+
+    if block_type not in block_configs:
+        return None
+
+    config = block_configs[block_type]
+    body = {"index": -1, "children": []}
+
+    if block_type == "heading":
+        body["children"].append({
+            "block_type": config["block_type"],
+            config["body_key"]: config["body"]
+        })
+    else:
+        body["children"].append({
+            "block_type": config["block_type"],
+            **config["body"]
+        })
+
+    return body
+
+
+def get_document_blocks_page(
+    client: lark.Client,
+    document_id: str,
+    page_size: int = 500,
+    page_token: str = None
+) -> Optional[dict]:
+    """
+    获取文档的一页块
+
+    Args:
+        client: 飞书客户端
+        document_id: 文档 ID
+        page_size: 分页大小，最大 500
+        page_token: 分页标记（首页不填）
+
+    Returns:
+        dict: 包含 items、has_more、page_token 的字典，失败返回 None
+    """
+    request_builder = ListDocumentBlockRequest.builder() \
+        .document_id(document_id) \
+        .page_size(page_size) \
+        .document_revision_id(-1)
+
+    if page_token:
+        request_builder.page_token(page_token)
+
+    request = request_builder.build()
+    response = retry.call_sdk(
+        lambda: client.docx.v1.document_block.list(request),
+        family=ratelimit.DOCX_READ
+    )
+
+    if not response.success():
+        print(f"❌ 获取文档块失败: {response.code} - {response.msg}")
+        if response.raw:
+            print(f"详细信息: {response.raw.content[:500]}")
+        return None
+
+    return json.loads(lark.JSON.marshal(response.data))
+
+
+def get_document_blocks_with_content(
+    client: lark.Client,
+    document_id: str,
+    page_size: int = 500
+) -> Optional[dict]:
+    """
+    获取文档所有块（自动翻页，后台预取下一页）
+
+    Args:
+        client: 飞书客户端
+        document_id: 文档 ID
+        page_size: 分页大小，最大 500
+
+    Returns:
+        dict: 包含文档块列表的字典，任一页失败返回 None
+    """
+    items = []
+    try:
+        for page in iter_pages(lambda page_token: get_document_blocks_page(client, document_id, page_size, page_token)):
+            items.extend(page.get("items") or [])
+    except PagingError:
+        return None
+
+    return {"items": items}
@@ -0,0 +1,116 @@
+"""
+飞书 CLI - lark.Client 复用
+
+按 (app_id, log_level, token_mode) 缓存已构建的 lark.Client，
+避免每次调用都重新构建 client、丢掉 SDK 内部的连接与 token 缓存。
+
+token_mode:
+    shared  SDK 的 tenant_access_token 由 feishu_cli.auth 提供
+            （与 REST 脚本共用内存缓存、磁盘缓存与 single-flight 刷新）
+    sdk     使用 SDK 自带的进程内缓存
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+import lark_oapi as lark
+from lark_oapi.core.cache import ICache, LocalCache
+
+from .auth import get_token_provider
+
+
+TOKEN_MODE_SHARED = "shared"
+TOKEN_MODE_SDK = "sdk"
+
+# SDK TokenManager 中自建应用 tenant_access_token 的缓存 key 前缀
+_TENANT_TOKEN_KEY_PREFIX = "self_tenant_token:"
+# SDK 写入缓存的过期时间已提前 10 分钟（TokenManager 中的 "提前10分钟过期"）
+_SDK_EXPIRE_MARGIN = 10 * 60
+
+
+class SharedTokenCache(ICache):
+    """
+    SDK 缓存适配器：shared 模式的 app_id 的 tenant token 交给 TokenProvider，
+    其余 key（app_access_token、sdk 模式的 app 等）仍使用 SDK 默认的 LocalCache
+    """
+
+    def __init__(self):
+        self._fallback = LocalCache.instance()
+        self._secrets: Dict[str, str] = {}
+
+    def register(self, app_id: str, app_secret: str):
+        """登记使用 shared 模式的应用"""
+        self._secrets[app_id] = app_secret
+
+    def _shared_app_id(self, key: str) -> Optional[str]:
+        if not key.startswith(_TENANT_TOKEN_KEY_PREFIX):
+            return None
+        app_id = key[len(_TENANT_TOKEN_KEY_PREFIX):]
+        return app_id if app_id in self._secrets else None
+
+    def get(self, key: str) -> Optional[str]:
+        app_id = self._shared_app_id(key)
+        if app_id is None:
+            return self._fallback.get(key)
+        return get_token_provider().get(app_id, self._secrets[app_id])
+
+    def set(self, key: str, value: str, expire: int):
+        app_id = self._shared_app_id(key)
+        if app_id is None:
+            self._fallback.set(key, value, expire)
+            return
+        # 还原真实的过期时间，TokenProvider 会再按自己的 refresh_margin 提前刷新，避免两次扣减
+        get_token_provider().remember(app_id, value, expire + _SDK_EXPIRE_MARGIN)
+
+
+_shared_cache = SharedTokenCache()
+_clients: Dict[Tuple[str, lark.LogLevel, str], Tuple[str, lark.Client]] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(
+    app_id: str,
+    app_secret: str,
+    log_level: lark.LogLevel = lark.LogLevel.INFO,
+    token_mode: str = TOKEN_MODE_SHARED
+) -> lark.Client:
+    """
+    获取共享的 lark.Client，首次调用时构建
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        log_level: SDK 日志级别
+        token_mode: shared 或 sdk
+
+    Returns:
+        lark.Client: 可复用的客户端
+    """
+    if token_mode not in (TOKEN_MODE_SHARED, TOKEN_MODE_SDK):
+        raise ValueError(f"不支持的 token_mode: {token_mode}")
+
+    key = (app_id, log_level, token_mode)
+    with _clients_lock:
+        entry = _clients.get(key)
+        if entry and entry[0] == app_secret:
+            return entry[1]
+
+        builder = lark.Client.builder() \
+            .app_id(app_id) \
+            .app_secret(app_secret) \
+            .log_level(log_level)
+
+        if token_mode == TOKEN_MODE_SHARED:
+            _shared_cache.register(app_id, app_secret)
+        # SDK 的 token 缓存是全局的，统一挂上适配器；sdk 模式的应用会落到默认缓存
+        builder.cache(_shared_cache)
+
+        client = builder.build()
+        _clients[key] = (app_secret, client)
+        return client
+
+
+def clear_clients():
+    """清空已缓存的 client"""
+    with _clients_lock:
+        _clients.clear()
@@ -4,5 +4,6 @@
 
 from . import drive
 from . import doc
+from . import wiki
 
-__all__ = ['drive', 'doc']
+__all__ = ['drive', 'doc', 'wiki']
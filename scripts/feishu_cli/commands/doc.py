@@ -8,14 +8,18 @@ from typing import Optional
 import lark_oapi as lark
 from lark_oapi.api.docx.v1 import *
 
+from .. import ratelimit, retry
+from ..client import get_client
 from ..config import get_config
+from . import drive
 
 
 def create_document(
     app_id: str,
     app_secret: str,
     title: str,
-    folder_token: Optional[str] = None
+    folder_token: Optional[str] = None,
+    client: Optional[lark.Client] = None
 ) -> Optional[dict]:
     """
     创建飞书文档
@@ -25,15 +29,12 @@ def create_document(
         app_secret: 应用密钥
         title: 文档标题
         folder_token: 文件夹 token
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
 
     Returns:
         dict: 创建的文档信息
     """
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    client = client or get_client(app_id, app_secret)
 
     body_builder = CreateDocumentRequestBody.builder().title(title)
 
@@ -41,7 +42,11 @@ def create_document(
         body_builder.folder_token(folder_token)
 
     request = CreateDocumentRequest.builder().request_body(body_builder.build()).build()
-    response: CreateDocumentResponse = client.docx.v1.document.create(request)
+    response: CreateDocumentResponse = retry.call_sdk(
+        lambda: client.docx.v1.document.create(request),
+        idempotent=False,
+        family=ratelimit.DOCX_WRITE
+    )
 
     if not response.success():
         print(f"❌ 创建失败: {response.msg}")
@@ -57,11 +62,15 @@ def cmd_create(args):
     if not config.validate_credentials():
         return 1
 
+    folder_token = drive.resolve_arg(config, args.folder_token)
+    if folder_token == "":
+        return 1
+
     result = create_document(
         app_id=config.app_id,
         app_secret=config.app_secret,
         title=args.title,
-        folder_token=args.folder_token
+        folder_token=folder_token
     )
 
     if result:
@@ -86,5 +95,5 @@ def build_parser(subparsers):
     # create 命令
     create_parser = doc_subparsers.add_parser('create', help='创建文档')
     create_parser.add_argument('title', help='文档标题')
-    create_parser.add_argument('--folder-token', '-f', help='文件夹 token')
+    create_parser.add_argument('--folder-token', '-f', help='文件夹 token 或路径（如 /Team/Specs）')
     create_parser.set_defaults(func=cmd_create)
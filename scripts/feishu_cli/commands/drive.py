@@ -3,15 +3,23 @@
 """
 
 import argparse
+import contextlib
 import json
+import os
 import sys
 from typing import Optional
 
 # 这里使用 lark_oapi SDK
 import lark_oapi as lark
+import requests
 from lark_oapi.api.drive.v1 import *
 
+from .. import ratelimit, retry
+from ..client import get_client
 from ..config import get_config
+from ..meta_cache import get_meta_cache
+from ..paging import PagingError, iter_pages
+from ..path_index import get_path_index, get_root_folder_token
 
 
 def list_files(
@@ -20,10 +28,12 @@ def list_files(
     parent_token: Optional[str] = None,
     order_by: str = "EditedTime",
     direction: str = "DESC",
-    page_size: int = 50
+    page_size: int = 50,
+    client: Optional[lark.Client] = None,
+    page_token: Optional[str] = None
 ) -> Optional[dict]:
     """
-    获取文件夹中的文件清单
+    获取文件夹中的文件清单（单页）
 
     Args:
         app_id: 应用 ID
@@ -31,16 +41,14 @@ def list_files(
         parent_token: 父文件夹 token
         order_by: 排序字段
         direction: 排序方向
-        page_size: 每页数量
+        page_size: 每页数量，最大 200
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+        page_token: 分页标记（首页不填）
 
     Returns:
-        dict: 文件列表数据
+        dict: 文件列表数据，包含 files、has_more、next_page_token
     """
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    client = client or get_client(app_id, app_secret)
 
     request_builder = ListFileRequest.builder() \
         .order_by(order_by) \
@@ -48,10 +56,15 @@ def list_files(
         .page_size(page_size)
 
     if parent_token:
-        request_builder.parent_token(parent_token)
+        request_builder.folder_token(parent_token)
+    if page_token:
+        request_builder.page_token(page_token)
 
     request = request_builder.build()
-    response: ListFileResponse = client.drive.v1.file.list(request)
+    response: ListFileResponse = retry.call_sdk(
+        lambda: client.drive.v1.file.list(request),
+        family=ratelimit.DRIVE_LIST
+    )
 
     if not response.success():
         print(f"❌ 获取失败: {response.msg}")
@@ -60,11 +73,62 @@ def list_files(
     return response.data
 
 
+def iter_files(
+    app_id: str,
+    app_secret: str,
+    parent_token: Optional[str] = None,
+    order_by: str = "EditedTime",
+    direction: str = "DESC",
+    page_size: int = 200,
+    limit: int = 0,
+    prefetch: int = 1,
+    client: Optional[lark.Client] = None
+):
+    """
+    逐页遍历文件夹中的全部文件
+
+    调用方处理当前页时，后续页面已在后台请求；达到 limit 后立即停止翻页。
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        parent_token: 父文件夹 token
+        order_by: 排序字段
+        direction: 排序方向
+        page_size: 每页数量，最大 200
+        limit: 最多返回的文件数，0 表示不限
+        prefetch: 预取页数，0 表示不预取
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Yields:
+        File: 文件 / 文件夹
+
+    Raises:
+        PagingError: 某一页获取失败
+    """
+    client = client or get_client(app_id, app_secret)
+    if limit:
+        page_size = min(page_size, limit)
+
+    def fetch(page_token):
+        return list_files(app_id, app_secret, parent_token, order_by, direction, page_size,
+                          client=client, page_token=page_token)
+
+    count = 0
+    for page in iter_pages(fetch, prefetch=prefetch):
+        for item in page.files or []:
+            yield item
+            count += 1
+            if limit and count >= limit:
+                return
+
+
 def create_folder(
     app_id: str,
     app_secret: str,
     folder_name: str,
-    parent_token: Optional[str] = None
+    parent_token: Optional[str] = None,
+    client: Optional[lark.Client] = None
 ) -> Optional[dict]:
     """
     创建文件夹
@@ -73,20 +137,17 @@ def create_folder(
         app_id: 应用 ID
         app_secret: 应用密钥
         folder_name: 文件夹名称
-        parent_token: 父文件夹 token
+        parent_token: 父文件夹 token（可选，不填则在应用云空间根目录创建）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
 
     Returns:
         dict: 创建的文件夹信息
     """
-    # 根目录 token（如未指定 parent_token）
-    ROOT_FOLDER_TOKEN = "nodcnepxRXKIeBfFFprTKnXa6Rf"
-    target_token = parent_token if parent_token else ROOT_FOLDER_TOKEN
-
-    client = lark.Client.builder() \
-        .app_id(app_id) \
-        .app_secret(app_secret) \
-        .log_level(lark.LogLevel.INFO) \
-        .build()
+    target_token = parent_token or get_root_folder_token(app_id, app_secret)
+    if not target_token:
+        return None
+
+    client = client or get_client(app_id, app_secret)
 
     request = CreateFolderFileRequest.builder() \
         .request_body(CreateFolderFileRequestBody.builder()
@@ -95,7 +156,10 @@ def create_folder(
             .build()) \
         .build()
 
-    response: CreateFolderFileResponse = client.drive.v1.file.create_folder(request)
+    response: CreateFolderFileResponse = retry.call_sdk(
+        lambda: client.drive.v1.file.create_folder(request),
+        idempotent=False
+    )
 
     if not response.success():
         print(f"❌ 创建失败: {response.msg}")
@@ -104,6 +168,59 @@ def create_folder(
     return response.data
 
 
+def delete_file(
+    app_id: str,
+    app_secret: str,
+    file_token: str,
+    file_type: str = "file",
+    client: Optional[lark.Client] = None
+) -> bool:
+    """
+    删除文件或文件夹（移入回收站）
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        file_token: 文件 token
+        file_type: 文件类型，如 file、docx、folder
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Returns:
+        bool: 是否成功
+    """
+    client = client or get_client(app_id, app_secret)
+
+    request = DeleteFileRequest.builder() \
+        .file_token(file_token) \
+        .type(file_type) \
+        .build()
+
+    response: DeleteFileResponse = retry.call_sdk(
+        lambda: client.drive.v1.file.delete(request)
+    )
+
+    if not response.success():
+        print(f"❌ 删除失败: {response.msg} (code: {response.code})")
+        return False
+
+    return True
+
+
+def resolve_arg(config, value: Optional[str]) -> Optional[str]:
+    """
+    接受 token 的命令行参数也可以写成以 / 开头的云空间路径
+
+    Returns:
+        str: token（未填写时原样返回 None）；路径无法解析时返回空字符串
+    """
+    # paths 模块依赖本模块的 create_folder / iter_files，在此处导入以避免循环导入
+    from ..paths import resolve_token
+
+    if not value:
+        return value
+    return resolve_token(config.app_id, config.app_secret, value) or ""
+
+
 def cmd_list(args):
     """处理 list 命令"""
     config = get_config()
@@ -111,26 +228,380 @@ def cmd_list(args):
     if not config.validate_credentials():
         return 1
 
-    result = list_files(
+    parent_token = resolve_arg(config, args.parent_token)
+    if parent_token == "":
+        return 1
+
+    items = iter_files(
         app_id=config.app_id,
         app_secret=config.app_secret,
-        parent_token=args.parent_token,
+        parent_token=parent_token,
         order_by=args.order_by,
         direction=args.direction,
-        page_size=args.limit
+        limit=args.limit,
+        prefetch=args.prefetch
+    )
+
+    ndjson = args.format == 'ndjson'
+    out = sys.stdout
+    count = 0
+    cache = get_meta_cache()
+    index = get_path_index()
+    seen = []
+    # ndjson 模式下 stdout 只输出数据行，提示信息转到 stderr
+    with contextlib.redirect_stdout(sys.stderr) if ndjson else contextlib.nullcontext():
+        try:
+            for item in items:
+                count += 1
+                if cache:
+                    cache.observe([item])
+                seen.append(item)
+                if len(seen) >= 200:
+                    index.observe(seen)
+                    seen = []
+                if ndjson:
+                    print(lark.JSON.marshal(item), file=out, flush=True)
+                    continue
+                name = item.name if hasattr(item, 'name') else '未命名'
+                token = item.token if hasattr(item, 'token') else 'N/A'
+                file_type = "📁 文件夹" if hasattr(item, 'type') and item.type == 'folder' else "📄 文件"
+                print(f"  {file_type} {name}")
+                print(f"    Token: {token[:30]}...")
+        except PagingError:
+            print(f"❌ 获取失败（已输出 {count} 个）", file=sys.stderr)
+            return 1
+        finally:
+            index.observe(seen)
+
+    if count == 0:
+        print("❌ 获取失败或文件夹为空", file=sys.stderr)
+        return 1
+    if not ndjson:
+        print(f"\n✅ 共 {count} 个文件/文件夹")
+    return 0
+
+
+def cmd_walk(args):
+    """处理 walk 命令"""
+    # walk 模块依赖本模块的 list_files，在此处导入以避免循环导入
+    from ..walk import walk_folder
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    root_token = resolve_arg(config, args.token)
+    if root_token == "":
+        return 1
+
+    entries = walk_folder(
+        app_id=config.app_id,
+        app_secret=config.app_secret,
+        root_token=root_token,
+        max_depth=args.max_depth,
+        types=args.type,
+        concurrency=args.concurrency,
+        checkpoint=args.checkpoint
     )
 
-    if result and result.files:
-        print(f"✅ 找到 {len(result.files)} 个文件/文件夹:\n")
-        for item in result.files[:args.limit]:
-            name = item.name if hasattr(item, 'name') else '未命名'
-            token = item.token if hasattr(item, 'token') else 'N/A'
-            file_type = "📁 文件夹" if hasattr(item, 'type') and item.type == 'folder' else "📄 文件"
-            print(f"  {file_type} {name}")
-            print(f"    Token: {token[:30]}...")
+    ndjson = args.format == 'ndjson'
+    out = sys.stdout
+    count = 0
+    cache = get_meta_cache()
+    index = get_path_index()
+    seen = []
+    with contextlib.redirect_stdout(sys.stderr) if ndjson else contextlib.nullcontext():
+        try:
+            for entry in entries:
+                count += 1
+                if cache:
+                    cache.observe([entry])
+                seen.append(entry)
+                if len(seen) >= 200:
+                    index.observe(seen)
+                    seen = []
+                if ndjson:
+                    print(json.dumps(entry, ensure_ascii=False), file=out, flush=True)
+                    continue
+                icon = "📁" if entry["type"] == 'folder' else "📄"
+                print(f"  {icon} {entry['path']}")
+        except PagingError as e:
+            hint = "，可使用相同的 --checkpoint 重新运行以继续" if args.checkpoint else ""
+            print(f"❌ {e}（已输出 {count} 个）{hint}", file=sys.stderr)
+            return 1
+        finally:
+            index.observe(seen)
+
+    if not ndjson:
+        print(f"\n✅ 共 {count} 个文件/文件夹")
+    return 0
+
+
+def cmd_meta(args):
+    """处理 meta 命令"""
+    from ..meta import batch_query_meta, meta_to_dict, read_doc_list
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    if args.file and args.file != '-':
+        try:
+            with open(args.file, 'r', encoding='utf-8') as f:
+                docs = read_doc_list(f, args.type)
+        except IOError as e:
+            print(f"❌ 读取失败: {e}", file=sys.stderr)
+            return 1
+    else:
+        docs = read_doc_list(sys.stdin, args.type)
+
+    if not docs:
+        print("❌ 没有输入 token", file=sys.stderr)
+        return 1
+
+    cache = None if args.no_cache else get_meta_cache()
+    with contextlib.redirect_stdout(sys.stderr):
+        result = batch_query_meta(
+            app_id=config.app_id,
+            app_secret=config.app_secret,
+            docs=docs,
+            concurrency=args.concurrency,
+            with_url=args.with_url,
+            cache=cache
+        )
+
+    for meta in result.metas:
+        print(json.dumps(meta_to_dict(meta), ensure_ascii=False))
+    for failed in result.failed_list:
+        print(f"⚠️  获取失败: token={failed.token}, code={failed.code}", file=sys.stderr)
+
+    print(f"✅ 成功 {len(result.metas)} 个，失败 {len(result.failed_list)} 个", file=sys.stderr)
+    if cache:
+        stats = cache.stats()
+        print(f"   缓存命中 {stats['hits']}/{stats['hits'] + stats['misses']}（{stats['hit_rate']:.1%}）",
+              file=sys.stderr)
+    return 1 if result.failed_list else 0
+
+
+def cmd_stats(args):
+    """处理 stats 命令"""
+    from ..meta import read_doc_list
+    from ..statistics import collect_statistics, write_rows
+    from ..walk import walk_folder
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    if args.folder:
+        folder_token = resolve_arg(config, args.folder)
+        if not folder_token:
+            return 1
+        docs = ((entry["token"], entry["type"]) for entry in walk_folder(
+            app_id=config.app_id,
+            app_secret=config.app_secret,
+            root_token=folder_token,
+            max_depth=args.max_depth,
+            concurrency=args.walk_concurrency
+        ))
+    elif args.file and args.file != '-':
+        try:
+            with open(args.file, 'r', encoding='utf-8') as f:
+                docs = read_doc_list(f, args.type)
+        except IOError as e:
+            print(f"❌ 读取失败: {e}", file=sys.stderr)
+            return 1
+    else:
+        docs = read_doc_list(sys.stdin, args.type)
+
+    failed = []
+    count = 0
+
+    def counted(rows):
+        nonlocal count
+        for row in rows:
+            yield row
+            count += 1
+
+    try:
+        out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    except IOError as e:
+        print(f"❌ 无法写入输出文件: {e}", file=sys.stderr)
+        return 1
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            rows = collect_statistics(
+                app_id=config.app_id,
+                app_secret=config.app_secret,
+                docs=docs,
+                concurrency=args.concurrency,
+                failed=failed
+            )
+            write_rows(counted(rows), out, args.format)
+    except (PagingError, requests.RequestException) as e:
+        print(f"❌ {e}（已采集 {count} 个）", file=sys.stderr)
+        return 1
+    finally:
+        if args.output:
+            out.close()
+
+    for token, doc_type, code in failed:
+        print(f"⚠️  获取失败: token={token}, type={doc_type}, code={code}", file=sys.stderr)
+    print(f"✅ 采集 {count} 个文件，失败 {len(failed)} 个", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_upload(args):
+    """处理 upload 命令"""
+    from ..upload import upload_media
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    result = upload_media(
+        app_id=config.app_id,
+        app_secret=config.app_secret,
+        file_path=args.file,
+        parent_type=args.parent_type,
+        parent_node=args.parent_node,
+        file_name=args.name,
+        concurrency=args.concurrency,
+        resume=not args.no_resume
+    )
+
+    if result:
+        print(f"✅ 上传成功！")
+        print(f"  File Token: {result.file_token}")
         return 0
     else:
-        print("❌ 获取失败或文件夹为空")
+        print("❌ 上传失败")
+        return 1
+
+
+def cmd_upload_dir(args):
+    """处理 upload-dir 命令"""
+    from ..upload_dir import upload_dir
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    if not os.path.isdir(args.local_dir):
+        print(f"❌ 目录不存在: {args.local_dir}", file=sys.stderr)
+        return 1
+
+    results = []
+    out = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        for result in upload_dir(
+            app_id=config.app_id,
+            app_secret=config.app_secret,
+            local_dir=args.local_dir,
+            parent_type=args.parent_type,
+            parent_node=args.parent_node,
+            recursive=args.recursive,
+            pattern=args.pattern,
+            concurrency=args.concurrency,
+            dedupe_scope=args.dedupe_scope
+        ):
+            results.append(result)
+            print(json.dumps(result, ensure_ascii=False), file=out, flush=True)
+
+    if args.manifest:
+        with open(args.manifest, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    counts = {status: sum(1 for r in results if r["status"] == status)
+              for status in ("uploaded", "cached", "failed")}
+    print(f"✅ 上传 {counts['uploaded']} 个，复用 {counts['cached']} 个，失败 {counts['failed']} 个",
+          file=sys.stderr)
+    return 1 if counts["failed"] else 0
+
+
+def cmd_sync(args):
+    """处理 sync 命令"""
+    from ..sync import OP_DELETE, OP_MKDIR, OP_UPDATE, sync
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    if not os.path.isdir(args.local_dir):
+        print(f"❌ 目录不存在: {args.local_dir}", file=sys.stderr)
+        return 1
+
+    folder_token = resolve_arg(config, args.folder)
+    if not folder_token:
+        return 1
+
+    ndjson = args.format == 'ndjson'
+    out = sys.stdout
+    labels = {OP_MKDIR: "📁 新建", OP_UPDATE: "~ 更新", OP_DELETE: "- 删除"}
+    counts = {}
+    with contextlib.redirect_stdout(sys.stderr) if ndjson else contextlib.nullcontext():
+        try:
+            for result in sync(
+                app_id=config.app_id,
+                app_secret=config.app_secret,
+                local_dir=args.local_dir,
+                folder_token=folder_token,
+                delete=args.delete,
+                concurrency=args.concurrency,
+                dry_run=args.dry_run,
+                adopt=not args.no_adopt
+            ):
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+                if ndjson:
+                    print(json.dumps(result, ensure_ascii=False), file=out, flush=True)
+                    continue
+                mark = "❌ " if result["status"] == "failed" else ""
+                print(f"  {mark}{labels.get(result['op'], '+ 上传')} {result['path']}")
+        except PagingError as e:
+            print(f"❌ 获取远端文件列表失败: {e}", file=sys.stderr)
+            return 1
+
+    if args.dry_run:
+        print(f"📝 计划 {counts.get('planned', 0)} 个操作（--dry-run，未做任何修改）", file=sys.stderr)
+        return 0
+    print(f"✅ 完成 {counts.get('done', 0)} 个操作，失败 {counts.get('failed', 0)} 个", file=sys.stderr)
+    return 1 if counts.get('failed') else 0
+
+
+def cmd_download(args):
+    """处理 download 命令"""
+    from ..download import download
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    file_token = resolve_arg(config, args.file_token)
+    if not file_token:
+        return 1
+
+    result = download(
+        app_id=config.app_id,
+        app_secret=config.app_secret,
+        file_token=file_token,
+        output=args.output,
+        kind=args.kind,
+        segments=args.segments,
+        resume=not args.no_resume
+    )
+
+    if result:
+        print(f"✅ 下载完成: {result} ({os.path.getsize(result)} 字节)")
+        return 0
+    else:
+        print("❌ 下载失败，重新运行同一命令可从中断处继续")
         return 1
 
 
@@ -141,11 +612,15 @@ def cmd_create_folder(args):
     if not config.validate_credentials():
         return 1
 
+    parent_token = resolve_arg(config, args.parent_token)
+    if parent_token == "":
+        return 1
+
     result = create_folder(
         app_id=config.app_id,
         app_secret=config.app_secret,
         folder_name=args.name,
-        parent_token=args.parent_token
+        parent_token=parent_token
     )
 
     if result:
@@ -159,6 +634,32 @@ def cmd_create_folder(args):
         return 1
 
 
+def cmd_mkdir(args):
+    """处理 mkdir 命令"""
+    # paths 模块依赖本模块的 create_folder / iter_files，在此处导入以避免循环导入
+    from ..paths import make_folders
+
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    token = make_folders(
+        app_id=config.app_id,
+        app_secret=config.app_secret,
+        path=args.path,
+        parents=args.parents
+    )
+
+    if token:
+        print(f"✅ {args.path}")
+        print(f"  Token: {token}")
+        return 0
+    else:
+        print("❌ 文件夹创建失败")
+        return 1
+
+
 def build_parser(subparsers):
     """构建云空间命令的子解析器"""
     drive_parser = subparsers.add_parser('drive', help='云空间操作')
@@ -168,7 +669,7 @@ def build_parser(subparsers):
 
     # list 命令
     list_parser = drive_subparsers.add_parser('list', help='获取文件列表')
-    list_parser.add_argument('--parent-token', '-p', help='父文件夹 token')
+    list_parser.add_argument('--parent-token', '-p', help='父文件夹 token 或路径（如 /Team/Specs）')
     list_parser.add_argument('--order-by', '-o', default='EditedTime',
                             choices=['CreatedTime', 'EditedTime', 'ModifiedTime', 'Size'],
                             help='排序字段')
@@ -176,11 +677,127 @@ def build_parser(subparsers):
                             choices=['ASC', 'DESC'],
                             help='排序方向')
     list_parser.add_argument('--limit', '-l', type=int, default=20,
-                            help='显示数量')
+                            help='显示数量，0 表示全部（达到数量后停止翻页）')
+    list_parser.add_argument('--prefetch', type=int, default=1,
+                            help='后台预取的页数，0 表示不预取')
+    list_parser.add_argument('--format', '-F', default='text',
+                            choices=['text', 'ndjson'],
+                            help='输出格式，ndjson 每行一个文件，边获取边输出')
     list_parser.set_defaults(func=cmd_list)
 
+    # walk 命令
+    walk_parser = drive_subparsers.add_parser('walk', help='递归遍历文件夹')
+    walk_parser.add_argument('token', nargs='?', help='根文件夹 token 或路径，不填则从根目录开始')
+    walk_parser.add_argument('--max-depth', type=int, help='最大深度，1 表示只列直接子项')
+    walk_parser.add_argument('--type', '-t', action='append',
+                            help='只输出指定类型（可重复，如 -t docx -t sheet），不影响向下遍历')
+    walk_parser.add_argument('--concurrency', '-c', type=int, default=4,
+                            help='并发请求数')
+    walk_parser.add_argument('--checkpoint', help='checkpoint 文件，中断后以相同参数重新运行可继续')
+    walk_parser.add_argument('--format', '-F', default='text',
+                            choices=['text', 'ndjson'],
+                            help='输出格式，ndjson 每行一个条目，边遍历边输出')
+    walk_parser.set_defaults(func=cmd_walk)
+
+    # meta 命令
+    meta_parser = drive_subparsers.add_parser('meta', help='批量获取文件元数据')
+    meta_parser.add_argument('file', nargs='?',
+                            help='token 列表文件，每行 "token" 或 "token type"；不填或 - 表示从 stdin 读取')
+    meta_parser.add_argument('--type', '-t', default='docx',
+                            help='未写类型的行使用的文件类型')
+    meta_parser.add_argument('--concurrency', '-c', type=int, default=4,
+                            help='并发请求数（每个请求最多 200 个 token）')
+    meta_parser.add_argument('--with-url', action='store_true', help='同时返回文档链接')
+    meta_parser.add_argument('--no-cache', action='store_true', help='不使用本地元数据缓存')
+    meta_parser.set_defaults(func=cmd_meta)
+
+    # stats 命令
+    stats_parser = drive_subparsers.add_parser('stats', help='批量采集文件统计信息（uv/pv/点赞）')
+    stats_parser.add_argument('file', nargs='?',
+                             help='token 列表文件，每行 "token" 或 "token type"；不填或 - 表示从 stdin 读取')
+    stats_parser.add_argument('--folder', help='改为采集该文件夹（token 或路径）树下的全部文档')
+    stats_parser.add_argument('--max-depth', type=int, help='与 --folder 一起使用，最大遍历深度')
+    stats_parser.add_argument('--type', '-t', default='docx',
+                             help='未写类型的行使用的文件类型')
+    stats_parser.add_argument('--concurrency', '-c', type=int, default=8,
+                             help='并发请求数（仍受 rate_limit_file_statistics 限速）')
+    stats_parser.add_argument('--walk-concurrency', type=int, default=4,
+                             help='与 --folder 一起使用，遍历文件夹时的并发请求数')
+    stats_parser.add_argument('--format', '-F', default='csv',
+                             choices=['csv', 'ndjson'],
+                             help='输出格式')
+    stats_parser.add_argument('--output', '-o', help='输出文件，默认 stdout')
+    stats_parser.set_defaults(func=cmd_stats)
+
+    # upload 命令
+    upload_parser = drive_subparsers.add_parser('upload', help='上传素材（超过 20MB 自动分片并发上传）')
+    upload_parser.add_argument('file', help='本地文件路径')
+    upload_parser.add_argument('--parent-type', required=True,
+                              choices=['docx_image', 'docx_file', 'doc_image', 'doc_file',
+                                       'sheet_image', 'sheet_file', 'bitable_image', 'bitable_file'],
+                              help='上传点类型')
+    upload_parser.add_argument('--parent-node', required=True,
+                              help='上传点 token（文档块 block_id、spreadsheet_token 或 app_token）')
+    upload_parser.add_argument('--name', help='文件名，默认使用本地文件名')
+    upload_parser.add_argument('--concurrency', '-c', type=int, default=4,
+                              help='分片上传时同时上传的分片数')
+    upload_parser.add_argument('--no-resume', action='store_true',
+                              help='不续传：忽略已有的上传清单，重新上传全部分片')
+    upload_parser.set_defaults(func=cmd_upload)
+
+    # upload-dir 命令
+    upload_dir_parser = drive_subparsers.add_parser('upload-dir', help='并发上传目录中的文件（按内容去重）')
+    upload_dir_parser.add_argument('local_dir', help='本地目录')
+    upload_dir_parser.add_argument('--parent-type', required=True,
+                                  choices=['docx_image', 'docx_file', 'doc_image', 'doc_file',
+                                           'sheet_image', 'sheet_file', 'bitable_image', 'bitable_file'],
+                                  help='上传点类型')
+    upload_dir_parser.add_argument('--parent-node', required=True, help='上传点 token')
+    upload_dir_parser.add_argument('--recursive', '-r', action='store_true', help='包含子目录')
+    upload_dir_parser.add_argument('--pattern', default='*', help='文件名匹配模式，如 "*.png"')
+    upload_dir_parser.add_argument('--concurrency', '-c', type=int, default=4,
+                                  help='同时上传的文件数')
+    upload_dir_parser.add_argument('--dedupe-scope', default='node', choices=['node', 'type'],
+                                  help='file_token 复用范围：同一上传点（node）或同一上传点类型（type）')
+    upload_dir_parser.add_argument('--manifest', help='把全部结果写入该 JSON 文件')
+    upload_dir_parser.set_defaults(func=cmd_upload_dir)
+
+    # sync 命令
+    sync_parser = drive_subparsers.add_parser('sync', help='把本地目录同步到云空间文件夹（只传输有变化的文件）')
+    sync_parser.add_argument('local_dir', help='本地目录')
+    sync_parser.add_argument('folder', help='目标文件夹 token 或路径')
+    sync_parser.add_argument('--delete', action='store_true',
+                            help='删除远端存在、本地已不存在的文件（只删除 file 类型）')
+    sync_parser.add_argument('--dry-run', '-n', action='store_true', help='只打印计划的操作，不做修改')
+    sync_parser.add_argument('--no-adopt', action='store_true',
+                            help='首次同步时不纳入远端已有的同名同大小文件，全部重新上传')
+    sync_parser.add_argument('--concurrency', '-c', type=int, default=4,
+                            help='同时传输的文件数')
+    sync_parser.add_argument('--format', '-F', default='text',
+                            choices=['text', 'ndjson'],
+                            help='输出格式，ndjson 每行一个操作结果')
+    sync_parser.set_defaults(func=cmd_sync)
+
+    # download 命令
+    download_parser = drive_subparsers.add_parser('download', help='下载文件或素材（分段并发、可续传）')
+    download_parser.add_argument('file_token', help='文件或素材 token，云空间文件也可写路径')
+    download_parser.add_argument('--output', '-o', help='输出文件或目录，默认当前目录下的原文件名')
+    download_parser.add_argument('--kind', default='file', choices=['file', 'media'],
+                                help='file 为云空间文件，media 为文档中的素材')
+    download_parser.add_argument('--segments', '-s', type=int, default=4,
+                                help='并发分段数')
+    download_parser.add_argument('--no-resume', action='store_true', help='忽略已下载的部分，重新下载')
+    download_parser.set_defaults(func=cmd_download)
+
     # create-folder 命令
     create_folder_parser = drive_subparsers.add_parser('create-folder', help='创建文件夹')
     create_folder_parser.add_argument('name', help='文件夹名称')
-    create_folder_parser.add_argument('--parent-token', '-p', help='父文件夹 token')
+    create_folder_parser.add_argument('--parent-token', '-p', help='父文件夹 token 或路径')
     create_folder_parser.set_defaults(func=cmd_create_folder)
+
+    # mkdir 命令
+    mkdir_parser = drive_subparsers.add_parser('mkdir', help='按路径创建文件夹（已存在的层级直接复用）')
+    mkdir_parser.add_argument('path', help='从应用云空间根目录开始的路径，如 /Reports/2026/Q4')
+    mkdir_parser.add_argument('--parents', '-p', action='store_true',
+                             help='同时创建缺失的中间层级')
+    mkdir_parser.set_defaults(func=cmd_mkdir)
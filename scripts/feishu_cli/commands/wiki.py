@@ -0,0 +1,204 @@
+"""
+飞书 CLI - 知识库命令模块
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+
+from ..config import get_config
+from ..paging import PagingError
+from ..wiki_cache import get_wiki_node_cache
+from ..wiki_crawl import crawl_space
+from ..wiki_export import FORMAT_MARKDOWN, FORMATS, export_space
+from ..wiki_nodes import resolve_node, resolve_nodes
+
+
+def node_to_dict(node) -> dict:
+    """节点中常用的字段"""
+    return {
+        "node_token": node.node_token,
+        "obj_token": node.obj_token,
+        "obj_type": node.obj_type,
+        "space_id": node.space_id,
+        "title": node.title,
+        "parent_node_token": node.parent_node_token,
+        "has_child": node.has_child,
+        "obj_edit_time": node.obj_edit_time,
+    }
+
+
+def read_token_list(lines) -> list:
+    """每行一个节点 token 或知识库链接，忽略空行与 # 开头的注释"""
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+
+def cmd_resolve(args):
+    """处理 resolve 命令"""
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    tokens = args.tokens or read_token_list(sys.stdin)
+    if not tokens:
+        print("❌ 没有输入 token", file=sys.stderr)
+        return 1
+
+    cache = None if args.no_cache else get_wiki_node_cache()
+    failed = []
+    with contextlib.redirect_stdout(sys.stderr):
+        nodes = resolve_nodes(
+            app_id=config.app_id,
+            app_secret=config.app_secret,
+            node_tokens=tokens,
+            concurrency=args.concurrency,
+            cache=cache,
+            failed=failed
+        )
+
+    for node in nodes.values():
+        print(json.dumps(node_to_dict(node), ensure_ascii=False))
+    for token, code in failed:
+        print(f"⚠️  获取失败: token={token}, code={code}", file=sys.stderr)
+
+    print(f"✅ 成功 {len(nodes)} 个，失败 {len(failed)} 个", file=sys.stderr)
+    if cache:
+        total = cache.hits + cache.misses
+        print(f"   缓存命中 {cache.hits}/{total}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def resolve_space(config, value: str):
+    """
+    知识空间参数：纯数字视为 space_id；否则视为节点 token / 链接，返回其所在空间与该节点
+
+    Returns:
+        tuple: (space_id, root_node_token)，节点解析失败时返回 (None, None)
+    """
+    if value.isdigit():
+        return value, None
+    node = resolve_node(config.app_id, config.app_secret, value, cache=get_wiki_node_cache())
+    if node is None:
+        return None, None
+    return node.space_id, node.node_token
+
+
+def cmd_crawl(args):
+    """处理 crawl 命令"""
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    out = sys.stdout
+    count = 0
+    with contextlib.redirect_stdout(sys.stderr):
+        space_id, root_node_token = resolve_space(config, args.space)
+        if not space_id:
+            return 1
+        try:
+            for record in crawl_space(
+                app_id=config.app_id,
+                app_secret=config.app_secret,
+                space_id=space_id,
+                root_node_token=root_node_token,
+                max_depth=args.max_depth,
+                concurrency=args.concurrency,
+                checkpoint=args.checkpoint,
+                cache=get_wiki_node_cache()
+            ):
+                count += 1
+                print(json.dumps(record, ensure_ascii=False), file=out, flush=True)
+        except PagingError as e:
+            hint = "，可使用相同的 --checkpoint 重新运行以继续" if args.checkpoint else ""
+            print(f"❌ {e}（已输出 {count} 个）{hint}")
+            return 1
+
+        print(f"✅ 共 {count} 个节点")
+    return 0
+
+
+def cmd_export(args):
+    """处理 export 命令"""
+    config = get_config()
+
+    if not config.validate_credentials():
+        return 1
+
+    ndjson = args.format == 'ndjson'
+    out = sys.stdout
+    labels = {"exported": "+ 导出", "moved": "→ 移动", "deleted": "- 删除", "failed": "❌ 失败"}
+    counts = {}
+    with contextlib.redirect_stdout(sys.stderr) if ndjson else contextlib.nullcontext():
+        space_id, root_node_token = resolve_space(config, args.space)
+        if not space_id:
+            return 1
+        try:
+            for result in export_space(
+                app_id=config.app_id,
+                app_secret=config.app_secret,
+                space_id=space_id,
+                out_dir=args.out_dir,
+                root_node_token=root_node_token,
+                fmt=args.output,
+                concurrency=args.concurrency,
+                force=args.force,
+                delete=args.delete,
+                cache=get_wiki_node_cache()
+            ):
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+                if ndjson:
+                    print(json.dumps(result, ensure_ascii=False), file=out, flush=True)
+                elif result["status"] in labels:
+                    print(f"  {labels[result['status']]} {result['path']}")
+        except PagingError as e:
+            print(f"❌ {e}，已导出的节点已记录，重新运行时会跳过")
+            return 1
+
+        print(f"✅ 导出 {counts.get('exported', 0)} 个，跳过 {counts.get('skipped', 0)} 个未变化的节点，"
+              f"失败 {counts.get('failed', 0)} 个")
+    return 1 if counts.get('failed') else 0
+
+
+def build_parser(subparsers):
+    """构建知识库命令的子解析器"""
+    wiki_parser = subparsers.add_parser('wiki', help='知识库操作')
+
+    # 子命令
+    wiki_subparsers = wiki_parser.add_subparsers(dest='command', help='可用命令')
+
+    # resolve 命令
+    resolve_parser = wiki_subparsers.add_parser('resolve', help='批量解析知识库节点（节点 token → obj_token）')
+    resolve_parser.add_argument('tokens', nargs='*',
+                               help='节点 token 或知识库链接；不填时从 stdin 逐行读取')
+    resolve_parser.add_argument('--concurrency', '-c', type=int, default=8,
+                               help='并发请求数（仍受 rate_limit_wiki_read 限速）')
+    resolve_parser.add_argument('--no-cache', action='store_true', help='不使用本地节点缓存')
+    resolve_parser.set_defaults(func=cmd_resolve)
+
+    # crawl 命令
+    crawl_parser = wiki_subparsers.add_parser('crawl', help='遍历知识空间节点树（NDJSON 输出）')
+    crawl_parser.add_argument('space', help='知识空间 ID；也可以是节点 token 或链接，从该节点向下遍历')
+    crawl_parser.add_argument('--max-depth', type=int, help='最大深度，1 表示只列一级节点')
+    crawl_parser.add_argument('--concurrency', '-c', type=int, default=4,
+                             help='并发请求数（仍受 rate_limit_wiki_read 限速）')
+    crawl_parser.add_argument('--checkpoint', help='checkpoint 文件，中断后以相同参数重新运行可继续')
+    crawl_parser.set_defaults(func=cmd_crawl)
+
+    # export 命令
+    export_parser = wiki_subparsers.add_parser('export', help='导出知识空间为本地 Markdown / JSON 文件')
+    export_parser.add_argument('space', help='知识空间 ID；也可以是节点 token 或链接，只导出该节点下的子树')
+    export_parser.add_argument('out_dir', help='导出目录')
+    export_parser.add_argument('--output', '-o', choices=FORMATS, default=FORMAT_MARKDOWN,
+                              help='文件格式（默认: markdown）')
+    export_parser.add_argument('--concurrency', '-c', type=int, default=4,
+                              help='并发获取的文档数（仍受 rate_limit_docx_read 限速）')
+    export_parser.add_argument('--force', action='store_true', help='忽略导出清单，重新导出全部节点')
+    export_parser.add_argument('--delete', action='store_true',
+                              help='删除知识空间中已不存在的节点对应的文件')
+    export_parser.add_argument('--format', '-F', default='text',
+                              choices=['text', 'ndjson'],
+                              help='输出格式，ndjson 每行一个节点的导出结果')
+    export_parser.set_defaults(func=cmd_export)
@@ -15,6 +15,13 @@ except ImportError:
 
 
 DEFAULT_CONFIG_PATH = Path.home() / ".feishu_config.json"
+DEFAULT_TOKEN_STORE_PATH = Path.home() / ".feishu_tokens.json"
+DEFAULT_META_CACHE_PATH = Path.home() / ".feishu_meta_cache.db"
+DEFAULT_UPLOAD_MANIFEST_DIR = Path.home() / ".feishu_uploads"
+DEFAULT_UPLOAD_HASH_STORE_PATH = Path.home() / ".feishu_upload_hashes.db"
+DEFAULT_PATH_INDEX_PATH = Path.home() / ".feishu_path_index.db"
+DEFAULT_SYNC_MANIFEST_DIR = Path.home() / ".feishu_sync"
+DEFAULT_WIKI_CACHE_PATH = Path.home() / ".feishu_wiki_cache.db"
 ENV_PATH = Path(__file__).parent.parent.parent / ".env"
 
 
@@ -83,6 +90,36 @@ class Config:
         """获取默认文件夹 token"""
         return self.get("default_folder_token")
 
+    @property
+    def max_retries(self) -> int:
+        """获取最大重试次数"""
+        return int(self.get("max_retries", 3))
+
+    @property
+    def token_cache_enabled(self) -> bool:
+        """是否启用跨进程的 token 磁盘缓存（token_cache=off 关闭）"""
+        return str(self.get("token_cache", "on")).lower() not in ("off", "false", "0", "no")
+
+    @property
+    def meta_cache_enabled(self) -> bool:
+        """是否启用文件元数据本地缓存（meta_cache=off 关闭）"""
+        return str(self.get("meta_cache", "on")).lower() not in ("off", "false", "0", "no")
+
+    @property
+    def meta_cache_ttl(self) -> float:
+        """获取元数据缓存有效秒数"""
+        return float(self.get("meta_cache_ttl", 3600))
+
+    @property
+    def wiki_cache_enabled(self) -> bool:
+        """是否启用知识库节点本地缓存（wiki_cache=off 关闭）"""
+        return str(self.get("wiki_cache", "on")).lower() not in ("off", "false", "0", "no")
+
+    @property
+    def wiki_cache_ttl(self) -> float:
+        """获取知识库节点缓存有效秒数"""
+        return float(self.get("wiki_cache_ttl", 86400))
+
     def validate_credentials(self) -> bool:
         """验证凭据是否完整"""
         if not self.app_id:
@@ -0,0 +1,300 @@
+"""
+飞书 CLI - 文件 / 素材下载
+
+先用 Range: bytes=0-0 探测文件大小，再把文件切成若干段，由线程池并发发起 Range 请求，
+各段直接写入预分配好的 <输出文件>.part 的对应偏移。进度保存在 <输出文件>.part.json，
+中断后重新运行同一下载只请求各段未完成的部分；完成后校验大小并重命名为输出文件。
+
+服务端不支持 Range（返回 200）时退化为单连接顺序下载。
+
+API 文档:
+    https://open.feishu.cn/document/server-docs/docs/drive-v1/download/download
+    https://open.feishu.cn/document/server-docs/docs/drive-v1/media/download
+"""
+
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from urllib.parse import unquote
+
+import requests
+
+from . import ratelimit, retry, transport
+from .atomic import write_json
+from .auth import get_tenant_access_token
+
+
+KIND_FILE = "file"
+KIND_MEDIA = "media"
+DOWNLOAD_PATHS = {
+    KIND_FILE: "/drive/v1/files/{token}/download",
+    KIND_MEDIA: "/drive/v1/medias/{token}/download",
+}
+
+DEFAULT_SEGMENTS = 4
+# 小于该大小的分段不再继续拆分
+MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+CHUNK_SIZE = 256 * 1024
+# 进度文件写入的最小间隔（秒）
+STATE_SAVE_INTERVAL = 1.0
+
+
+class DownloadError(RuntimeError):
+    """下载失败"""
+
+
+def _auth_headers(app_id: str, app_secret: str) -> dict:
+    token = get_tenant_access_token(app_id, app_secret)
+    if not token:
+        raise DownloadError("获取 tenant_access_token 失败")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _raise_for_error(response: requests.Response, what: str):
+    if response.status_code in (200, 206):
+        return
+    message = response.reason
+    if "json" in response.headers.get("Content-Type", ""):
+        with contextlib.suppress(ValueError):
+            body = response.json()
+            message = f"{body.get('msg')} (code: {body.get('code')})"
+    raise DownloadError(f"{what}失败: HTTP {response.status_code} {message}")
+
+
+def _safe_file_name(name: Optional[str]) -> Optional[str]:
+    """只保留服务端文件名的最后一段，避免写到目标目录之外；空名、. 和 .. 返回 None"""
+    if not name:
+        return None
+    name = os.path.basename(name.replace("\\", "/")).strip()
+    return None if name in ("", ".", "..") else name
+
+
+def _parse_file_name(headers) -> Optional[str]:
+    disposition = headers.get("Content-Disposition", "")
+    match = re.search(r"filename\*=(?:UTF-8'')?([^;]+)", disposition, re.IGNORECASE)
+    if match:
+        return _safe_file_name(unquote(match.group(1).strip('"')))
+    match = re.search(r'filename="?([^";]+)"?', disposition)
+    return _safe_file_name(match.group(1)) if match else None
+
+
+def probe(app_id: str, app_secret: str, file_token: str, kind: str = KIND_FILE) -> Tuple[Optional[int], Optional[str], bool]:
+    """
+    探测文件大小、文件名以及是否支持 Range
+
+    Returns:
+        tuple: (大小，未知时为 None, 文件名, 是否支持 Range)
+    """
+    path = DOWNLOAD_PATHS[kind].format(token=file_token)
+    headers = _auth_headers(app_id, app_secret)
+    headers["Range"] = "bytes=0-0"
+    with contextlib.closing(transport.get(path, headers=headers, stream=True,
+                                          family=ratelimit.DRIVE_DOWNLOAD)) as response:
+        _raise_for_error(response, "获取文件信息")
+        file_name = _parse_file_name(response.headers)
+        if response.status_code == 206:
+            match = re.search(r"/(\d+)$", response.headers.get("Content-Range", ""))
+            return (int(match.group(1)) if match else None), file_name, True
+        length = response.headers.get("Content-Length")
+        return (int(length) if length else None), file_name, False
+
+
+class DownloadState:
+    """分段下载进度：segments 为 [start, end, done] 列表（end 含），保存在 <part>.json"""
+
+    def __init__(self, path: str, file_token: str, size: int, segments: List[List[int]]):
+        self.path = path
+        self.file_token = file_token
+        self.size = size
+        self.segments = segments
+        self._lock = threading.Lock()
+        self._saved = 0.0
+
+    @classmethod
+    def load(cls, path: str, file_token: str, size: int) -> Optional["DownloadState"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("file_token") != file_token or data.get("size") != size:
+            return None
+        return cls(path, file_token, size, data["segments"])
+
+    @classmethod
+    def plan(cls, path: str, file_token: str, size: int, segments: int) -> "DownloadState":
+        if size == 0:
+            return cls(path, file_token, 0, [])
+        count = max(1, min(segments, size // MIN_SEGMENT_SIZE or 1))
+        step = -(-size // count)
+        ranges = [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)]
+        return cls(path, file_token, size, ranges)
+
+    @property
+    def downloaded(self) -> int:
+        return sum(done for _, _, done in self.segments)
+
+    def advance(self, index: int, n: int):
+        with self._lock:
+            self.segments[index][2] += n
+            if time.monotonic() - self._saved >= STATE_SAVE_INTERVAL:
+                self._save()
+
+    def save(self):
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        write_json(self.path, {"file_token": self.file_token, "size": self.size, "segments": self.segments})
+        self._saved = time.monotonic()
+
+    def remove(self):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+
+def _preallocate(path: str, size: int):
+    """创建（或沿用）目标大小的文件；支持时使用 posix_fallocate 真正分配磁盘空间"""
+    with open(path, "ab") as f:
+        if os.fstat(f.fileno()).st_size == size:
+            return
+        f.truncate(size)
+        if size and hasattr(os, "posix_fallocate"):
+            with contextlib.suppress(OSError):
+                os.posix_fallocate(f.fileno(), 0, size)
+
+
+def _download_segment(
+    app_id: str,
+    app_secret: str,
+    path: str,
+    part_path: str,
+    state: DownloadState,
+    index: int
+):
+    """下载一段，连接中断时从已写入的位置继续，最多重试 max_retries 次"""
+    policy = retry.get_policy()
+    attempt = 0
+    # 不经过用户态缓冲直接写入，进度文件记录的字节数一定已交给操作系统
+    with open(part_path, "r+b", buffering=0) as f:
+        while True:
+            start, end, done = state.segments[index]
+            position = start + done
+            if position > end:
+                return
+            headers = _auth_headers(app_id, app_secret)
+            headers["Range"] = f"bytes={position}-{end}"
+            try:
+                with contextlib.closing(transport.get(path, headers=headers, stream=True,
+                                                      family=ratelimit.DRIVE_DOWNLOAD)) as response:
+                    _raise_for_error(response, f"分段 {index} 下载")
+                    if response.status_code != 206:
+                        raise DownloadError("服务端未按 Range 返回分段内容")
+                    f.seek(position)
+                    remaining = end + 1 - position
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        # 不写出本段范围之外的数据，避免覆盖相邻分段
+                        view = memoryview(chunk)[:remaining]
+                        while view:
+                            n = f.write(view)
+                            state.advance(index, n)
+                            view = view[n:]
+                        remaining -= len(chunk)
+                        if remaining <= 0:
+                            break
+                if state.segments[index][0] + state.segments[index][2] <= end:
+                    raise requests.ConnectionError("分段内容不完整")
+                return
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+                if attempt >= policy.max_retries:
+                    raise
+                time.sleep(policy.delay(attempt))
+                attempt += 1
+
+
+def _download_whole(app_id: str, app_secret: str, path: str, part_path: str) -> int:
+    headers = _auth_headers(app_id, app_secret)
+    size = 0
+    with contextlib.closing(transport.get(path, headers=headers, stream=True,
+                                          family=ratelimit.DRIVE_DOWNLOAD)) as response:
+        _raise_for_error(response, "下载")
+        with open(part_path, "wb") as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                f.write(chunk)
+                size += len(chunk)
+    return size
+
+
+def download(
+    app_id: str,
+    app_secret: str,
+    file_token: str,
+    output: Optional[str] = None,
+    kind: str = KIND_FILE,
+    segments: int = DEFAULT_SEGMENTS,
+    resume: bool = True
+) -> Optional[str]:
+    """
+    下载云空间文件或素材
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        file_token: 文件 / 素材 token
+        output: 输出路径；为目录或不填时使用服务端返回的文件名
+        kind: file（云空间文件）或 media（素材）
+        segments: 并发分段数
+        resume: 是否从上次中断的位置继续
+
+    Returns:
+        str: 下载完成的文件路径，失败返回 None
+    """
+    if kind not in DOWNLOAD_PATHS:
+        raise ValueError(f"不支持的下载类型: {kind}")
+    path = DOWNLOAD_PATHS[kind].format(token=file_token)
+
+    try:
+        size, file_name, ranged = probe(app_id, app_secret, file_token, kind)
+        if not output or os.path.isdir(output):
+            output = os.path.join(output or ".", file_name or file_token)
+        part_path = output + ".part"
+        state_path = part_path + ".json"
+
+        if not ranged or size is None:
+            print("⚠️  服务端不支持分段下载，使用单连接下载")
+            written = _download_whole(app_id, app_secret, path, part_path)
+            if size is not None and written != size:
+                raise DownloadError(f"大小校验失败: {written} != {size}")
+        else:
+            state = DownloadState.load(state_path, file_token, size) if resume and os.path.exists(part_path) else None
+            if state:
+                print(f"🔄 继续下载: 已完成 {state.downloaded}/{size} 字节")
+            else:
+                state = DownloadState.plan(state_path, file_token, size, segments)
+            _preallocate(part_path, size)
+            state.save()
+
+            try:
+                with ThreadPoolExecutor(max_workers=max(len(state.segments), 1),
+                                        thread_name_prefix="feishu-download") as executor:
+                    list(executor.map(
+                        lambda index: _download_segment(app_id, app_secret, path, part_path, state, index),
+                        range(len(state.segments))
+                    ))
+            finally:
+                state.save()
+
+            if state.downloaded != size or os.path.getsize(part_path) != size:
+                raise DownloadError(f"大小校验失败: {state.downloaded} != {size}")
+            state.remove()
+
+        os.replace(part_path, output)
+        return output
+    except (DownloadError, requests.RequestException, OSError) as e:
+        print(f"❌ {e}")
+        return None
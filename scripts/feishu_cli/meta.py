@@ -0,0 +1,146 @@
+"""
+飞书 CLI - 文件元数据批量查询
+
+batch_query 接口单次最多查询 200 个文档。batch_query_meta 对输入去重后按上限分块，
+并发发送各块请求，再把 metas / failed_list 按输入顺序合并成一个结果。
+传入 MetaCache 时先查本地缓存，只请求未命中的文档。
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import lark_oapi as lark
+from lark_oapi.api.drive.v1 import *
+
+from . import ratelimit, retry
+from .client import get_client
+from .meta_cache import MetaCache
+
+
+# 单次请求的文档数上限
+MAX_DOCS_PER_REQUEST = 200
+DEFAULT_CONCURRENCY = 4
+
+
+def _query_chunk(client: lark.Client, docs: List[Tuple[str, str]], with_url: bool) -> BatchQueryMetaResponseBody:
+    request = BatchQueryMetaRequest.builder() \
+        .request_body(MetaRequest.builder()
+            .request_docs([RequestDoc.builder()
+                .doc_token(token)
+                .doc_type(doc_type)
+                .build() for token, doc_type in docs])
+            .with_url(with_url)
+            .build()) \
+        .build()
+
+    response: BatchQueryMetaResponse = retry.call_sdk(
+        lambda: client.drive.v1.meta.batch_query(request),
+        family=ratelimit.META_BATCH_QUERY
+    )
+
+    if not response.success():
+        lark.logger.error(
+            f"client.drive.v1.meta.batch_query failed, code: {response.code}, msg: {response.msg}, "
+            f"log_id: {response.get_log_id()}"
+        )
+        # 整块失败时把每个文档都记入 failed_list，保证合并结果覆盖全部输入
+        return BatchQueryMetaResponseBody.builder() \
+            .metas([]) \
+            .failed_list([MetaFailed.builder().token(token).code(response.code).build()
+                          for token, _ in docs]) \
+            .build()
+
+    return response.data
+
+
+def batch_query_meta(
+    app_id: str,
+    app_secret: str,
+    docs: Iterable[Tuple[str, str]],
+    chunk_size: int = MAX_DOCS_PER_REQUEST,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    with_url: bool = False,
+    client: Optional[lark.Client] = None,
+    cache: Optional[MetaCache] = None
+) -> BatchQueryMetaResponseBody:
+    """
+    批量获取文件元数据（自动分块、去重、并发）
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        docs: (token, type) 序列，重复的 token 只查询一次
+        chunk_size: 每个请求的文档数，不超过 200
+        concurrency: 并发请求数
+        with_url: 是否返回文档链接
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+        cache: 元数据缓存（可选），命中的文档不再请求，查询结果写回缓存
+
+    Returns:
+        BatchQueryMetaResponseBody: 合并后的 metas 与 failed_list，均按 token 首次出现的顺序排列
+    """
+    client = client or get_client(app_id, app_secret)
+    chunk_size = max(1, min(chunk_size, MAX_DOCS_PER_REQUEST))
+
+    order: Dict[str, int] = {}
+    unique: List[Tuple[str, str]] = []
+    for token, doc_type in docs:
+        if token not in order:
+            order[token] = len(unique)
+            unique.append((token, doc_type))
+
+    metas = []
+    failed_list = []
+    pending = unique
+    if cache:
+        cached = cache.get_many(unique)
+        if with_url:
+            cached = {key: meta for key, meta in cached.items() if meta.url}
+        metas.extend(cached.values())
+        pending = [doc for doc in unique if doc not in cached]
+
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    if chunks:
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks))),
+                                thread_name_prefix="feishu-meta") as executor:
+            for data in executor.map(lambda chunk: _query_chunk(client, chunk, with_url), chunks):
+                metas.extend(data.metas or [])
+                failed_list.extend(data.failed_list or [])
+                if cache and data.metas:
+                    cache.put_many(data.metas)
+
+    last = len(unique)
+    metas.sort(key=lambda meta: order.get(meta.doc_token, last))
+    failed_list.sort(key=lambda failed: order.get(failed.token, last))
+
+    return BatchQueryMetaResponseBody.builder() \
+        .metas(metas) \
+        .failed_list(failed_list) \
+        .build()
+
+
+def read_doc_list(lines: Iterable[str], default_type: str = "docx") -> List[Tuple[str, str]]:
+    """
+    解析 token 列表，每行 "token" 或 "token type"，忽略空行与 # 开头的注释
+
+    Args:
+        lines: 文本行
+        default_type: 未写类型时使用的文件类型
+
+    Returns:
+        list: (token, type) 列表
+    """
+    docs = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split()
+        docs.append((parts[0], parts[1] if len(parts) > 1 else default_type))
+    return docs
+
+
+def meta_to_dict(meta) -> dict:
+    """把 SDK 的 Meta 对象转换为 dict"""
+    return json.loads(lark.JSON.marshal(meta))
@@ -0,0 +1,214 @@
+"""
+飞书 CLI - 文件元数据本地缓存
+
+把 batch_query 返回的元数据按 (doc_token, doc_type) 存入 SQLite（~/.feishu_meta_cache.db），
+在 TTL 内的查询直接命中本地，不发请求。
+
+列表接口（drive list / walk）返回的 modified_time 用来校验缓存：
+比缓存的 latest_modify_time 新则删除该条目；相同则说明文档未变，刷新缓存时间。
+
+命中 / 未命中次数同时累计在数据库中，可通过 feishu config meta-cache 查看命中率。
+
+配置项:
+    meta_cache          off 关闭缓存，默认 on
+    meta_cache_ttl      缓存有效秒数，默认 3600
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import lark_oapi as lark
+from lark_oapi.api.drive.v1 import Meta
+
+from .config import DEFAULT_META_CACHE_PATH, get_config
+
+
+DEFAULT_TTL = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    doc_token TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    latest_modify_time INTEGER,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (doc_token, doc_type)
+);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def _as_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class MetaCache:
+    """基于 SQLite 的元数据缓存，可在多线程间共享"""
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        self.path = Path(path or DEFAULT_META_CACHE_PATH)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        # WAL 允许多个进程同时读
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get_many(self, docs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Meta]:
+        """
+        批量查询缓存
+
+        Args:
+            docs: (doc_token, doc_type) 序列
+
+        Returns:
+            dict: 命中的 {(doc_token, doc_type): Meta}
+        """
+        docs = list(docs)
+        found: Dict[Tuple[str, str], Meta] = {}
+        fresh_after = time.time() - self.ttl
+        with self._lock:
+            for token, doc_type in docs:
+                row = self._conn.execute(
+                    "SELECT data FROM meta WHERE doc_token = ? AND doc_type = ? AND fetched_at > ?",
+                    (token, doc_type, fresh_after)
+                ).fetchone()
+                if row:
+                    found[(token, doc_type)] = Meta(json.loads(row[0]))
+            hits = len(found)
+            self._count(hits, len(docs) - hits)
+        return found
+
+    def get(self, doc_token: str, doc_type: str) -> Optional[Meta]:
+        """查询单个文档，未命中或已过期时返回 None"""
+        return self.get_many([(doc_token, doc_type)]).get((doc_token, doc_type))
+
+    def put_many(self, metas: Iterable[Meta]):
+        """写入 batch_query 返回的元数据"""
+        now = time.time()
+        rows = [
+            (meta.doc_token, meta.doc_type, lark.JSON.marshal(meta), _as_int(meta.latest_modify_time), now)
+            for meta in metas if meta.doc_token and meta.doc_type
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta (doc_token, doc_type, data, latest_modify_time, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def observe(self, items: Iterable) -> Tuple[int, int]:
+        """
+        用列表结果校验缓存
+
+        Args:
+            items: 带 token、type、modified_time 的 SDK File 对象或 dict
+
+        Returns:
+            tuple: (失效的条目数, 刷新的条目数)
+        """
+        rows = []
+        for item in items:
+            if isinstance(item, dict):
+                token, doc_type, modified = item.get("token"), item.get("type"), item.get("modified_time")
+            else:
+                token, doc_type, modified = item.token, item.type, item.modified_time
+            modified = _as_int(modified)
+            if token and doc_type and modified is not None:
+                rows.append((token, doc_type, modified))
+
+        now = time.time()
+        invalidated = refreshed = 0
+        with self._lock, self._conn:
+            for token, doc_type, modified in rows:
+                invalidated += self._conn.execute(
+                    "DELETE FROM meta WHERE doc_token = ? AND doc_type = ? AND latest_modify_time < ?",
+                    (token, doc_type, modified)
+                ).rowcount
+                refreshed += self._conn.execute(
+                    "UPDATE meta SET fetched_at = ? WHERE doc_token = ? AND doc_type = ? AND latest_modify_time = ?",
+                    (now, token, doc_type, modified)
+                ).rowcount
+        return invalidated, refreshed
+
+    def invalidate(self, doc_token: str, doc_type: Optional[str] = None):
+        """删除指定文档的缓存"""
+        with self._lock, self._conn:
+            if doc_type:
+                self._conn.execute("DELETE FROM meta WHERE doc_token = ? AND doc_type = ?", (doc_token, doc_type))
+            else:
+                self._conn.execute("DELETE FROM meta WHERE doc_token = ?", (doc_token,))
+
+    def purge(self) -> int:
+        """清空缓存与累计统计，返回删除的条目数"""
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM meta").rowcount
+            self._conn.execute("DELETE FROM stats")
+        return removed
+
+    def _count(self, hits: int, misses: int):
+        self.hits += hits
+        self.misses += misses
+        with self._conn:
+            for name, value in (("hits", hits), ("misses", misses)):
+                if value:
+                    self._conn.execute(
+                        "INSERT INTO stats (name, value) VALUES (?, ?) "
+                        "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                        (name, value)
+                    )
+
+    def stats(self) -> dict:
+        """
+        缓存统计
+
+        Returns:
+            dict: 本进程的 hits / misses / hit_rate，累计的 total_hits / total_misses / total_hit_rate，
+                  以及条目数 entries
+        """
+        with self._lock:
+            totals = dict(self._conn.execute("SELECT name, value FROM stats").fetchall())
+            entries = self._conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0]
+        total_hits, total_misses = totals.get("hits", 0), totals.get("misses", 0)
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0,
+            "total_hits": total_hits,
+            "total_misses": total_misses,
+            "total_hit_rate": total_hits / (total_hits + total_misses) if total_hits + total_misses else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[MetaCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_meta_cache() -> Optional[MetaCache]:
+    """获取共享的元数据缓存（meta_cache=off 时返回 None）"""
+    global _cache
+    config = get_config()
+    if not config.meta_cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = MetaCache(ttl=config.meta_cache_ttl)
+    return _cache
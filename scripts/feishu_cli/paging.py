@@ -0,0 +1,102 @@
+"""
+飞书 CLI - 分页遍历
+
+开放平台的列表接口通过 has_more + page_token 分页。iter_pages 逐页产出结果，
+并在后台线程中预取后续页面，调用方处理当前页时下一页的请求已经在进行。
+"""
+
+import queue
+import threading
+from typing import Callable, Iterator, Optional
+
+
+class PagingError(RuntimeError):
+    """分页请求失败（已获取的页面仍会先产出）"""
+
+
+_DONE = object()
+
+
+def next_page_token(data) -> Optional[str]:
+    """从一页结果中取下一页的 token，兼容 dict 与 SDK 响应对象，没有更多页时返回 None"""
+    if isinstance(data, dict):
+        has_more = data.get("has_more")
+        token = data.get("page_token") or data.get("next_page_token")
+    else:
+        has_more = getattr(data, "has_more", None)
+        token = getattr(data, "page_token", None) or getattr(data, "next_page_token", None)
+    return token if has_more and token else None
+
+
+def iter_pages(
+    fetch_page: Callable[[Optional[str]], Optional[object]],
+    prefetch: int = 1,
+    next_token: Callable[[object], Optional[str]] = next_page_token
+) -> Iterator[object]:
+    """
+    逐页产出结果
+
+    Args:
+        fetch_page: 按 page_token 获取一页的函数（首页传 None），失败返回 None
+        prefetch: 预取页数，0 表示不预取
+        next_token: 从一页结果中取下一页 token 的函数
+
+    Yields:
+        每一页的结果
+
+    Raises:
+        PagingError: 某一页获取失败
+    """
+    if prefetch <= 0:
+        page_token = None
+        while True:
+            page = fetch_page(page_token)
+            if page is None:
+                raise PagingError("分页获取失败")
+            yield page
+            page_token = next_token(page)
+            if not page_token:
+                return
+
+    pages: "queue.Queue" = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        page_token = None
+        try:
+            while not stopped.is_set():
+                page = fetch_page(page_token)
+                if page is None:
+                    put(PagingError("分页获取失败"))
+                    return
+                if not put(page):
+                    return
+                page_token = next_token(page)
+                if not page_token:
+                    break
+        except Exception as e:
+            put(e)
+            return
+        put(_DONE)
+
+    worker = threading.Thread(target=produce, name="feishu-page-prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,243 @@
+"""
+飞书 CLI - 云空间路径索引
+
+云空间接口只认 token。PathIndex 把 (parent_token, name) → (token, type, modified_time)
+保存在 SQLite（~/.feishu_path_index.db），按路径创建 / 查找文件夹时已知的层级直接在本地解析，
+只有缺失的层级才会请求列表或创建接口。drive list / drive walk 列出的条目也会顺带写入索引。
+
+folders 表记录每个文件夹最近一次完整列出的时间和当时见到的最大 modified_time，
+之后按 EditedTime 倒序增量刷新，遇到不比它新的条目即可停止翻页。
+
+索引是缓存：本地命中的 token 对应的文件夹如果已在云端删除，调用方应使用 forget() 清理后重试。
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from . import ratelimit, transport
+from .auth import get_tenant_access_token
+from .config import DEFAULT_PATH_INDEX_PATH
+
+
+ROOT_FOLDER_META_PATH = "/drive/explorer/v2/root_folder/meta"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    parent_token TEXT NOT NULL,
+    name TEXT NOT NULL,
+    token TEXT NOT NULL,
+    type TEXT NOT NULL,
+    modified_time INTEGER,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (parent_token, name, token)
+);
+CREATE INDEX IF NOT EXISTS entries_token ON entries (token);
+CREATE TABLE IF NOT EXISTS folders (
+    token TEXT PRIMARY KEY,
+    listed_at REAL NOT NULL,
+    max_modified INTEGER
+);
+CREATE TABLE IF NOT EXISTS roots (
+    app_id TEXT PRIMARY KEY,
+    token TEXT NOT NULL
+);
+"""
+
+
+def split_path(path: str) -> List[str]:
+    """把 "/a/b/c" 拆成 ["a", "b", "c"]，忽略多余的斜杠"""
+    return [part for part in path.strip().split("/") if part]
+
+
+class PathIndex:
+    """路径索引，可在多线程间共享"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or DEFAULT_PATH_INDEX_PATH)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def root(self, app_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT token FROM roots WHERE app_id = ?", (app_id,)).fetchone()
+        return row[0] if row else None
+
+    def set_root(self, app_id: str, token: str):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO roots (app_id, token) VALUES (?, ?)", (app_id, token))
+
+    def child(self, parent_token: str, name: str, file_type: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """
+        查找子项
+
+        Returns:
+            tuple: (token, type)，同名多项时取最近更新的一项；未找到返回 None
+        """
+        sql = "SELECT token, type FROM entries WHERE parent_token = ? AND name = ?"
+        params: list = [parent_token, name]
+        if file_type:
+            sql += " AND type = ?"
+            params.append(file_type)
+        sql += " ORDER BY modified_time DESC LIMIT 1"
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def put(self, parent_token: str, name: str, token: str, file_type: str, modified_time=None):
+        """记录一个子项"""
+        self.put_many(parent_token, [(name, token, file_type, modified_time)])
+
+    def put_many(self, parent_token: str, items: List[Tuple[str, str, str, object]]):
+        """
+        批量记录子项
+
+        Args:
+            parent_token: 父文件夹 token
+            items: (name, token, type, modified_time) 列表
+        """
+        now = time.time()
+        rows = [
+            (parent_token, name, token, file_type, _as_int(modified_time), now)
+            for name, token, file_type, modified_time in items
+        ]
+        with self._lock, self._conn:
+            # 同一 token 只属于一个父文件夹、只有一个名字（重命名 / 移动后以最新为准）
+            self._conn.executemany("DELETE FROM entries WHERE token = ?", [(row[2],) for row in rows])
+            self._conn.executemany(
+                "INSERT INTO entries (parent_token, name, token, type, modified_time, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def replace_children(self, parent_token: str, items: List[Tuple[str, str, str, object]]):
+        """用一次完整列表的结果替换文件夹的全部子项，并记录列出时间"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE parent_token = ?", (parent_token,))
+        self.put_many(parent_token, items)
+        self.mark_listed(parent_token, max((_as_int(item[3]) or 0 for item in items), default=0))
+
+    def observe(self, items):
+        """
+        记录列表接口返回的条目（SDK 的 File 对象或 walk 输出的 dict）
+
+        只补充条目，不更新 folders 表：部分列表不能作为增量刷新的基准。
+        """
+        groups = {}
+        for item in items:
+            get = item.get if isinstance(item, dict) else lambda key: getattr(item, key, None)
+            if not get("parent_token") or not get("token"):
+                continue
+            groups.setdefault(get("parent_token"), []).append(
+                (get("name"), get("token"), get("type"), get("modified_time"))
+            )
+        for parent_token, group in groups.items():
+            self.put_many(parent_token, group)
+
+    def listed(self, token: str) -> Optional[int]:
+        """
+        文件夹上次完整列出时见到的最大 modified_time
+
+        Returns:
+            int: 从未完整列出过返回 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT max_modified FROM folders WHERE token = ?", (token,)).fetchone()
+        return (row[0] or 0) if row else None
+
+    def mark_listed(self, token: str, max_modified: int):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO folders (token, listed_at, max_modified) VALUES (?, ?, ?)",
+                (token, time.time(), max_modified)
+            )
+
+    def forget(self, token: str):
+        """删除 token 及其下所有已索引的子孙"""
+        with self._lock, self._conn:
+            pending = [token]
+            while pending:
+                current = pending.pop()
+                children = self._conn.execute(
+                    "SELECT token FROM entries WHERE parent_token = ?", (current,)
+                ).fetchall()
+                pending.extend(row[0] for row in children)
+                self._conn.execute("DELETE FROM entries WHERE parent_token = ? OR token = ?", (current, current))
+                self._conn.execute("DELETE FROM folders WHERE token = ?", (current,))
+
+    def purge(self) -> int:
+        """清空索引，返回删除的条目数"""
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM entries").rowcount
+            self._conn.execute("DELETE FROM folders")
+            self._conn.execute("DELETE FROM roots")
+        return removed
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _as_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_index: Optional[PathIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_path_index() -> PathIndex:
+    """获取共享的路径索引"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = PathIndex()
+    return _index
+
+
+def get_root_folder_token(app_id: str, app_secret: str, index: Optional[PathIndex] = None) -> Optional[str]:
+    """
+    获取应用云空间根目录的 token（首次调用后记录在路径索引中）
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        index: 路径索引（可选，默认使用共享索引）
+
+    Returns:
+        str: 根目录 token，失败返回 None
+    """
+    index = index or get_path_index()
+    token = index.root(app_id)
+    if token:
+        return token
+
+    access_token = get_tenant_access_token(app_id, app_secret)
+    if not access_token:
+        return None
+    response = transport.get(ROOT_FOLDER_META_PATH, headers={"Authorization": f"Bearer {access_token}"},
+                             family=ratelimit.DRIVE_LIST)
+    try:
+        result = response.json()
+    except ValueError:
+        print(f"❌ 获取根目录失败: HTTP {response.status_code}")
+        return None
+    if result.get("code") != 0:
+        print(f"❌ 获取根目录失败: {result.get('msg')} (code: {result.get('code')})")
+        return None
+
+    token = result["data"]["token"]
+    index.set_root(app_id, token)
+    return token
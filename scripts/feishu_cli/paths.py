@@ -0,0 +1,231 @@
+"""
+飞书 CLI - 云空间路径解析
+
+路径从应用云空间根目录开始，如 /Reports/2026/Q4。每一级先查 PathIndex；
+本地未命中时刷新一次父文件夹（已完整列出过的文件夹按 EditedTime 倒序增量刷新），
+仍不存在时 resolve 返回 None，make_folders 则创建缺失的层级。
+
+命令行中接受 token 的参数也接受以 / 开头的路径，由 resolve_token 转换。
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import lark_oapi as lark
+
+from .client import get_client
+from .commands.drive import create_folder, iter_files
+from .paging import PagingError
+from .path_index import PathIndex, get_path_index, get_root_folder_token, split_path
+
+
+# 同一进程内对同一 (parent_token, name) 的创建串行执行，避免并发创建出同名文件夹
+_create_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_create_locks_guard = threading.Lock()
+
+
+def _create_lock(parent_token: str, name: str) -> threading.Lock:
+    with _create_locks_guard:
+        return _create_locks.setdefault((parent_token, name), threading.Lock())
+
+
+def refresh_folder(
+    app_id: str,
+    app_secret: str,
+    folder_token: str,
+    full: bool = False,
+    index: Optional[PathIndex] = None,
+    client: Optional[lark.Client] = None
+) -> int:
+    """
+    把文件夹的子项同步到索引
+
+    从未完整列出过的文件夹（或 full=True）列出全部子项并替换索引中的记录；
+    否则按 EditedTime 倒序列出，遇到修改时间早于上次所见最大值的条目即停止翻页。
+    增量刷新发现不了云端删除的条目。
+
+    Returns:
+        int: 本次写入的条目数
+
+    Raises:
+        PagingError: 列表请求失败
+    """
+    index = index or get_path_index()
+    known = None if full else index.listed(folder_token)
+
+    items = []
+    for item in iter_files(app_id, app_secret, folder_token, order_by="EditedTime", direction="DESC",
+                           prefetch=0 if known is not None else 1, client=client):
+        modified_time = int(item.modified_time) if item.modified_time else None
+        # 修改时间相同的条目可能是上次列出之后新增的，只有严格更早的才能确定已在索引中
+        if known is not None and modified_time is not None and modified_time < known:
+            break
+        items.append((item.name, item.token, item.type, modified_time))
+
+    if known is None:
+        index.replace_children(folder_token, items)
+    else:
+        index.put_many(folder_token, items)
+        index.mark_listed(folder_token, max([known] + [item[3] or 0 for item in items]))
+    return len(items)
+
+
+def _child_folder(
+    app_id: str,
+    app_secret: str,
+    parent_token: str,
+    name: str,
+    create: bool,
+    index: PathIndex,
+    client: lark.Client
+) -> Tuple[Optional[str], bool]:
+    """
+    查找（或创建）子文件夹
+
+    Returns:
+        tuple: (token, 是否来自本地索引)
+    """
+    hit = index.child(parent_token, name, "folder")
+    if hit:
+        return hit[0], True
+
+    with _create_lock(parent_token, name):
+        hit = index.child(parent_token, name, "folder")
+        if hit:
+            return hit[0], True
+
+        try:
+            refresh_folder(app_id, app_secret, parent_token, index=index, client=client)
+        except PagingError:
+            return None, False
+        hit = index.child(parent_token, name, "folder")
+        if hit:
+            return hit[0], False
+        if not create:
+            print(f"❌ 文件夹不存在: {name}")
+            return None, False
+
+        result = create_folder(app_id, app_secret, name, parent_token, client=client)
+        if result is None:
+            return None, False
+        index.put(parent_token, name, result.token, "folder")
+        return result.token, False
+
+
+def make_folders(
+    app_id: str,
+    app_secret: str,
+    path: str,
+    parents: bool = True,
+    index: Optional[PathIndex] = None,
+    client: Optional[lark.Client] = None
+) -> Optional[str]:
+    """
+    按路径创建文件夹（类似 mkdir -p），已存在的层级直接复用
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        path: 从根目录开始的路径，如 /Reports/2026/Q4
+        parents: 是否创建缺失的中间层级；为 False 时只创建最后一级
+        index: 路径索引（可选，默认使用共享索引）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Returns:
+        str: 最后一级文件夹的 token，失败返回 None
+    """
+    index = index or get_path_index()
+    client = client or get_client(app_id, app_secret)
+    names = split_path(path)
+
+    # 索引中的 token 可能已在云端被删除：失败时清掉本次用到的缓存层级，再完整重试一次
+    for attempt in range(2):
+        parent_token = get_root_folder_token(app_id, app_secret, index=index)
+        if parent_token is None:
+            return None
+        cached: List[str] = []
+        for depth, name in enumerate(names):
+            create = parents or depth == len(names) - 1
+            token, from_index = _child_folder(app_id, app_secret, parent_token, name, create, index, client)
+            if token is None:
+                break
+            if from_index:
+                cached.append(token)
+            parent_token = token
+        else:
+            return parent_token
+
+        if attempt == 0 and cached:
+            for token in cached:
+                index.forget(token)
+            continue
+        return None
+    return None
+
+
+def resolve(
+    app_id: str,
+    app_secret: str,
+    path: str,
+    index: Optional[PathIndex] = None,
+    client: Optional[lark.Client] = None
+) -> Optional[Tuple[str, str]]:
+    """
+    把云空间路径解析为 token
+
+    每一级先查本地索引；未命中时增量刷新父文件夹，仍未找到再完整列出一次
+    （移动进来的条目不一定更新修改时间）。
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        path: 从应用云空间根目录开始的路径，如 /Team/Specs/foo
+        index: 路径索引（可选，默认使用共享索引）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Returns:
+        tuple: (token, type)，路径不存在或请求失败返回 None
+    """
+    index = index or get_path_index()
+    client = client or get_client(app_id, app_secret)
+
+    token = get_root_folder_token(app_id, app_secret, index=index)
+    if token is None:
+        return None
+    file_type = "folder"
+
+    names = split_path(path)
+    for depth, name in enumerate(names):
+        if file_type != "folder":
+            print(f"❌ 不是文件夹: /{'/'.join(names[:depth])}")
+            return None
+        hit = index.child(token, name)
+        if not hit:
+            try:
+                full = index.listed(token) is None
+                refresh_folder(app_id, app_secret, token, index=index, client=client)
+                hit = index.child(token, name)
+                if not hit and not full:
+                    refresh_folder(app_id, app_secret, token, full=True, index=index, client=client)
+                    hit = index.child(token, name)
+            except PagingError as e:
+                print(f"❌ {e}")
+                return None
+        if not hit:
+            print(f"❌ 路径不存在: /{'/'.join(names[:depth + 1])}")
+            return None
+        token, file_type = hit
+    return token, file_type
+
+
+def resolve_token(app_id: str, app_secret: str, value: Optional[str]) -> Optional[str]:
+    """
+    命令行参数转换：以 / 开头的按路径解析，其余原样作为 token 返回
+
+    Returns:
+        str: token；路径无法解析时返回 None
+    """
+    if not value or not value.startswith("/"):
+        return value
+    result = resolve(app_id, app_secret, value)
+    return result[0] if result else None
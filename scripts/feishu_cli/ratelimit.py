@@ -0,0 +1,130 @@
+"""
+飞书 CLI - 客户端频控
+
+按接口族（API family）维护令牌桶，调用前先取令牌，桶空时阻塞等待，
+让批量任务以接口允许的最大速率运行，而不是触发服务端频控后失败。
+
+默认速率参考开放平台各接口的频率限制，可通过配置覆盖，例如:
+    feishu config set rate_limit_docx_write 2     # 每秒 2 次
+    feishu config set rate_limit_drive_list 0     # 0 表示不限速
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from .config import get_config
+
+
+DOCX_WRITE = "docx_write"
+DOCX_READ = "docx_read"
+DRIVE_LIST = "drive_list"
+META_BATCH_QUERY = "meta_batch_query"
+MEDIA_UPLOAD = "media_upload"
+FILE_UPLOAD = "file_upload"
+FILE_STATISTICS = "file_statistics"
+DRIVE_DOWNLOAD = "drive_download"
+WIKI_READ = "wiki_read"
+
+# 每秒请求数
+DEFAULT_RATES: Dict[str, float] = {
+    DOCX_WRITE: 3,
+    DOCX_READ: 5,
+    DRIVE_LIST: 5,
+    META_BATCH_QUERY: 5,
+    MEDIA_UPLOAD: 5,
+    FILE_UPLOAD: 5,
+    FILE_STATISTICS: 5,
+    DRIVE_DOWNLOAD: 5,
+    WIKI_READ: 5,
+}
+
+
+class TokenBucket:
+    """线程安全的令牌桶，容量为一秒的请求量"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预订一个令牌
+
+        令牌不足时允许余额为负，按预订顺序排队，调用方按返回值等待即可。
+
+        Returns:
+            float: 需要等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """阻塞直到取得令牌，返回等待的秒数"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """acquire 的 asyncio 版本"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_limiters: Dict[str, Optional[TokenBucket]] = {}
+_limiters_lock = threading.Lock()
+
+
+def _configured_rate(family: str) -> Optional[float]:
+    value = get_config().get(f"rate_limit_{family}", DEFAULT_RATES.get(family))
+    if value is None:
+        return None
+    rate = float(value)
+    return rate if rate > 0 else None
+
+
+def get_limiter(family: str) -> Optional[TokenBucket]:
+    """获取接口族的令牌桶，未配置速率（或速率为 0）时返回 None"""
+    if family not in _limiters:
+        with _limiters_lock:
+            if family not in _limiters:
+                rate = _configured_rate(family)
+                _limiters[family] = TokenBucket(rate) if rate else None
+    return _limiters[family]
+
+
+def configure(family: str, rate: Optional[float]):
+    """
+    设置接口族的速率
+
+    Args:
+        family: 接口族，如 docx_write
+        rate: 每秒请求数，None 或 0 表示不限速
+    """
+    with _limiters_lock:
+        _limiters[family] = TokenBucket(rate) if rate else None
+
+
+def acquire(family: Optional[str]) -> float:
+    """按接口族取令牌（family 为 None 时不限速），返回等待的秒数"""
+    limiter = get_limiter(family) if family else None
+    return limiter.acquire() if limiter else 0.0
+
+
+async def aacquire(family: Optional[str]) -> float:
+    """acquire 的 asyncio 版本"""
+    limiter = get_limiter(family) if family else None
+    return await limiter.aacquire() if limiter else 0.0
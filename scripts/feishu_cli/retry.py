@@ -0,0 +1,210 @@
+"""
+飞书 CLI - 失败重试
+
+对网络错误、HTTP 5xx / 429 以及开放平台的频控类业务错误码做指数退避重试（带随机抖动），
+优先使用服务端给出的 Retry-After / x-ogw-ratelimit-reset 等待时间。
+
+只有幂等调用（读接口，或携带 client_token 的写接口）会因网络错误 / 5xx 重试；
+频控拒绝（429、99991400 等）说明请求未被执行，任何调用都可以安全重试。
+
+配置项（feishu config set 或 FEISHU_* 环境变量，CLI 也可用 --retries 覆盖）:
+    max_retries            最大重试次数，默认 3
+    retry_backoff_base     首次退避秒数，默认 0.5
+    retry_backoff_max      单次退避上限秒数，默认 30
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Mapping, Optional
+
+import requests
+
+from . import ratelimit
+from .config import get_config
+
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+
+RATE_LIMIT_STATUS = {429}
+TRANSIENT_STATUS = {500, 502, 503, 504}
+
+# 频控：请求被拒绝、未执行
+RATE_LIMIT_CODES = {
+    99991400,  # 应用请求频率超限
+    1254290,   # 文档请求过于频繁
+}
+# 服务端暂时性错误：可能已部分执行，仅幂等调用重试
+TRANSIENT_CODES = {
+    1254291,   # 文档并发写冲突
+    1061045,   # 云空间资源竞争，请重试
+}
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class RetryPolicy:
+    """指数退避重试策略"""
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def delay(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        计算第 attempt 次重试前的等待秒数
+
+        Args:
+            attempt: 已重试次数（从 0 开始）
+            headers: 响应头，包含 Retry-After / x-ogw-ratelimit-reset 时以其为准
+
+        Returns:
+            float: 等待秒数
+        """
+        hinted = _header_delay(headers)
+        if hinted is not None:
+            return min(hinted, self.backoff_max) + random.uniform(0, self.backoff_base)
+        # full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+def _header_delay(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    if not headers:
+        return None
+    # requests / httpx 的响应头大小写不敏感，SDK 的 raw.headers 是普通 dict
+    lowered = {str(k).lower(): v for k, v in headers.items()}
+    for name in ("retry-after", "x-ogw-ratelimit-reset"):
+        value = lowered.get(name)
+        if value is None:
+            continue
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def classify(status: Optional[int], code: Optional[int]) -> Optional[str]:
+    """
+    判断失败类型
+
+    Returns:
+        str: "rate_limit"（未执行，总可重试）、"transient"（仅幂等调用重试）或 None（不重试）
+    """
+    if status in RATE_LIMIT_STATUS or code in RATE_LIMIT_CODES:
+        return "rate_limit"
+    if status in TRANSIENT_STATUS or code in TRANSIENT_CODES:
+        return "transient"
+    return None
+
+
+def is_idempotent(method: str, params: Optional[Mapping] = None) -> bool:
+    """读方法，或携带 client_token 的写请求视为幂等"""
+    if method.upper() in IDEMPOTENT_METHODS:
+        return True
+    return bool(params and params.get("client_token"))
+
+
+def should_retry(kind: Optional[str], idempotent: bool) -> bool:
+    return kind == "rate_limit" or (kind == "transient" and idempotent)
+
+
+_policy: Optional[RetryPolicy] = None
+_policy_lock = threading.Lock()
+
+
+def get_policy() -> RetryPolicy:
+    """获取共享重试策略（首次调用时按配置创建）"""
+    global _policy
+    if _policy is None:
+        with _policy_lock:
+            if _policy is None:
+                config = get_config()
+                _policy = RetryPolicy(
+                    max_retries=config.max_retries,
+                    backoff_base=float(config.get("retry_backoff_base", DEFAULT_BACKOFF_BASE)),
+                    backoff_max=float(config.get("retry_backoff_max", DEFAULT_BACKOFF_MAX))
+                )
+    return _policy
+
+
+def configure(**kwargs) -> RetryPolicy:
+    """
+    覆盖共享重试策略的参数
+
+    Args:
+        **kwargs: max_retries / backoff_base / backoff_max
+
+    Returns:
+        RetryPolicy: 更新后的策略
+    """
+    policy = get_policy()
+    for key, value in kwargs.items():
+        if value is not None:
+            setattr(policy, key, value)
+    return policy
+
+
+def response_failure(response) -> Optional[str]:
+    """
+    对 requests / httpx 响应做 classify，业务错误码从 JSON 响应体中读取
+
+    非 JSON 响应（如文件下载）不读取响应体，避免把流式响应整个读入内存。
+    """
+    code = None
+    if "json" in response.headers.get("Content-Type", ""):
+        try:
+            body = response.json()
+            if isinstance(body, dict):
+                code = body.get("code")
+        except ValueError:
+            pass
+    return classify(response.status_code, code)
+
+
+def _sdk_failure(response) -> Optional[str]:
+    raw = getattr(response, "raw", None)
+    status = getattr(raw, "status_code", None)
+    return classify(status, getattr(response, "code", None))
+
+
+def call_sdk(call: Callable, idempotent: bool = True, family: Optional[str] = None):
+    """
+    带限速与重试地执行一次 SDK 调用
+
+    Args:
+        call: 无参函数，如 lambda: client.drive.v1.file.list(request)
+        idempotent: 调用是否幂等，非幂等调用只在频控拒绝时重试
+        family: 接口族（见 ratelimit）
+
+    Returns:
+        SDK 响应对象（重试耗尽时返回最后一次响应）
+    """
+    policy = get_policy()
+    attempt = 0
+    while True:
+        ratelimit.acquire(family)
+        try:
+            response = call()
+        except (requests.ConnectionError, requests.Timeout):
+            if not idempotent or attempt >= policy.max_retries:
+                raise
+            wait = policy.delay(attempt)
+        else:
+            if response.success() or attempt >= policy.max_retries:
+                return response
+            if not should_retry(_sdk_failure(response), idempotent):
+                return response
+            raw = getattr(response, "raw", None)
+            wait = policy.delay(attempt, getattr(raw, "headers", None))
+        attempt += 1
+        time.sleep(wait)
+
@@ -0,0 +1,331 @@
+"""
+飞书 CLI - 本地目录同步到云空间文件夹
+
+单向同步（本地 → 云空间）：遍历本地目录与远端文件夹树，和上次同步留下的同步清单
+（~/.feishu_sync/ 下，每个 本地目录 + 文件夹 一份）比较，只传输有变化的文件。
+
+判断文件未变化的依据依次为：
+1. 远端文件仍是上次上传的那个 token，且远端修改时间没有变化；
+2. 本地 size 与 mtime 和清单一致；不一致时再比较 sha256（只改了 mtime 的文件不重传）。
+
+首次同步（或同步清单丢失）时，远端已有的同名文件若大小与本地一致，直接纳入清单而不重新上传；
+列表接口不返回文件大小，这些文件的大小通过下载接口的 Range 请求探测。
+
+缺失的文件夹先按层级依次创建，文件由线程池并发上传；内容有变化的文件先上传新文件再删除旧文件。
+只处理远端类型为 file 的条目，在线文档等其他类型不会被覆盖或删除。
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import lark_oapi as lark
+import requests
+
+from .atomic import write_json
+from .client import get_client
+from .commands.drive import create_folder, delete_file
+from .config import DEFAULT_SYNC_MANIFEST_DIR, get_config
+from .download import DownloadError, probe
+from .upload import upload_file
+from .upload_dir import list_local_files, sha256_file
+from .walk import walk_folder
+
+
+DEFAULT_CONCURRENCY = 4
+# 同步清单写入的最小间隔（秒）
+MANIFEST_SAVE_INTERVAL = 2.0
+
+OP_MKDIR = "mkdir"
+OP_UPLOAD = "upload"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+
+class SyncManifest:
+    """
+    同步清单
+
+    files 以相对路径（/ 分隔）为键，记录上次同步时的 size、mtime_ns、sha256，
+    以及上传后的 token 和远端 modified_time（上传接口不返回修改时间，下次同步时从列表中补上）。
+    """
+
+    def __init__(self, path: Path, local_dir: str, folder_token: str):
+        self.path = path
+        self.data = {"local_dir": local_dir, "folder_token": folder_token, "files": {}}
+        self._lock = threading.Lock()
+        self._saved = 0.0
+
+    @classmethod
+    def open(cls, local_dir: str, folder_token: str, directory: Optional[Path] = None) -> "SyncManifest":
+        """打开（或新建）本地目录与文件夹对应的清单"""
+        directory = Path(directory or get_config().get("sync_manifest_dir", DEFAULT_SYNC_MANIFEST_DIR))
+        directory.mkdir(parents=True, exist_ok=True)
+        local_dir = os.path.abspath(local_dir)
+        key = hashlib.sha1(json.dumps([local_dir, folder_token]).encode("utf-8")).hexdigest()
+        manifest = cls(directory / f"{key}.json", local_dir, folder_token)
+        try:
+            with open(manifest.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("local_dir") == local_dir and data.get("folder_token") == folder_token:
+                manifest.data = data
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️  同步清单读取失败，按首次同步处理: {e}")
+        return manifest
+
+    @property
+    def files(self) -> Dict[str, dict]:
+        return self.data["files"]
+
+    def put(self, rel_path: str, entry: dict):
+        with self._lock:
+            self.files[rel_path] = entry
+            self._save(force=False)
+
+    def save(self):
+        with self._lock:
+            self._save(force=True)
+
+    def _save(self, force: bool):
+        if not force and time.monotonic() - self._saved < MANIFEST_SAVE_INTERVAL:
+            return
+        write_json(self.path, self.data)
+        self._saved = time.monotonic()
+
+
+def scan_local(local_dir: str) -> Dict[str, Tuple[str, int, int]]:
+    """
+    列出本地目录下的全部文件（跳过隐藏文件和目录）
+
+    Returns:
+        dict: 相对路径 → (绝对路径, size, mtime_ns)
+    """
+    files = {}
+    for file_path in list_local_files(local_dir, recursive=True):
+        stat = os.stat(file_path)
+        rel_path = Path(os.path.relpath(file_path, local_dir)).as_posix()
+        files[rel_path] = (file_path, stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def scan_remote(
+    app_id: str,
+    app_secret: str,
+    folder_token: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    client: Optional[lark.Client] = None
+) -> Tuple[Dict[str, dict], Dict[str, str]]:
+    """
+    遍历远端文件夹树
+
+    Returns:
+        tuple: (相对路径 → 文件条目（只含 type 为 file 的条目）, 相对路径 → 文件夹 token)
+
+    Raises:
+        PagingError: 列表请求失败
+    """
+    files, folders = {}, {}
+    for entry in walk_folder(app_id, app_secret, folder_token, concurrency=concurrency, client=client):
+        rel_path = entry["path"].lstrip("/")
+        if entry["type"] == "folder":
+            folders[rel_path] = entry["token"]
+        elif entry["type"] == "file":
+            # 同名文件取最近修改的一个
+            known = files.get(rel_path)
+            if not known or int(entry["modified_time"] or 0) > int(known["modified_time"] or 0):
+                files[rel_path] = entry
+    return files, folders
+
+
+def probe_sizes(app_id: str, app_secret: str, entries: List[dict], concurrency: int = DEFAULT_CONCURRENCY):
+    """
+    为远端文件条目并发探测大小，写入条目的 size（探测失败时为 None）
+
+    列表接口不返回文件大小，只对需要判断能否纳入清单的条目调用。
+    """
+    def size_of(entry: dict) -> Optional[int]:
+        try:
+            return probe(app_id, app_secret, entry["token"])[0]
+        except (DownloadError, requests.RequestException) as e:
+            lark.logger.debug(f"探测文件大小失败: {entry['path']}: {e}")
+            return None
+
+    if not entries:
+        return
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="feishu-sync") as executor:
+        for entry, size in zip(entries, executor.map(size_of, entries)):
+            entry["size"] = size
+
+
+def plan_sync(
+    local_files: Dict[str, Tuple[str, int, int]],
+    remote_files: Dict[str, dict],
+    remote_folders: Dict[str, str],
+    manifest: SyncManifest,
+    delete: bool = False,
+    adopt: bool = True
+) -> List[dict]:
+    """
+    比较本地、远端与同步清单，生成操作列表
+
+    未变化的文件不产生操作；只改了 mtime 的文件直接更新清单中的 mtime。
+    adopt 为真时，清单中没有记录、且远端条目的 size 与本地一致的文件直接纳入清单。
+
+    Returns:
+        list: 操作，包含 op（mkdir / upload / update / delete）、path，
+              以及 token（被替换或删除的远端文件）、size
+    """
+    ops = []
+
+    needed = set()
+    for rel_path in local_files:
+        parent = posixpath.dirname(rel_path)
+        while parent and parent not in needed:
+            needed.add(parent)
+            parent = posixpath.dirname(parent)
+    # 排序后父文件夹总在子文件夹之前
+    for rel_path in sorted(needed - set(remote_folders)):
+        ops.append({"op": OP_MKDIR, "path": rel_path, "token": None, "size": None})
+
+    for rel_path, (file_path, size, mtime_ns) in sorted(local_files.items()):
+        remote = remote_files.get(rel_path)
+        known = manifest.files.get(rel_path)
+        if known and remote and remote["token"] == known["token"]:
+            if known.get("modified_time") is None:
+                known["modified_time"] = remote["modified_time"]
+            if remote["modified_time"] == known["modified_time"]:
+                if size == known["size"] and mtime_ns == known["mtime_ns"]:
+                    continue
+                if size == known["size"] and sha256_file(file_path) == known["sha256"]:
+                    known["mtime_ns"] = mtime_ns
+                    continue
+        elif adopt and not known and remote and remote.get("size") == size:
+            manifest.files[rel_path] = {"size": size, "mtime_ns": mtime_ns, "sha256": sha256_file(file_path),
+                                        "token": remote["token"], "modified_time": remote["modified_time"]}
+            continue
+        ops.append({"op": OP_UPDATE if remote else OP_UPLOAD, "path": rel_path,
+                    "token": remote["token"] if remote else None, "size": size})
+
+    if delete:
+        for rel_path, remote in sorted(remote_files.items()):
+            if rel_path not in local_files:
+                ops.append({"op": OP_DELETE, "path": rel_path, "token": remote["token"], "size": None})
+
+    # 本地已不存在的文件不再跟踪
+    for rel_path in list(manifest.files):
+        if rel_path not in local_files:
+            manifest.files.pop(rel_path)
+    return ops
+
+
+def sync(
+    app_id: str,
+    app_secret: str,
+    local_dir: str,
+    folder_token: str,
+    delete: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    dry_run: bool = False,
+    adopt: bool = True,
+    manifest: Optional[SyncManifest] = None,
+    client: Optional[lark.Client] = None
+) -> Iterator[dict]:
+    """
+    把本地目录同步到云空间文件夹
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        local_dir: 本地目录
+        folder_token: 目标文件夹 token
+        delete: 是否删除远端存在、本地已不存在的文件
+        concurrency: 同时传输的文件数
+        dry_run: 只产出计划的操作，不做任何修改（也不写同步清单）
+        adopt: 把清单中没有记录、大小与本地一致的远端同名文件纳入清单，而不是重新上传
+        manifest: 同步清单（可选，默认按 local_dir + folder_token 打开）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Yields:
+        dict: 每个操作的结果，在 plan_sync 的操作上增加 status（planned / done / failed）；
+              上传成功时 token 为新文件的 token
+
+    Raises:
+        PagingError: 远端列表请求失败（此时尚未做任何修改）
+    """
+    client = client or get_client(app_id, app_secret)
+    manifest = manifest or SyncManifest.open(local_dir, folder_token)
+
+    local_files = scan_local(local_dir)
+    remote_files, remote_folders = scan_remote(app_id, app_secret, folder_token, concurrency, client)
+    if adopt:
+        probe_sizes(app_id, app_secret, [remote_files[rel_path] for rel_path in local_files
+                                         if rel_path in remote_files and rel_path not in manifest.files],
+                    concurrency)
+    ops = plan_sync(local_files, remote_files, remote_folders, manifest, delete, adopt)
+
+    if dry_run:
+        for op in ops:
+            yield dict(op, status="planned")
+        return
+
+    folder_tokens = dict(remote_folders)
+    folder_tokens[""] = folder_token
+
+    def transfer(op: dict) -> dict:
+        rel_path = op["path"]
+        if op["op"] == OP_DELETE:
+            ok = delete_file(app_id, app_secret, op["token"], "file", client=client)
+            return dict(op, status="done" if ok else "failed")
+
+        parent_token = folder_tokens.get(posixpath.dirname(rel_path))
+        if not parent_token:
+            return dict(op, status="failed")
+        file_path = local_files[rel_path][0]
+        try:
+            sha256 = sha256_file(file_path)
+            stat = os.stat(file_path)
+            result = upload_file(app_id, app_secret, file_path, parent_token,
+                                 file_name=posixpath.basename(rel_path), concurrency=2, client=client)
+        except (OSError, requests.RequestException) as e:
+            lark.logger.error(f"上传失败: {file_path}: {e}")
+            result = None
+        if result is None:
+            return dict(op, status="failed")
+
+        manifest.put(rel_path, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256,
+                                "token": result.file_token, "modified_time": None})
+        # 新文件上传成功后才删除旧文件；删除失败时远端会留下一个同名的旧文件
+        if op["op"] == OP_UPDATE and not delete_file(app_id, app_secret, op["token"], "file", client=client):
+            print(f"⚠️  旧文件删除失败，远端存在同名文件: {rel_path}")
+        return dict(op, token=result.file_token, status="done")
+
+    try:
+        for op in ops:
+            if op["op"] != OP_MKDIR:
+                continue
+            parent_token = folder_tokens.get(posixpath.dirname(op["path"]))
+            result = create_folder(app_id, app_secret, posixpath.basename(op["path"]), parent_token,
+                                   client=client) if parent_token else None
+            if result is None:
+                # 父文件夹创建失败时，其下的文件与子文件夹都会因找不到 parent_token 而失败
+                yield dict(op, status="failed")
+                continue
+            folder_tokens[op["path"]] = result.token
+            yield dict(op, token=result.token, status="done")
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="feishu-sync") as executor:
+            pending = {executor.submit(transfer, op) for op in ops if op["op"] != OP_MKDIR}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+    finally:
+        manifest.save()
@@ -0,0 +1,153 @@
+"""
+飞书 CLI - token 磁盘缓存
+
+按 app_id 把 tenant_access_token 保存在 ~/.feishu_tokens.json，
+多个短生命周期的 CLI 进程可复用同一个有效 token。
+读写通过文件锁串行化，写入使用临时文件 + 原子替换，避免并发进程读到半截文件。
+"""
+
+import contextlib
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from .atomic import write_json
+from .config import DEFAULT_TOKEN_STORE_PATH
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenStore:
+    """基于 JSON 文件的 token 存储，格式: {app_id: {"token": ..., "expire": ...}}"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or DEFAULT_TOKEN_STORE_PATH)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """持有跨进程排他锁"""
+        with open(self.lock_path, "a+b") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        except IOError as e:
+            print(f"⚠️  token 缓存读取失败: {e}")
+            return {}
+
+    def _write(self, data: Dict[str, dict]):
+        try:
+            write_json(self.path, data, mode=0o600, indent=2, ensure_ascii=True)
+        except IOError as e:
+            print(f"⚠️  token 缓存写入失败: {e}")
+
+    @staticmethod
+    def _valid(entry: Optional[dict], min_valid: float) -> Optional[Tuple[str, float]]:
+        if not entry or not entry.get("token"):
+            return None
+        if entry.get("expire", 0) - min_valid <= time.time():
+            return None
+        return entry["token"], entry["expire"]
+
+    def load(self, app_id: str, min_valid: float = 0) -> Optional[Tuple[str, float]]:
+        """
+        读取有效 token（文件总是被原子替换，读取无需加锁）
+
+        Args:
+            app_id: 应用 ID
+            min_valid: 至少还需有效的秒数
+
+        Returns:
+            tuple: (token, 过期时间戳)，不存在或即将过期返回 None
+        """
+        return self._valid(self._read().get(app_id), min_valid)
+
+    def save(self, app_id: str, token: str, expire: float):
+        """保存 token"""
+        with self._locked():
+            data = self._read()
+            data[app_id] = {"token": token, "expire": expire}
+            self._write(data)
+
+    def load_or_fetch(
+        self,
+        app_id: str,
+        fetch: Callable[[], Optional[Tuple[str, float]]],
+        min_valid: float = 0
+    ) -> Optional[Tuple[str, float]]:
+        """
+        在文件锁内检查缓存，缺失时调用 fetch 获取并写回
+
+        并发进程中只有第一个持锁者会真正请求鉴权接口，其余进程拿到锁后直接读到新 token。
+
+        Args:
+            app_id: 应用 ID
+            fetch: 获取新 token 的函数，返回 (token, 过期时间戳)
+            min_valid: 至少还需有效的秒数
+
+        Returns:
+            tuple: (token, 过期时间戳)，失败返回 None
+        """
+        cached = self.load(app_id, min_valid)
+        if cached:
+            return cached
+
+        with self._locked():
+            data = self._read()
+            cached = self._valid(data.get(app_id), min_valid)
+            if cached:
+                return cached
+
+            fetched = fetch()
+            if fetched:
+                data[app_id] = {"token": fetched[0], "expire": fetched[1]}
+                self._write(data)
+            return fetched
+
+    def purge(self, app_id: Optional[str] = None) -> int:
+        """
+        删除缓存的 token
+
+        Args:
+            app_id: 应用 ID，不填则清空全部
+
+        Returns:
+            int: 删除的条目数
+        """
+        with self._locked():
+            data = self._read()
+            if app_id is None:
+                removed = len(data)
+                data = {}
+            else:
+                removed = 1 if data.pop(app_id, None) else 0
+            if removed:
+                self._write(data)
+            return removed
+
+    def entries(self) -> Dict[str, dict]:
+        """返回全部缓存条目"""
+        return self._read()
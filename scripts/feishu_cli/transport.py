@@ -0,0 +1,171 @@
+"""
+飞书 CLI - HTTP 传输层
+
+所有直接调用开放平台 REST 接口的脚本共用一个 requests.Session：
+keep-alive 连接池复用到 open.feishu.cn 的 TCP/TLS 连接，并统一设置超时与代理。
+
+配置项（feishu config set 或 FEISHU_* 环境变量）:
+    http_pool_size         连接池大小，默认 10
+    http_connect_timeout   连接超时（秒），默认 5
+    http_read_timeout      读取超时（秒），默认 30
+    http_proxy             代理地址，如 http://127.0.0.1:7890
+
+请求按 retry 模块的策略自动重试，按 ratelimit 模块的接口族限速。
+"""
+
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import ratelimit, retry
+from .config import get_config
+
+
+BASE_URL = "https://open.feishu.cn/open-apis"
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 30
+
+
+class Transport:
+    """带连接池的 HTTP 客户端"""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        proxy: Optional[str] = None
+    ):
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.proxy = proxy
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if proxy:
+            self.session.proxies = {"http": proxy, "https": proxy}
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        family: Optional[str] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        发起请求，失败时按重试策略重试
+
+        Args:
+            method: HTTP 方法
+            url: 完整 URL，或以 / 开头的开放平台路径（自动补全 BASE_URL）
+            family: 接口族（见 ratelimit），指定时先按该接口族限速
+            idempotent: 是否幂等，默认按方法判断（携带 client_token 的写请求也视为幂等）
+            **kwargs: 透传给 requests，未指定 timeout 时使用默认超时
+
+        Returns:
+            requests.Response: 响应对象（重试耗尽时为最后一次响应）
+        """
+        if url.startswith("/"):
+            url = BASE_URL + url
+        kwargs.setdefault("timeout", self.timeout)
+        if idempotent is None:
+            idempotent = retry.is_idempotent(method, kwargs.get("params"))
+
+        policy = retry.get_policy()
+        attempt = 0
+        while True:
+            ratelimit.acquire(family)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not idempotent or attempt >= policy.max_retries:
+                    raise
+                wait = policy.delay(attempt)
+            else:
+                if attempt >= policy.max_retries:
+                    return response
+                if not retry.should_retry(retry.response_failure(response), idempotent):
+                    return response
+                wait = policy.delay(attempt, response.headers)
+                # 丢弃的响应（可能是 stream=True）必须关闭，否则连接一直占用连接池
+                response.close()
+            attempt += 1
+            time.sleep(wait)
+
+    def close(self):
+        """关闭连接池"""
+        self.session.close()
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def load_settings() -> dict:
+    """从配置读取连接池 / 超时 / 代理设置"""
+    config = get_config()
+    return {
+        "pool_size": int(config.get("http_pool_size", DEFAULT_POOL_SIZE)),
+        "connect_timeout": float(config.get("http_connect_timeout", DEFAULT_CONNECT_TIMEOUT)),
+        "read_timeout": float(config.get("http_read_timeout", DEFAULT_READ_TIMEOUT)),
+        "proxy": config.get("http_proxy"),
+    }
+
+
+def get_transport() -> Transport:
+    """获取进程级共享的 Transport（首次调用时按配置创建）"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = Transport(**load_settings())
+    return _transport
+
+
+def configure(**kwargs) -> Transport:
+    """
+    以新的参数重建共享 Transport，未指定的参数沿用配置
+
+    Args:
+        **kwargs: pool_size / connect_timeout / read_timeout / proxy
+
+    Returns:
+        Transport: 新的共享实例
+    """
+    global _transport
+    settings = load_settings()
+    settings.update(kwargs)
+    with _transport_lock:
+        old, _transport = _transport, Transport(**settings)
+    if old is not None:
+        old.close()
+    return _transport
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """通过共享 Transport 发起请求"""
+    return get_transport().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def patch(url: str, **kwargs) -> requests.Response:
+    return request("PATCH", url, **kwargs)
+
+
+def delete(url: str, **kwargs) -> requests.Response:
+    return request("DELETE", url, **kwargs)
@@ -0,0 +1,147 @@
+"""
+飞书 CLI - 分页树的并发广度优先遍历
+
+云空间文件夹树（walk.py）与知识空间节点树（wiki_crawl.py）共用的遍历引擎：
+以"某节点的某一页子项"为单位并发请求，每完成一页立即产出其中的条目，
+并把需要展开的子节点加入待遍历队列。各遍历只需提供"获取一页"与"展开一页"两个函数。
+
+可选的 checkpoint 文件记录尚未完成的页面以及遍历参数（identity），
+中断后以同一 checkpoint、相同参数重新运行即可继续；参数不同的 checkpoint 不会续跑。
+续跑是"至少一次"语义：中断时正在请求的页面会重新获取，其条目可能重复输出。
+"""
+
+import json
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .atomic import write_json
+from .paging import PagingError, next_page_token
+
+
+DEFAULT_CONCURRENCY = 4
+# checkpoint 写入的最小间隔（秒）
+CHECKPOINT_INTERVAL = 2.0
+
+# 任务: (parent_token, path, depth, page_token)
+Task = Tuple[Optional[str], str, int, Optional[str]]
+# 展开一页: (page, path, depth) → [(条目或 None（不产出）, 需要展开的 (token, path) 或 None)]
+Expand = Callable[[object, str, int], Iterable[Tuple[Optional[dict], Optional[Tuple[str, str]]]]]
+
+
+def load_checkpoint(checkpoint: Optional[Path], identity: dict) -> Optional[List[list]]:
+    """读取 checkpoint 中尚未完成的任务；文件不存在、损坏或遍历参数不同时返回 None"""
+    if not checkpoint or not checkpoint.exists():
+        return None
+    try:
+        with open(checkpoint, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"⚠️  checkpoint 读取失败，重新开始遍历: {e}")
+        return None
+    # 参数不同的 checkpoint 不能续跑，否则结果会混入另一次遍历的条目
+    mismatched = [key for key, value in identity.items() if data.get(key) != value]
+    if mismatched:
+        print(f"⚠️  checkpoint 的遍历参数不同（{', '.join(mismatched)}），不续跑，重新开始遍历")
+        return None
+    return [list(task) for task in data.get("pending", [])]
+
+
+def save_checkpoint(checkpoint: Path, identity: dict, pending: Iterable[tuple]):
+    write_json(checkpoint, dict(identity, pending=[list(task) for task in pending]))
+
+
+def walk_tree(
+    root_token: Optional[str],
+    fetch_page: Callable[[Optional[str], Optional[str]], Optional[object]],
+    expand: Expand,
+    max_depth: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    checkpoint: Optional[str] = None,
+    identity: Optional[dict] = None,
+    describe: Callable[[Optional[str]], str] = lambda token: f"节点 {token} 的子项获取失败",
+    thread_name_prefix: str = "feishu-walk"
+) -> Iterator[dict]:
+    """
+    并发广度优先遍历分页的树
+
+    Args:
+        root_token: 根节点 token（None 表示顶层）
+        fetch_page: (parent_token, page_token) → 一页结果，失败返回 None；
+                    结果需带 has_more 与 page_token / next_page_token
+        expand: 把一页结果转换为条目，并给出需要继续展开的子节点
+        max_depth: 最大深度（根的直接子项深度为 1），不填则不限
+        concurrency: 同时请求的页面数
+        checkpoint: checkpoint 文件路径，遍历完成后自动删除
+        identity: 写入 checkpoint 的遍历参数，续跑时须完全一致
+        describe: 某个父节点获取失败时的错误信息
+        thread_name_prefix: 线程池线程名前缀
+
+    Yields:
+        dict: expand 产出的条目
+
+    Raises:
+        PagingError: 某一页获取失败（checkpoint 会保留，可稍后续跑）
+    """
+    checkpoint_path = Path(checkpoint) if checkpoint else None
+    identity = identity or {"root": root_token}
+
+    queue = load_checkpoint(checkpoint_path, identity) or [[root_token, "", 1, None]]
+    queue = deque(tuple(task) for task in queue)
+    running = {}
+    # 已取回、正在产出条目的页面：全部产出后才从 checkpoint 中移除
+    current: List[Task] = []
+    last_saved = 0.0
+
+    def fetch(task: Task):
+        parent_token, _, _, page_token = task
+        return fetch_page(parent_token, page_token)
+
+    def save(force: bool = False):
+        nonlocal last_saved
+        if checkpoint_path and (force or time.monotonic() - last_saved >= CHECKPOINT_INTERVAL):
+            save_checkpoint(checkpoint_path, identity, current + list(running.values()) + list(queue))
+            last_saved = time.monotonic()
+
+    executor = ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix=thread_name_prefix)
+    finished = False
+    try:
+        while queue or running:
+            while queue and len(running) < concurrency:
+                task = queue.popleft()
+                running[executor.submit(fetch, task)] = task
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                page = future.result()
+                if page is None:
+                    queue.appendleft(task)
+                    raise PagingError(describe(task[0]))
+
+                parent_token, path, depth, _ = task
+                follow_up = []
+                token = next_page_token(page)
+                if token:
+                    follow_up.append((parent_token, path, depth, token))
+
+                current.append(task)
+                for entry, child in expand(page, path, depth):
+                    if child and (max_depth is None or depth < max_depth):
+                        follow_up.append((child[0], child[1], depth + 1, None))
+                    if entry is not None:
+                        yield entry
+                current.remove(task)
+                queue.extend(follow_up)
+            save()
+        finished = True
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if checkpoint_path:
+            if finished:
+                if checkpoint_path.exists():
+                    checkpoint_path.unlink()
+            else:
+                save(force=True)
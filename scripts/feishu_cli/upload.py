@@ -0,0 +1,567 @@
+"""
+飞书 CLI - 素材 / 文件上传
+
+素材（上传到文档、表格等，kind="media"）与云空间文件（上传到文件夹，kind="file"）
+使用同一套流程，只是调用的接口不同。不超过 20MB 的文件走 upload_all 一次上传；更大的文件走分片上传：
+upload_prepare 取得 upload_id 与分片大小，各分片由线程池并发上传（每个分片独立重试），
+全部完成后 upload_finish 换取 file_token。
+文件内容以 FileSlice 流式发送，每个上传的内存占用只有读取缓冲区大小，与文件大小无关。
+
+分片上传的进度记录在上传清单（默认 ~/.feishu_uploads/）中，中断后重新上传同一文件会复用
+未过期的 upload_id，只发送缺失或内容已变化的分片。
+
+API 文档:
+    https://open.feishu.cn/document/server-docs/docs/drive-v1/media/multipart-upload-media/upload_prepare
+    https://open.feishu.cn/document/server-docs/docs/drive-v1/upload/multipart-upload-file-/upload_prepare
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import lark_oapi as lark
+from lark_oapi.api.drive.v1 import (
+    FileUploadInfo,
+    MediaUploadInfo,
+    UploadAllFileRequest,
+    UploadAllFileRequestBody,
+    UploadAllMediaRequest,
+    UploadAllMediaRequestBody,
+    UploadAllMediaResponse,
+    UploadFinishFileRequest,
+    UploadFinishFileRequestBody,
+    UploadFinishMediaRequest,
+    UploadFinishMediaRequestBody,
+    UploadFinishMediaResponse,
+    UploadFinishMediaResponseBody,
+    UploadPartFileRequest,
+    UploadPartFileRequestBody,
+    UploadPartMediaRequest,
+    UploadPartMediaRequestBody,
+    UploadPartMediaResponse,
+    UploadPrepareFileRequest,
+    UploadPrepareMediaRequest,
+    UploadPrepareMediaResponse,
+    UploadPrepareMediaResponseBody,
+)
+
+from . import ratelimit, retry
+from .atomic import write_json
+from .client import get_client
+from .config import DEFAULT_UPLOAD_MANIFEST_DIR, get_config
+
+
+# upload_all 的文件大小上限，超过时使用分片上传
+MULTIPART_THRESHOLD = 20 * 1024 * 1024
+DEFAULT_PART_CONCURRENCY = 4
+# 计算校验和时的读取块大小
+CHUNK_SIZE = 64 * 1024
+# 分片上传会话的有效期按 24 小时计，留出余量后视为过期并重新创建
+UPLOAD_SESSION_TTL = 20 * 3600
+
+KIND_MEDIA = "media"
+KIND_FILE = "file"
+# 上传到云空间文件夹时的 parent_type
+PARENT_TYPE_EXPLORER = "explorer"
+
+# 两类上传接口的请求类型一一对应，resource 为 client.drive.v1 下的资源名
+_UploadApi = namedtuple("_UploadApi", [
+    "resource", "family", "all_request", "all_body", "prepare_request", "upload_info",
+    "part_request", "part_body", "finish_request", "finish_body",
+])
+_APIS = {
+    KIND_MEDIA: _UploadApi(
+        "media", ratelimit.MEDIA_UPLOAD, UploadAllMediaRequest, UploadAllMediaRequestBody,
+        UploadPrepareMediaRequest, MediaUploadInfo, UploadPartMediaRequest, UploadPartMediaRequestBody,
+        UploadFinishMediaRequest, UploadFinishMediaRequestBody,
+    ),
+    KIND_FILE: _UploadApi(
+        "file", ratelimit.FILE_UPLOAD, UploadAllFileRequest, UploadAllFileRequestBody,
+        UploadPrepareFileRequest, FileUploadInfo, UploadPartFileRequest, UploadPartFileRequestBody,
+        UploadFinishFileRequest, UploadFinishFileRequestBody,
+    ),
+}
+
+
+class UploadError(RuntimeError):
+    """上传失败"""
+
+
+class FileSlice(io.RawIOBase):
+    """
+    文件中 [offset, offset + length) 区间的只读流
+
+    上传时 SDK 的 MultipartEncoder 按小块读取它，请求体不会整块载入内存；
+    每个实例独立打开文件，可在多个线程中并发使用。
+    """
+
+    def __init__(self, file_path: str, offset: int = 0, length: Optional[int] = None):
+        super().__init__()
+        self._file = open(file_path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self.offset = offset
+        self.length = max(0, min(size - offset, length if length is not None else size))
+        self._pos = 0
+        self._file.seek(offset)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += self.length
+        self._pos = max(0, min(pos, self.length))
+        self._file.seek(self.offset + self._pos)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        remaining = self.length - self._pos
+        if remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:remaining]
+        n = self._file.readinto(view)
+        self._pos += n
+        return n
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def adler32(file_path: str, offset: int = 0, length: Optional[int] = None) -> str:
+    """
+    按 CHUNK_SIZE 分块增量计算文件区间的 Adler-32 校验和
+
+    Returns:
+        str: 十进制校验和，可直接作为 checksum 参数
+    """
+    value = 1
+    with FileSlice(file_path, offset, length) as stream:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            value = zlib.adler32(chunk, value)
+    return str(value)
+
+
+def _api(kind: str) -> _UploadApi:
+    if kind not in _APIS:
+        raise ValueError(f"不支持的上传类型: {kind}")
+    return _APIS[kind]
+
+
+def _log_failure(api: str, response, kind: str = KIND_MEDIA):
+    lark.logger.error(
+        f"client.drive.v1.{kind}.{api} failed, code: {response.code}, msg: {response.msg}, "
+        f"log_id: {response.get_log_id()}"
+    )
+
+
+def upload_all(
+    client: lark.Client,
+    file_path: str,
+    parent_type: str,
+    parent_node: str,
+    file_name: str,
+    size: int,
+    checksum: Optional[str] = None,
+    extra: Optional[str] = None,
+    kind: str = KIND_MEDIA
+):
+    """
+    一次上传整个文件（不超过 20MB），文件内容以流的方式发送
+
+    Args:
+        checksum: Adler-32 校验和，不填时自动计算
+        kind: media（素材）或 file（云空间文件，extra 不适用）
+
+    Returns:
+        UploadAllMediaResponseBody / UploadAllFileResponseBody: 包含 file_token，失败返回 None
+    """
+    api = _api(kind)
+    # multipart 表单中 checksum 字段位于文件之前，需先单独扫描一遍
+    checksum = checksum or adler32(file_path)
+
+    def call():
+        # SDK 会把请求体改写为 MultipartEncoder 并读完文件流，每次重试都要重新构造请求
+        with FileSlice(file_path) as stream:
+            body_builder = api.all_body.builder() \
+                .file_name(file_name) \
+                .parent_type(parent_type) \
+                .parent_node(parent_node) \
+                .size(len(stream)) \
+                .checksum(checksum) \
+                .file(stream)
+            if extra:
+                body_builder.extra(extra)
+            request = api.all_request.builder().request_body(body_builder.build()).build()
+            return getattr(client.drive.v1, api.resource).upload_all(request)
+
+    response: UploadAllMediaResponse = retry.call_sdk(call, idempotent=False, family=api.family)
+
+    if not response.success():
+        _log_failure("upload_all", response, kind)
+        return None
+
+    return response.data
+
+
+def upload_prepare(
+    client: lark.Client,
+    file_name: str,
+    parent_type: str,
+    parent_node: str,
+    size: int,
+    extra: Optional[str] = None,
+    kind: str = KIND_MEDIA
+) -> UploadPrepareMediaResponseBody:
+    """
+    创建分片上传会话
+
+    Returns:
+        UploadPrepareMediaResponseBody: upload_id、block_size、block_num
+
+    Raises:
+        UploadError: 创建失败
+    """
+    api = _api(kind)
+    info_builder = api.upload_info.builder() \
+        .file_name(file_name) \
+        .parent_type(parent_type) \
+        .parent_node(parent_node) \
+        .size(size)
+    if extra:
+        info_builder.extra(extra)
+    request = api.prepare_request.builder().request_body(info_builder.build()).build()
+
+    # 重复 prepare 只会多出一个未使用的会话，可以安全重试
+    response: UploadPrepareMediaResponse = retry.call_sdk(
+        lambda: getattr(client.drive.v1, api.resource).upload_prepare(request),
+        family=api.family
+    )
+    if not response.success():
+        _log_failure("upload_prepare", response, kind)
+        raise UploadError(f"创建分片上传失败: {response.msg} (code: {response.code})")
+    return response.data
+
+
+def upload_part(
+    client: lark.Client,
+    upload_id: str,
+    seq: int,
+    file_path: str,
+    offset: int,
+    length: int,
+    checksum: Optional[str] = None,
+    kind: str = KIND_MEDIA
+):
+    """
+    上传一个分片（同一 seq 重复上传会覆盖，按幂等调用重试）
+
+    分片内容从文件中按区间流式读取，不整块载入内存。
+
+    Raises:
+        UploadError: 重试耗尽后仍失败
+    """
+    api = _api(kind)
+
+    def call():
+        with FileSlice(file_path, offset, length) as stream:
+            body_builder = api.part_body.builder() \
+                .upload_id(upload_id) \
+                .seq(seq) \
+                .size(len(stream)) \
+                .file(stream)
+            if checksum:
+                body_builder.checksum(checksum)
+            request = api.part_request.builder().request_body(body_builder.build()).build()
+            return getattr(client.drive.v1, api.resource).upload_part(request)
+
+    response: UploadPartMediaResponse = retry.call_sdk(call, family=api.family)
+    if not response.success():
+        _log_failure("upload_part", response, kind)
+        raise UploadError(f"分片 {seq} 上传失败: {response.msg} (code: {response.code})")
+
+
+def upload_finish(
+    client: lark.Client,
+    upload_id: str,
+    block_num: int,
+    kind: str = KIND_MEDIA
+) -> UploadFinishMediaResponseBody:
+    """
+    完成分片上传
+
+    Returns:
+        UploadFinishMediaResponseBody: 包含 file_token
+
+    Raises:
+        UploadError: 完成失败
+    """
+    api = _api(kind)
+    request = api.finish_request.builder() \
+        .request_body(api.finish_body.builder()
+            .upload_id(upload_id)
+            .block_num(block_num)
+            .build()) \
+        .build()
+
+    response: UploadFinishMediaResponse = retry.call_sdk(
+        lambda: getattr(client.drive.v1, api.resource).upload_finish(request),
+        family=api.family
+    )
+    if not response.success():
+        _log_failure("upload_finish", response, kind)
+        raise UploadError(f"完成分片上传失败: {response.msg} (code: {response.code})")
+    return response.data
+
+
+class UploadManifest:
+    """
+    分片上传进度清单
+
+    以 (文件路径, 上传点, 文件名) 为键保存在 upload_manifest_dir 下，记录 upload_id、分片大小
+    以及已完成分片的 Adler-32 校验和。文件大小或修改时间变化时清单作废。
+    """
+
+    def __init__(self, path: Path, identity: dict):
+        self.path = path
+        self.identity = identity
+        self.data = {"identity": identity, "upload_id": None, "block_size": None,
+                     "block_num": None, "created_at": None, "parts": {}}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(
+        cls,
+        file_path: str,
+        parent_type: str,
+        parent_node: str,
+        file_name: str,
+        directory: Optional[Path] = None
+    ) -> "UploadManifest":
+        """打开（或新建）文件对应的清单"""
+        directory = Path(directory or get_config().get("upload_manifest_dir", DEFAULT_UPLOAD_MANIFEST_DIR))
+        directory.mkdir(parents=True, exist_ok=True)
+        abs_path = os.path.abspath(file_path)
+        key = hashlib.sha1(json.dumps([abs_path, parent_type, parent_node, file_name]).encode("utf-8")).hexdigest()
+        stat = os.stat(file_path)
+        manifest = cls(directory / f"{key}.json", {
+            "file_path": abs_path, "parent_type": parent_type, "parent_node": parent_node,
+            "file_name": file_name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+        })
+        try:
+            with open(manifest.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("identity") == manifest.identity:
+                manifest.data = data
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️  上传清单读取失败，重新上传: {e}")
+        return manifest
+
+    @property
+    def resumable(self) -> bool:
+        """是否有未过期的上传会话"""
+        created_at = self.data.get("created_at") or 0
+        return bool(self.data.get("upload_id")) and time.time() - created_at < UPLOAD_SESSION_TTL
+
+    def start(self, upload_id: str, block_size: int, block_num: int):
+        """记录新的上传会话（清空已完成分片）"""
+        with self._lock:
+            self.data.update(upload_id=upload_id, block_size=block_size, block_num=block_num,
+                             created_at=time.time(), parts={})
+            self._save()
+
+    def checksum(self, seq: int) -> Optional[str]:
+        """已完成分片的校验和"""
+        return self.data["parts"].get(str(seq))
+
+    def mark_done(self, seq: int, checksum: str):
+        with self._lock:
+            self.data["parts"][str(seq)] = checksum
+            self._save()
+
+    def remove(self):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+    def _save(self):
+        write_json(self.path, self.data)
+
+
+def upload_media_multipart(
+    app_id: str,
+    app_secret: str,
+    file_path: str,
+    parent_type: str,
+    parent_node: str,
+    file_name: Optional[str] = None,
+    extra: Optional[str] = None,
+    concurrency: int = DEFAULT_PART_CONCURRENCY,
+    resume: bool = True,
+    client: Optional[lark.Client] = None,
+    kind: str = KIND_MEDIA
+):
+    """
+    分片上传素材（kind="file" 时上传云空间文件）
+
+    resume 为 True 时进度记录在上传清单中，中断后重新上传同一文件只发送缺失的分片；
+    已过期或失效的会话会重新创建。
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        file_path: 本地文件路径
+        parent_type: 上传点类型，如 docx_file、sheet_file
+        parent_node: 上传点 token
+        file_name: 文件名（可选，默认使用文件原始名称）
+        extra: 额外参数（可选，JSON 字符串格式）
+        concurrency: 同时上传的分片数
+        resume: 是否使用上传清单续传
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+        kind: media（素材）或 file（云空间文件）
+
+    Returns:
+        UploadFinishMediaResponseBody: 包含 file_token，失败返回 None
+    """
+    if not os.path.exists(file_path):
+        lark.logger.error(f"文件不存在: {file_path}")
+        return None
+
+    client = client or get_client(app_id, app_secret)
+    file_name = file_name or os.path.basename(file_path)
+    size = os.path.getsize(file_path)
+    manifest = UploadManifest.open(file_path, parent_type, parent_node, file_name) if resume else None
+
+    def run(manifest: Optional[UploadManifest], resumed: bool):
+        if resumed:
+            upload_id, block_size, block_num = (manifest.data["upload_id"], manifest.data["block_size"],
+                                                manifest.data["block_num"])
+            print(f"🔄 继续上传: 已完成 {len(manifest.data['parts'])}/{block_num} 个分片")
+        else:
+            session = upload_prepare(client, file_name, parent_type, parent_node, size, extra, kind=kind)
+            upload_id, block_size, block_num = session.upload_id, session.block_size, session.block_num
+            if manifest:
+                manifest.start(upload_id, block_size, block_num)
+
+        def send(seq: int):
+            # 校验和分块增量计算，既用于跳过已完成的分片，也随分片发送供服务端校验
+            offset = seq * block_size
+            checksum = adler32(file_path, offset, block_size)
+            if manifest and manifest.checksum(seq) == checksum:
+                return
+            upload_part(client, upload_id, seq, file_path, offset, block_size, checksum=checksum, kind=kind)
+            if manifest:
+                manifest.mark_done(seq, checksum)
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="feishu-upload") as executor:
+            # list() 让任一分片的异常在此处抛出
+            list(executor.map(send, range(block_num)))
+
+        return upload_finish(client, upload_id, block_num, kind=kind)
+
+    try:
+        resumed = bool(manifest and manifest.resumable)
+        try:
+            result = run(manifest, resumed)
+        except UploadError as e:
+            if not resumed:
+                raise
+            # 续传的会话可能已过期或被服务端清理，重新创建会话上传一次
+            print(f"⚠️  续传失败（{e}），重新开始上传")
+            result = run(manifest, False)
+    except UploadError as e:
+        print(f"❌ {e}")
+        if manifest:
+            print(f"   已完成的分片记录在 {manifest.path}，重新运行同一上传即可续传")
+        return None
+
+    if manifest:
+        manifest.remove()
+    return result
+
+
+def upload_media(
+    app_id: str,
+    app_secret: str,
+    file_path: str,
+    parent_type: str,
+    parent_node: str,
+    file_name: Optional[str] = None,
+    checksum: Optional[str] = None,
+    extra: Optional[str] = None,
+    concurrency: int = DEFAULT_PART_CONCURRENCY,
+    resume: bool = True,
+    client: Optional[lark.Client] = None,
+    kind: str = KIND_MEDIA
+):
+    """
+    按文件大小选择上传方式：不超过 20MB 一次上传，否则分片上传
+
+    Returns:
+        包含 file_token 的上传结果，失败返回 None
+    """
+    if not os.path.exists(file_path):
+        lark.logger.error(f"文件不存在: {file_path}")
+        return None
+
+    size = os.path.getsize(file_path)
+    if size > MULTIPART_THRESHOLD:
+        return upload_media_multipart(app_id, app_secret, file_path, parent_type, parent_node,
+                                      file_name=file_name, extra=extra, concurrency=concurrency,
+                                      resume=resume, client=client, kind=kind)
+
+    client = client or get_client(app_id, app_secret)
+    return upload_all(client, file_path, parent_type, parent_node,
+                      file_name or os.path.basename(file_path), size, checksum=checksum, extra=extra, kind=kind)
+
+
+def upload_file(
+    app_id: str,
+    app_secret: str,
+    file_path: str,
+    folder_token: str,
+    file_name: Optional[str] = None,
+    concurrency: int = DEFAULT_PART_CONCURRENCY,
+    resume: bool = True,
+    client: Optional[lark.Client] = None
+):
+    """
+    上传文件到云空间文件夹（超过 20MB 自动分片上传）
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        file_path: 本地文件路径
+        folder_token: 目标文件夹 token
+        file_name: 文件名（可选，默认使用文件原始名称）
+        concurrency: 分片上传时同时上传的分片数
+        resume: 分片上传中断后，重新运行是否只发送缺失的分片
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Returns:
+        包含 file_token 的上传结果，失败返回 None
+    """
+    return upload_media(app_id, app_secret, file_path, PARENT_TYPE_EXPLORER, folder_token,
+                        file_name=file_name, concurrency=concurrency, resume=resume,
+                        client=client, kind=KIND_FILE)
@@ -0,0 +1,179 @@
+"""
+飞书 CLI - 目录批量上传
+
+对目录中的文件计算 sha256，内容相同的文件只上传一次；上传成功的 sha256 → file_token
+记录在本地（~/.feishu_upload_hashes.db），以后再上传相同内容时直接复用 file_token。
+
+素材的 file_token 与上传点绑定，默认按 (parent_type, parent_node) 区分复用范围；
+dedupe_scope="type" 时同一 parent_type 的不同上传点之间也复用。
+"""
+
+import fnmatch
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import lark_oapi as lark
+import requests
+
+from .client import get_client
+from .config import DEFAULT_UPLOAD_HASH_STORE_PATH
+from .upload import CHUNK_SIZE, upload_media
+
+
+DEFAULT_CONCURRENCY = 4
+DEDUPE_SCOPE_NODE = "node"
+DEDUPE_SCOPE_TYPE = "type"
+
+
+def sha256_file(file_path: str) -> str:
+    """分块计算文件的 sha256"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadHashStore:
+    """sha256 → file_token 的本地映射（SQLite），可在多线程间共享"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or DEFAULT_UPLOAD_HASH_STORE_PATH)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS uploads ("
+            "sha256 TEXT NOT NULL, scope TEXT NOT NULL, file_token TEXT NOT NULL, "
+            "size INTEGER, uploaded_at REAL NOT NULL, PRIMARY KEY (sha256, scope))"
+        )
+
+    def get(self, sha256: str, scope: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_token FROM uploads WHERE sha256 = ? AND scope = ?", (sha256, scope)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, sha256: str, scope: str, file_token: str, size: int):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO uploads (sha256, scope, file_token, size, uploaded_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (sha256, scope, file_token, size, time.time())
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def list_local_files(local_dir: str, recursive: bool = False, pattern: str = "*") -> List[str]:
+    """列出目录中匹配 pattern 的文件（跳过隐藏文件），按路径排序"""
+    files = []
+    for root, dirs, names in os.walk(local_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".")) if recursive else []
+        for name in sorted(names):
+            if not name.startswith(".") and fnmatch.fnmatch(name, pattern):
+                files.append(os.path.join(root, name))
+    return files
+
+
+def upload_dir(
+    app_id: str,
+    app_secret: str,
+    local_dir: str,
+    parent_type: str,
+    parent_node: str,
+    recursive: bool = False,
+    pattern: str = "*",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    dedupe_scope: str = DEDUPE_SCOPE_NODE,
+    store: Optional[UploadHashStore] = None,
+    client: Optional[lark.Client] = None
+) -> Iterator[dict]:
+    """
+    并发上传目录中的文件，内容已上传过的文件直接复用 file_token
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        local_dir: 本地目录
+        parent_type: 上传点类型，如 docx_image
+        parent_node: 上传点 token
+        recursive: 是否包含子目录
+        pattern: 文件名匹配模式，如 *.png
+        concurrency: 同时上传的文件数
+        dedupe_scope: node（同一上传点内复用）或 type（同一上传点类型内复用）
+        store: sha256 → file_token 映射（可选，默认使用 ~/.feishu_upload_hashes.db）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Yields:
+        dict: 每个文件的结果，包含 path、sha256、size、file_token、
+              status（uploaded / cached / failed）
+    """
+    if dedupe_scope not in (DEDUPE_SCOPE_NODE, DEDUPE_SCOPE_TYPE):
+        raise ValueError(f"不支持的 dedupe_scope: {dedupe_scope}")
+
+    client = client or get_client(app_id, app_secret)
+    store = store or UploadHashStore()
+    scope = parent_type if dedupe_scope == DEDUPE_SCOPE_TYPE else f"{parent_type}:{parent_node}"
+    files = list_local_files(local_dir, recursive, pattern)
+
+    def upload_one(file_path: str, sha256: str) -> Optional[str]:
+        try:
+            result = upload_media(app_id, app_secret, file_path, parent_type, parent_node,
+                                  concurrency=2, client=client)
+        except (OSError, requests.RequestException) as e:
+            lark.logger.error(f"上传失败: {file_path}: {e}")
+            return None
+        if result is None:
+            return None
+        store.put(sha256, scope, result.file_token, os.path.getsize(file_path))
+        return result.file_token
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="feishu-upload-dir") as executor:
+        hashes = dict(zip(files, executor.map(sha256_file, files)))
+
+        # 本次运行中内容相同的文件共用一次上传
+        uploads: Dict[str, object] = {}
+        waiting: Dict[str, List[str]] = {}
+        for file_path in files:
+            sha256 = hashes[file_path]
+            cached = store.get(sha256, scope)
+            if cached:
+                yield _result(local_dir, file_path, sha256, cached, "cached")
+                continue
+            if sha256 not in uploads:
+                uploads[sha256] = executor.submit(upload_one, file_path, sha256)
+                waiting[sha256] = []
+            waiting[sha256].append(file_path)
+
+        pending = {future: sha256 for sha256, future in uploads.items()}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                sha256 = pending.pop(future)
+                file_token = future.result()
+                for index, file_path in enumerate(waiting[sha256]):
+                    if file_token is None:
+                        status = "failed"
+                    else:
+                        status = "uploaded" if index == 0 else "cached"
+                    yield _result(local_dir, file_path, sha256, file_token, status)
+
+
+def _result(local_dir: str, file_path: str, sha256: str, file_token: Optional[str], status: str) -> dict:
+    return {
+        "path": os.path.relpath(file_path, local_dir),
+        "sha256": sha256,
+        "size": os.path.getsize(file_path),
+        "file_token": file_token,
+        "status": status,
+    }
@@ -0,0 +1,89 @@
+"""
+飞书 CLI - 云空间目录遍历
+
+按广度优先遍历文件夹树：以"某文件夹的某一页"为单位并发请求（遍历引擎见 treewalk.py），
+每完成一页立即产出其中的条目，并把子文件夹加入待遍历队列。
+
+可选的 checkpoint 文件记录尚未完成的页面，中断后以同一 checkpoint 重新运行即可继续。
+续跑是"至少一次"语义：中断时正在请求的页面会重新获取，其条目可能重复输出。
+"""
+
+from typing import Iterable, Iterator, Optional
+
+import lark_oapi as lark
+
+from .client import get_client
+from .commands.drive import list_files
+from .treewalk import DEFAULT_CONCURRENCY, walk_tree
+
+
+WALK_PAGE_SIZE = 200
+
+
+def file_entry(item, path: str, depth: int) -> dict:
+    """把 SDK 的 File 对象转换为可序列化的条目"""
+    return {
+        "token": item.token,
+        "name": item.name,
+        "type": item.type,
+        "parent_token": item.parent_token,
+        "path": f"{path}/{item.name}",
+        "depth": depth,
+        "url": item.url,
+        "created_time": item.created_time,
+        "modified_time": item.modified_time,
+        "owner_id": item.owner_id,
+    }
+
+
+def walk_folder(
+    app_id: str,
+    app_secret: str,
+    root_token: Optional[str] = None,
+    max_depth: Optional[int] = None,
+    types: Optional[Iterable[str]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    checkpoint: Optional[str] = None,
+    client: Optional[lark.Client] = None
+) -> Iterator[dict]:
+    """
+    遍历文件夹树
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        root_token: 根文件夹 token，不填则从云空间根目录开始
+        max_depth: 最大深度（根目录的直接子项深度为 1），不填则不限
+        types: 只产出这些类型的条目（如 {"docx", "folder"}），不影响向下遍历
+        concurrency: 同时请求的页面数
+        checkpoint: checkpoint 文件路径，遍历完成后自动删除
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Yields:
+        dict: 条目，包含 token、name、type、path、depth 等字段
+
+    Raises:
+        PagingError: 某一页获取失败（checkpoint 会保留，可稍后续跑）
+    """
+    client = client or get_client(app_id, app_secret)
+    types = set(types) if types else None
+
+    def fetch(folder_token: Optional[str], page_token: Optional[str]):
+        return list_files(app_id, app_secret, folder_token, page_size=WALK_PAGE_SIZE,
+                          client=client, page_token=page_token)
+
+    def expand(page, path: str, depth: int):
+        for item in page.files or []:
+            entry = file_entry(item, path, depth)
+            child = (item.token, entry["path"]) if item.type == "folder" else None
+            yield (entry if types is None or item.type in types else None), child
+
+    yield from walk_tree(
+        root_token, fetch, expand,
+        max_depth=max_depth,
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+        identity={"root": root_token, "max_depth": max_depth, "types": sorted(types) if types else None},
+        describe=lambda token: f"文件夹 {token or '根目录'} 获取失败",
+        thread_name_prefix="feishu-walk"
+    )
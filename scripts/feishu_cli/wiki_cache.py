@@ -0,0 +1,128 @@
+"""
+飞书 CLI - 知识库节点本地缓存
+
+把知识库节点按 node_token 存入 SQLite（~/.feishu_wiki_cache.db），记录 obj_token、obj_type、
+space_id、title 以及完整的节点信息。节点与文档的对应关系不会变化，标题可能被修改，
+因此默认有效期较长。
+
+配置项:
+    wiki_cache          off 关闭缓存，默认 on
+    wiki_cache_ttl      缓存有效秒数，默认 86400
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import lark_oapi as lark
+from lark_oapi.api.wiki.v2 import Node
+
+from .config import DEFAULT_WIKI_CACHE_PATH, get_config
+
+
+DEFAULT_TTL = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    node_token TEXT PRIMARY KEY,
+    obj_token TEXT,
+    obj_type TEXT,
+    space_id TEXT,
+    title TEXT,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS nodes_space ON nodes (space_id);
+"""
+
+
+class WikiNodeCache:
+    """基于 SQLite 的知识库节点缓存，可在多线程间共享"""
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        self.path = Path(path or DEFAULT_WIKI_CACHE_PATH)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get_many(self, node_tokens: Iterable[str]) -> Dict[str, Node]:
+        """
+        批量查询缓存
+
+        Returns:
+            dict: 命中的 {node_token: Node}
+        """
+        node_tokens = list(node_tokens)
+        found: Dict[str, Node] = {}
+        fresh_after = time.time() - self.ttl
+        with self._lock:
+            for token in node_tokens:
+                row = self._conn.execute(
+                    "SELECT data FROM nodes WHERE node_token = ? AND fetched_at > ?", (token, fresh_after)
+                ).fetchone()
+                if row:
+                    found[token] = Node(json.loads(row[0]))
+            self.hits += len(found)
+            self.misses += len(node_tokens) - len(found)
+        return found
+
+    def get(self, node_token: str) -> Optional[Node]:
+        """查询单个节点，未命中或已过期时返回 None"""
+        return self.get_many([node_token]).get(node_token)
+
+    def put_many(self, nodes: Iterable[Node]):
+        """写入 get_node 或子节点列表返回的节点"""
+        now = time.time()
+        rows = [
+            (node.node_token, node.obj_token, node.obj_type, node.space_id, node.title,
+             lark.JSON.marshal(node), now)
+            for node in nodes if node.node_token
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO nodes (node_token, obj_token, obj_type, space_id, title, data, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def invalidate(self, node_token: str):
+        """删除指定节点的缓存"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM nodes WHERE node_token = ?", (node_token,))
+
+    def purge(self) -> int:
+        """清空缓存，返回删除的条目数"""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM nodes").rowcount
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[WikiNodeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_wiki_node_cache() -> Optional[WikiNodeCache]:
+    """获取共享的知识库节点缓存（wiki_cache=off 时返回 None）"""
+    global _cache
+    config = get_config()
+    if not config.wiki_cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = WikiNodeCache(ttl=config.wiki_cache_ttl)
+    return _cache
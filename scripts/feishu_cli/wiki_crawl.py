@@ -0,0 +1,139 @@
+"""
+飞书 CLI - 知识空间节点树遍历
+
+与云空间目录遍历（walk.py）共用 treewalk 引擎，按广度优先以"某节点的某一页子节点"为单位并发请求，
+每完成一页立即产出其中的节点；只为 has_child 为真的节点请求下一层，叶子节点不产生请求。
+
+可选的 checkpoint 文件记录尚未完成的页面，中断后以同一 checkpoint 重新运行即可继续，
+同样是"至少一次"语义。传入 WikiNodeCache 时，列出的节点会写入缓存，之后的 resolve 直接命中。
+
+API 文档: https://open.feishu.cn/document/server-docs/docs/wiki-v2/space-node/list
+"""
+
+from typing import Iterator, Optional
+
+import lark_oapi as lark
+from lark_oapi.api.wiki.v2 import ListSpaceNodeRequest, ListSpaceNodeResponse, ListSpaceNodeResponseBody
+
+from . import ratelimit, retry
+from .client import get_client
+from .treewalk import DEFAULT_CONCURRENCY, walk_tree
+from .wiki_cache import WikiNodeCache
+
+
+# 子节点列表接口的单页上限
+CRAWL_PAGE_SIZE = 50
+
+
+def list_child_nodes(
+    client: lark.Client,
+    space_id: str,
+    parent_node_token: Optional[str] = None,
+    page_token: Optional[str] = None,
+    page_size: int = CRAWL_PAGE_SIZE
+) -> Optional[ListSpaceNodeResponseBody]:
+    """
+    获取一页子节点
+
+    Args:
+        client: 飞书客户端
+        space_id: 知识空间 ID
+        parent_node_token: 父节点 token，不填时列出空间的一级节点
+        page_token: 分页标记（首页不填）
+        page_size: 每页数量，最大 50
+
+    Returns:
+        ListSpaceNodeResponseBody: 包含 items、has_more、page_token，失败返回 None
+    """
+    request_builder = ListSpaceNodeRequest.builder() \
+        .space_id(space_id) \
+        .page_size(page_size)
+    if parent_node_token:
+        request_builder.parent_node_token(parent_node_token)
+    if page_token:
+        request_builder.page_token(page_token)
+    request = request_builder.build()
+
+    response: ListSpaceNodeResponse = retry.call_sdk(
+        lambda: client.wiki.v2.space_node.list(request),
+        family=ratelimit.WIKI_READ
+    )
+
+    if not response.success():
+        print(f"❌ 获取子节点失败: {response.msg} (code: {response.code})")
+        return None
+    return response.data
+
+
+def node_record(node, path: str, depth: int) -> dict:
+    """把 SDK 的 Node 对象转换为可序列化的记录"""
+    return {
+        "node_token": node.node_token,
+        "parent_node_token": node.parent_node_token or None,
+        "obj_token": node.obj_token,
+        "obj_type": node.obj_type,
+        "node_type": node.node_type,
+        "title": node.title,
+        "path": f"{path}/{node.title}",
+        "depth": depth,
+        "has_child": bool(node.has_child),
+        "space_id": node.space_id,
+        "obj_edit_time": node.obj_edit_time,
+        "node_create_time": node.node_create_time,
+    }
+
+
+def crawl_space(
+    app_id: str,
+    app_secret: str,
+    space_id: str,
+    root_node_token: Optional[str] = None,
+    max_depth: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    checkpoint: Optional[str] = None,
+    cache: Optional[WikiNodeCache] = None,
+    client: Optional[lark.Client] = None
+) -> Iterator[dict]:
+    """
+    遍历知识空间的节点树
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        space_id: 知识空间 ID
+        root_node_token: 从该节点的子节点开始，不填则遍历整个空间
+        max_depth: 最大深度（一级节点深度为 1），不填则不限
+        concurrency: 同时请求的页面数
+        checkpoint: checkpoint 文件路径，遍历完成后自动删除
+        cache: 节点缓存（可选），列出的节点写入缓存
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Yields:
+        dict: 节点记录，包含 node_token、parent_node_token、obj_token、obj_type、title、
+              path、depth、obj_edit_time 等字段
+
+    Raises:
+        PagingError: 某一页获取失败（checkpoint 会保留，可稍后续跑）
+    """
+    client = client or get_client(app_id, app_secret)
+
+    def fetch(parent_node_token: Optional[str], page_token: Optional[str]):
+        return list_child_nodes(client, space_id, parent_node_token, page_token)
+
+    def expand(page, path: str, depth: int):
+        items = page.items or []
+        if cache and items:
+            cache.put_many(items)
+        for node in items:
+            record = node_record(node, path, depth)
+            yield record, ((node.node_token, record["path"]) if node.has_child else None)
+
+    yield from walk_tree(
+        root_node_token, fetch, expand,
+        max_depth=max_depth,
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+        identity={"space_id": space_id, "root": root_node_token, "max_depth": max_depth},
+        describe=lambda token: f"节点 {token or '空间根'} 的子节点获取失败",
+        thread_name_prefix="feishu-wiki-crawl"
+    )
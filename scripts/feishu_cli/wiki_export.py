@@ -0,0 +1,413 @@
+"""
+飞书 CLI - 知识空间批量导出
+
+用 crawl_space 遍历知识空间，文档块由线程池并发获取（受 rate_limit_docx_read 限速），
+每个节点写出一个文件，目录结构与知识库层级一致：
+
+    out_dir/
+        产品手册.md
+        产品手册/
+            快速开始.md
+            常见问题.md
+
+只有 docx 节点会获取正文；表格、多维表格、旧版文档等节点只写出标题与 obj_token。
+
+导出目录下的 .feishu_export.json 记录每个节点上次导出时的 obj_edit_time 与文件路径，
+重新运行时编辑时间未变的节点直接跳过；节点被移动或改名时只移动已有文件，不重新获取。
+"""
+
+import json
+import os
+import posixpath
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import unquote
+
+import lark_oapi as lark
+
+from .atomic import write_json, write_text
+from .blocks import get_document_blocks_with_content
+from .client import get_client
+from .wiki_cache import WikiNodeCache
+from .wiki_crawl import crawl_space
+
+
+DEFAULT_CONCURRENCY = 4
+MANIFEST_NAME = ".feishu_export.json"
+# 导出清单写入的最小间隔（秒）
+MANIFEST_SAVE_INTERVAL = 2.0
+
+FORMAT_MARKDOWN = "markdown"
+FORMAT_JSON = "json"
+FORMATS = (FORMAT_MARKDOWN, FORMAT_JSON)
+_SUFFIXES = {FORMAT_MARKDOWN: ".md", FORMAT_JSON: ".json"}
+
+STATUS_EXPORTED = "exported"
+STATUS_SKIPPED = "skipped"
+STATUS_MOVED = "moved"
+STATUS_DELETED = "deleted"
+STATUS_FAILED = "failed"
+
+_UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+# 普通文本中需要转义的 Markdown 字符；行首的 # + - 与 "1." 会被当作标题或列表，另行转义
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_\[\]<>|~])")
+_MARKDOWN_LINE_START = re.compile(r"^(\s*)(#+|[+-]|\d+)(?=(\.)?(\s|$))", re.MULTILINE)
+_MAX_NAME_LENGTH = 100
+
+
+class ExportManifest:
+    """
+    导出清单
+
+    nodes 以 node_token 为键，记录上次导出时的 obj_edit_time、标题与相对文件路径（/ 分隔）。
+    """
+
+    def __init__(self, path: Path, space_id: str, root: Optional[str], fmt: str):
+        self.path = path
+        self.data = {"space_id": space_id, "root": root, "format": fmt, "nodes": {}}
+        self._lock = threading.Lock()
+        self._saved = 0.0
+
+    @classmethod
+    def open(cls, out_dir: str, space_id: str, root: Optional[str], fmt: str) -> "ExportManifest":
+        """打开（或新建）导出目录下的清单；空间、根节点或格式不同时按首次导出处理"""
+        manifest = cls(Path(out_dir) / MANIFEST_NAME, space_id, root, fmt)
+        try:
+            with open(manifest.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (data.get("space_id"), data.get("root"), data.get("format")) == (space_id, root, fmt):
+                manifest.data = data
+            else:
+                print("⚠️  导出目录属于其他知识空间、根节点或格式，按首次导出处理")
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️  导出清单读取失败，按首次导出处理: {e}")
+        return manifest
+
+    @property
+    def nodes(self) -> Dict[str, dict]:
+        return self.data["nodes"]
+
+    def put(self, node_token: str, entry: dict):
+        with self._lock:
+            self.nodes[node_token] = entry
+            self._save(force=False)
+
+    def remove(self, node_token: str):
+        with self._lock:
+            self.nodes.pop(node_token, None)
+            self._save(force=False)
+
+    def save(self):
+        with self._lock:
+            self._save(force=True)
+
+    def _save(self, force: bool):
+        if not force and time.monotonic() - self._saved < MANIFEST_SAVE_INTERVAL:
+            return
+        write_json(self.path, self.data)
+        self._saved = time.monotonic()
+
+
+def safe_name(title: str) -> str:
+    """把节点标题转换为可用的文件名"""
+    name = _UNSAFE_CHARS.sub("_", title or "").strip().strip(".")
+    return name[:_MAX_NAME_LENGTH] or "untitled"
+
+
+def escape_markdown(text: str) -> str:
+    """转义普通文本中的 Markdown 语法字符"""
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", text)
+
+
+def _escape_line_starts(text: str) -> str:
+    def escape(match):
+        marker = match.group(2)
+        if marker.isdigit():
+            return f"{match.group(1)}{marker}\\" if match.group(3) else match.group(0)
+        return f"{match.group(1)}\\{marker}"
+    return _MARKDOWN_LINE_START.sub(escape, text)
+
+
+def _render_elements(elements: List[dict], escape: bool = True) -> str:
+    """
+    渲染文本元素（text_run、文档引用、公式）为行内 Markdown
+
+    escape 为 False 时原样输出文本内容（用于代码块）。
+    """
+    if not escape:
+        return "".join((element.get("text_run") or {}).get("content", "") for element in elements or [])
+
+    parts = []
+    for element in elements or []:
+        if "text_run" in element:
+            run = element["text_run"]
+            text = run.get("content", "")
+            style = run.get("text_element_style") or {}
+            if style.get("inline_code") and text:
+                text = f"`{text}`"
+            else:
+                text = escape_markdown(text)
+            if text.strip():
+                if style.get("bold"):
+                    text = f"**{text}**"
+                if style.get("italic"):
+                    text = f"*{text}*"
+                if style.get("strikethrough"):
+                    text = f"~~{text}~~"
+                link = (style.get("link") or {}).get("url")
+                if link:
+                    text = f"[{text}]({unquote(link)})"
+            parts.append(text)
+        elif "mention_doc" in element:
+            doc = element["mention_doc"]
+            parts.append(f"[{escape_markdown(doc.get('title', ''))}]({unquote(doc.get('url', ''))})")
+        elif "equation" in element:
+            parts.append(f"${element['equation'].get('content', '').strip()}$")
+    return _escape_line_starts("".join(parts))
+
+
+def _indent(text: str, prefix: str = "    ") -> str:
+    # 空行只保留前缀中的非空白部分（引用中的空行为 ">"）
+    return "\n".join(prefix + line if line else prefix.rstrip() for line in text.split("\n"))
+
+
+def render_markdown(items: List[dict]) -> str:
+    """
+    把文档块列表渲染为 Markdown
+
+    按 page 块的 children 还原层级；不认识的块类型只渲染其子块。
+
+    Args:
+        items: get_document_blocks_with_content 返回的 items
+
+    Returns:
+        str: Markdown 文本
+    """
+    blocks = {block.get("block_id"): block for block in items}
+    if not items:
+        return ""
+    root = next((block for block in items if "page" in block), items[0])
+
+    def children(block: dict) -> List[dict]:
+        return [blocks[child] for child in block.get("children") or [] if child in blocks]
+
+    def join(chunks: List[tuple]) -> str:
+        # 相邻的列表项之间不空行
+        text = ""
+        for index, (is_item, chunk) in enumerate(chunks):
+            if index:
+                text += "\n" if is_item and chunks[index - 1][0] else "\n\n"
+            text += chunk
+        return text
+
+    def render_children(block: dict) -> str:
+        return join([chunk for chunk in (render(child) for child in children(block)) if chunk[1]])
+
+    def render(block: dict) -> tuple:
+        for key, marker in (("bullet", "- "), ("ordered", "1. "), ("todo", None)):
+            if key in block:
+                if key == "todo":
+                    done = (block["todo"].get("style") or {}).get("done")
+                    marker = "- [x] " if done else "- [ ] "
+                text = marker + _render_elements(block[key].get("elements"))
+                nested = render_children(block)
+                return True, text + ("\n" + _indent(nested) if nested else "")
+
+        if "page" in block:
+            title = _render_elements(block["page"].get("elements"))
+            body = render_children(block)
+            return False, join([(False, f"# {title}")] * bool(title) + [(False, body)] * bool(body))
+        if "text" in block:
+            return False, _render_elements(block["text"].get("elements"))
+        for level in range(1, 10):
+            key = f"heading{level}"
+            if key in block:
+                return False, "#" * min(level, 6) + " " + _render_elements(block[key].get("elements"))
+        if "code" in block:
+            return False, "```\n" + _render_elements(block["code"].get("elements"), escape=False) + "\n```"
+        if "quote" in block:
+            return False, _indent(_render_elements(block["quote"].get("elements")), "> ")
+        if "quote_container" in block or "callout" in block:
+            return False, _indent(render_children(block), "> ")
+        if "divider" in block:
+            return False, "---"
+        if "image" in block:
+            return False, f"![image]({block['image'].get('token', '')})"
+        if "table" in block:
+            table = block["table"]
+            columns = (table.get("property") or {}).get("column_size") or 1
+            cells = [render_children(blocks[cell]).replace("\n", " ") if cell in blocks else ""
+                     for cell in table.get("cells") or []]
+            rows = [cells[i:i + columns] for i in range(0, len(cells), columns)] or [[""] * columns]
+            lines = ["| " + " | ".join(rows[0]) + " |", "|" + " --- |" * columns]
+            lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+            return False, "\n".join(lines)
+        return False, render_children(block)
+
+    return render(root)[1].strip() + "\n"
+
+
+def _remove_file(out_dir: Path, rel_path: str):
+    """删除文件，并清理因此变空的上级目录（不超出导出目录）"""
+    path = out_dir / rel_path
+    if path.exists():
+        path.unlink()
+    parent = path.parent
+    while parent != out_dir and parent.is_dir() and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
+
+def export_space(
+    app_id: str,
+    app_secret: str,
+    space_id: str,
+    out_dir: str,
+    root_node_token: Optional[str] = None,
+    fmt: str = FORMAT_MARKDOWN,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    force: bool = False,
+    delete: bool = False,
+    cache: Optional[WikiNodeCache] = None,
+    client: Optional[lark.Client] = None
+) -> Iterator[dict]:
+    """
+    把知识空间导出到本地目录
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        space_id: 知识空间 ID
+        out_dir: 导出目录
+        root_node_token: 只导出该节点下的子树（不含该节点本身），不填则导出整个空间
+        fmt: markdown 或 json（json 文件包含节点记录与原始块列表）
+        concurrency: 同时获取的文档数（节点遍历也使用同样的并发数）
+        force: 忽略导出清单，重新导出全部节点
+        delete: 删除上次导出过、知识空间中已不存在的节点文件
+        cache: 节点缓存（可选），遍历到的节点写入缓存
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Yields:
+        dict: 每个节点的结果，包含 node_token、title、obj_type、path（相对导出目录）和
+              status（exported / skipped / moved / deleted / failed）
+
+    Raises:
+        PagingError: 节点列表获取失败（已导出的节点已记入清单，重新运行时会跳过）
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"不支持的导出格式: {fmt}")
+
+    client = client or get_client(app_id, app_secret)
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    manifest = ExportManifest.open(out_dir, space_id, root_node_token, fmt)
+    suffix = _SUFFIXES[fmt]
+
+    # 节点 token → 其子节点所在目录（相对路径）
+    dirs: Dict[Optional[str], str] = {root_node_token: ""}
+    taken: Dict[str, set] = {}
+    seen = set()
+    # 本次运行中已分配给节点的文件路径；旧路径被其他节点占用时不能再移动或删除
+    claimed = set()
+
+    def result(record: dict, rel_path: str, status: str) -> dict:
+        return {"node_token": record["node_token"], "title": record["title"],
+                "obj_type": record["obj_type"], "path": rel_path, "status": status}
+
+    def export(record: dict, rel_path: str) -> dict:
+        items = None
+        if record["obj_type"] == "docx":
+            blocks = get_document_blocks_with_content(client, record["obj_token"])
+            if blocks is None:
+                return result(record, rel_path, STATUS_FAILED)
+            items = blocks["items"]
+
+        if fmt == FORMAT_JSON:
+            content = json.dumps({"node": record, "blocks": items}, ensure_ascii=False, indent=2)
+        elif items is not None:
+            content = render_markdown(items)
+        else:
+            content = f"# {record['title']}\n\n> {record['obj_type']}: {record['obj_token']}\n"
+        try:
+            (out_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            write_text(out_path / rel_path, content)
+        except OSError as e:
+            lark.logger.error(f"写入失败: {rel_path}: {e}")
+            return result(record, rel_path, STATUS_FAILED)
+
+        previous = manifest.nodes.get(record["node_token"])
+        if previous and previous["path"] != rel_path and previous["path"] not in claimed:
+            _remove_file(out_path, previous["path"])
+        manifest.put(record["node_token"], {"path": rel_path, "title": record["title"],
+                                            "obj_edit_time": record["obj_edit_time"]})
+        return result(record, rel_path, STATUS_EXPORTED)
+
+    executor = ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="feishu-wiki-export")
+    pending = set()
+    completed = False
+    try:
+        for record in crawl_space(app_id, app_secret, space_id, root_node_token,
+                                  concurrency=concurrency, cache=cache, client=client):
+            node_token = record["node_token"]
+            seen.add(node_token)
+
+            # 同级节点重名时，后出现的加上 node_token 后缀
+            parent_dir = dirs.get(record["parent_node_token"], "")
+            siblings = taken.setdefault(parent_dir, set())
+            name = safe_name(record["title"])
+            if name.lower() in siblings:
+                name = f"{name}_{node_token}"
+            siblings.add(name.lower())
+            dirs[node_token] = posixpath.join(parent_dir, name)
+            rel_path = dirs[node_token] + suffix
+            claimed.add(rel_path)
+
+            entry = manifest.nodes.get(node_token)
+            unchanged = (not force and entry and record["obj_edit_time"]
+                         and entry["obj_edit_time"] == record["obj_edit_time"]
+                         and (entry["path"] == rel_path or entry["path"] not in claimed)
+                         and (out_path / entry["path"]).exists())
+            if unchanged and entry["path"] == rel_path:
+                yield result(record, rel_path, STATUS_SKIPPED)
+                continue
+            if unchanged:
+                target = out_path / rel_path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(out_path / entry["path"], target)
+                _remove_file(out_path, entry["path"])
+                manifest.put(node_token, dict(entry, path=rel_path, title=record["title"]))
+                yield result(record, rel_path, STATUS_MOVED)
+                continue
+
+            pending.add(executor.submit(export, record, rel_path))
+            # 限制排队的文档数，避免遍历远快于获取时积压
+            while len(pending) >= concurrency * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        completed = True
+
+        if delete:
+            for node_token, entry in list(manifest.nodes.items()):
+                if node_token in seen:
+                    continue
+                if entry["path"] not in claimed:
+                    _remove_file(out_path, entry["path"])
+                manifest.remove(node_token)
+                yield {"node_token": node_token, "title": entry.get("title"), "obj_type": None,
+                       "path": entry["path"], "status": STATUS_DELETED}
+    finally:
+        # 遍历中断时等待已提交的文档写完，使其记入清单
+        executor.shutdown(wait=not completed)
+        manifest.save()
@@ -0,0 +1,125 @@
+"""
+飞书 CLI - 知识库节点解析
+
+知识库链接中的 token 是节点 token，读写文档内容需要的是节点对应的 obj_token。
+resolve_nodes 对输入去重后先查 WikiNodeCache，只为未命中的节点并发调用 get_node，
+结果写回缓存并按输入顺序返回。
+
+API 文档: https://open.feishu.cn/document/server-docs/docs/wiki-v2/space-node/get_node
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import lark_oapi as lark
+from lark_oapi.api.wiki.v2 import GetNodeSpaceRequest, GetNodeSpaceResponse, Node
+
+from . import ratelimit, retry
+from .client import get_client
+from .wiki_cache import WikiNodeCache
+
+
+DEFAULT_CONCURRENCY = 8
+
+_WIKI_URL = re.compile(r"/wiki/([A-Za-z0-9]+)")
+
+
+def parse_node_token(value: str) -> str:
+    """从知识库链接（如 https://xxx.feishu.cn/wiki/<token>?...）中取出节点 token，其余原样返回"""
+    match = _WIKI_URL.search(value)
+    return match.group(1) if match else value.strip()
+
+
+def get_node(client: lark.Client, node_token: str) -> Tuple[Optional[Node], int]:
+    """
+    获取单个知识库节点
+
+    Returns:
+        tuple: (Node, 0)，失败时为 (None, 错误码)
+    """
+    request = GetNodeSpaceRequest.builder() \
+        .token(node_token) \
+        .obj_type("wiki") \
+        .build()
+
+    response: GetNodeSpaceResponse = retry.call_sdk(
+        lambda: client.wiki.v2.space.get_node(request),
+        family=ratelimit.WIKI_READ
+    )
+
+    if not response.success():
+        lark.logger.debug(
+            f"client.wiki.v2.space.get_node failed, token: {node_token}, code: {response.code}, "
+            f"msg: {response.msg}, log_id: {response.get_log_id()}"
+        )
+        return None, response.code
+    return response.data.node, 0
+
+
+def resolve_nodes(
+    app_id: str,
+    app_secret: str,
+    node_tokens: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: Optional[WikiNodeCache] = None,
+    failed: Optional[List[Tuple[str, int]]] = None,
+    client: Optional[lark.Client] = None
+) -> Dict[str, Node]:
+    """
+    批量把知识库节点 token 解析为节点信息（obj_token、obj_type、space_id、title 等）
+
+    Args:
+        app_id: 应用 ID
+        app_secret: 应用密钥
+        node_tokens: 节点 token 序列（也可以是知识库链接），重复的只解析一次
+        concurrency: 并发请求数（仍受 rate_limit_wiki_read 限速）
+        cache: 节点缓存（可选），命中的节点不再请求，查询结果写回缓存
+        failed: 传入列表时追加解析失败的 (node_token, code)
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
+
+    Returns:
+        dict: {node_token: Node}，按 token 首次出现的顺序排列，不含失败的节点
+    """
+    unique = list(dict.fromkeys(parse_node_token(token) for token in node_tokens))
+    found: Dict[str, Node] = cache.get_many(unique) if cache else {}
+    pending = [token for token in unique if token not in found]
+
+    if pending:
+        client = client or get_client(app_id, app_secret)
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pending))),
+                                thread_name_prefix="feishu-wiki") as executor:
+            results = list(executor.map(lambda token: get_node(client, token), pending))
+        nodes = []
+        for token, (node, code) in zip(pending, results):
+            if node is None:
+                if failed is not None:
+                    failed.append((token, code))
+                continue
+            found[token] = node
+            nodes.append(node)
+        if cache and nodes:
+            cache.put_many(nodes)
+
+    return {token: found[token] for token in unique if token in found}
+
+
+def resolve_node(
+    app_id: str,
+    app_secret: str,
+    node_token: str,
+    cache: Optional[WikiNodeCache] = None,
+    client: Optional[lark.Client] = None
+) -> Optional[Node]:
+    """
+    解析单个知识库节点
+
+    Returns:
+        Node: 节点信息，失败返回 None
+    """
+    failed = []
+    node = resolve_nodes(app_id, app_secret, [node_token], cache=cache, failed=failed, client=client)
+    if failed:
+        print(f"❌ 获取知识库节点失败: {failed[0][0]} (code: {failed[0][1]})")
+        return None
+    return next(iter(node.values()), None)
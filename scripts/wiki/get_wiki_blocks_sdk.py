@@ -4,42 +4,15 @@
 使用您提供的文档 ID 直接获取块内容
 """
 
-import json
-import lark_oapi as lark
-from lark_oapi.api.docx.v1 import ListDocumentBlockRequest
-
-
-def get_document_blocks_with_content(
-    client: lark.Client,
-    document_id: str,
-    page_size: int = 500
-) -> dict:
-    """
-    获取文档所有块
-
-    Args:
-        client: 飞书客户端
-        document_id: 文档 ID
-        page_size: 分页大小，最大 500
-
-    Returns:
-        dict: 包含文档块列表的字典
-    """
-    request = ListDocumentBlockRequest.builder() \
-        .document_id(document_id) \
-        .page_size(page_size) \
-        .document_revision_id(-1) \
-        .build()
+import sys
+from pathlib import Path
 
-    response = client.docx.v1.document_block.list(request)
+import lark_oapi as lark
 
-    if not response.success():
-        print(f"❌ 获取文档块失败: {response.code} - {response.msg}")
-        if response.raw:
-            print(f"详细信息: {response.raw.content[:500]}")
-        return None
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-    return json.loads(lark.JSON.marshal(response.data))
+# 获取逻辑已移入 feishu_cli.blocks，供 wiki export 复用；这里保留原有的导入路径
+from feishu_cli.blocks import get_document_blocks_page, get_document_blocks_with_content  # noqa: F401
 
 
 def main():
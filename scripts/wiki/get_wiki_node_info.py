@@ -5,63 +5,40 @@
 """
 
 import json
-import requests
+import sys
+from pathlib import Path
+from typing import Optional
 
+import lark_oapi as lark
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    """获取 tenant_access_token"""
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(
-        url,
-        json={"app_id": app_id, "app_secret": app_secret}
-    )
-    return response.json().get("tenant_access_token")
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from feishu_cli.wiki_cache import get_wiki_node_cache
+from feishu_cli.wiki_nodes import resolve_node
 
-def get_wiki_node_info(app_id: str, app_secret: str, node_token: str) -> dict:
+
+def get_wiki_node_info(
+    app_id: str,
+    app_secret: str,
+    node_token: str,
+    client: Optional[lark.Client] = None
+) -> dict:
     """
-    获取 Wiki 节点信息
+    获取 Wiki 节点信息（结果缓存在 ~/.feishu_wiki_cache.db，重复查询不发请求）
 
     Args:
         app_id: 应用 ID
         app_secret: 应用密钥
-        node_token: Wiki 节点 token（从 URL 中提取）
+        node_token: Wiki 节点 token（从 URL 中提取，也可直接传入 Wiki 链接）
+        client: 复用的 lark.Client（可选，默认从共享注册表获取）
 
     Returns:
-        dict: 节点信息，包含 document_id
+        dict: 节点信息，包含 obj_token（即 document_id）、obj_type、space_id、title 等
     """
-    access_token = get_tenant_access_token(app_id, app_secret)
-
-    # 获取 Wiki 节点信息
-    url = "https://open.feishu.cn/open-apis/wiki/v2/spaces/nodes/get_node"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
-    params = {
-        "token": node_token
-    }
-
-    response = requests.get(url, headers=headers, params=params)
-
-    # 打印原始响应用于调试
-    print(f"状态码: {response.status_code}")
-    print(f"响应内容: {response.text[:500]}")
-
-    # 尝试解析 JSON
-    try:
-        result = response.json()
-    except Exception as e:
-        print(f"❌ JSON 解析失败: {e}")
-        print(f"原始响应: {response.text}")
-        return None
-
-    if result.get("code") != 0:
-        print(f"❌ 获取失败: {result.get('code')} - {result.get('msg')}")
-        print(f"详细信息: {json.dumps(result, indent=2, ensure_ascii=False)}")
+    node = resolve_node(app_id, app_secret, node_token, cache=get_wiki_node_cache(), client=client)
+    if node is None:
         return None
-
-    return result.get("data")
+    return json.loads(lark.JSON.marshal(node))
 
 
 def main():
@@ -0,0 +1,86 @@
+"""
+token 获取与缓存的离线测试（鉴权接口替换为假响应，不发起网络请求）
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from feishu_cli import auth, client
+from feishu_cli.auth import DEFAULT_TOKEN_TTL, TokenProvider, fetch_tenant_access_token
+
+
+class FakeResponse:
+    def __init__(self, body: dict):
+        self.body = body
+
+    def json(self) -> dict:
+        return self.body
+
+
+@pytest.fixture
+def token_response(monkeypatch):
+    body = {"code": 0, "msg": "ok", "tenant_access_token": "t-abc", "expire": 7140}
+    monkeypatch.setattr(auth.transport, "post", lambda *args, **kwargs: FakeResponse(body))
+    return body
+
+
+def test_fetch_uses_expire_from_response(token_response):
+    token, expire = fetch_tenant_access_token("cli_x", "secret")
+
+    assert token == "t-abc"
+    assert expire == pytest.approx(time.time() + 7140, abs=5)
+
+
+def test_missing_expire_defaults_to_documented_ttl(token_response):
+    del token_response["expire"]
+
+    token, expire = fetch_tenant_access_token("cli_x", "secret")
+
+    assert token == "t-abc"
+    assert expire == pytest.approx(time.time() + DEFAULT_TOKEN_TTL, abs=5)
+
+
+def test_token_without_expire_is_cached(token_response):
+    del token_response["expire"]
+    provider = TokenProvider()
+
+    assert provider.get("cli_x", "secret") == "t-abc"
+    assert provider.get("cli_x", "secret") == "t-abc"
+    assert provider.stats()["fetches"] == 1
+
+
+def test_failed_fetch_returns_none(token_response):
+    token_response.update(code=10003, msg="invalid app_secret")
+
+    assert fetch_tenant_access_token("cli_x", "secret") is None
+
+
+def test_sdk_token_expire_is_not_shortened_twice(monkeypatch):
+    provider = TokenProvider()
+    monkeypatch.setattr(client, "get_token_provider", lambda: provider)
+    cache = client.SharedTokenCache()
+    cache.register("cli_x", "secret")
+    real_expire = time.time() + 7200
+
+    # SDK 写入时已把过期时间提前 10 分钟
+    cache.set("self_tenant_token:cli_x", "t-sdk", int(real_expire - 10 * 60))
+
+    assert provider._tokens["cli_x"][1] == pytest.approx(real_expire, abs=1)
+    monkeypatch.setattr(auth.time, "time", lambda: real_expire - auth.REFRESH_MARGIN - 60)
+    assert provider.peek("cli_x") == "t-sdk"
+
+
+def test_sdk_cache_other_keys_use_fallback(monkeypatch):
+    provider = TokenProvider()
+    monkeypatch.setattr(client, "get_token_provider", lambda: provider)
+    cache = client.SharedTokenCache()
+
+    cache.set("self_tenant_token:cli_unregistered", "t-local", int(time.time() + 600))
+
+    assert provider._tokens == {}
+    assert cache.get("self_tenant_token:cli_unregistered") == "t-local"
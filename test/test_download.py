@@ -0,0 +1,74 @@
+"""
+下载文件名解析的离线测试（传输层替换为假响应，不发起网络请求）
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from feishu_cli import download
+
+
+class FakeResponse:
+    """不支持 Range 的下载响应（200）"""
+
+    def __init__(self, disposition: str, body: bytes = b"hello"):
+        self.status_code = 200
+        self.body = body
+        self.headers = {"Content-Disposition": disposition, "Content-Length": str(len(body))}
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """让下载接口返回带指定 Content-Disposition 的响应"""
+    monkeypatch.setattr(download, "_auth_headers", lambda app_id, app_secret: {})
+
+    def serve(disposition: str):
+        monkeypatch.setattr(download.transport, "get", lambda *args, **kwargs: FakeResponse(disposition))
+    return serve
+
+
+@pytest.mark.parametrize("disposition, expected", [
+    ('attachment; filename="report.pdf"', "report.pdf"),
+    ("attachment; filename*=UTF-8''%E6%8A%A5%E5%91%8A.pdf", "报告.pdf"),
+    ('attachment; filename="../../etc/x"', "x"),
+    ("attachment; filename*=UTF-8''..%2F..%2Fx", "x"),
+    ('attachment; filename="a\\b"', "b"),
+    ('attachment; filename="/abs/path/y"', "y"),
+    ('attachment; filename=""', None),
+    ('attachment; filename="."', None),
+    ('attachment; filename=".."', None),
+    ("attachment; filename*=UTF-8''..%2F..", None),
+    ("attachment", None),
+])
+def test_parse_file_name(disposition, expected):
+    assert download._parse_file_name({"Content-Disposition": disposition}) == expected
+
+
+def test_traversal_name_stays_in_output_dir(serve, tmp_path):
+    serve('attachment; filename="../../escaped.txt"')
+
+    output = download.download("cli_x", "secret", "boxToken", output=str(tmp_path))
+
+    assert output == str(tmp_path / "escaped.txt")
+    assert (tmp_path / "escaped.txt").read_bytes() == b"hello"
+    assert not (tmp_path.parent.parent / "escaped.txt").exists()
+
+
+@pytest.mark.parametrize("name", ["", ".", ".."])
+def test_unusable_name_falls_back_to_file_token(serve, tmp_path, name):
+    serve(f'attachment; filename="{name}"')
+
+    output = download.download("cli_x", "secret", "boxToken", output=str(tmp_path))
+
+    assert output == str(tmp_path / "boxToken")
+    assert (tmp_path / "boxToken").read_bytes() == b"hello"
@@ -0,0 +1,191 @@
+"""
+失败重试与传输层重试的离线测试（不发起网络请求）
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from feishu_cli import retry, transport
+from feishu_cli.retry import RetryPolicy
+
+
+class FakeResponse:
+    """只实现重试逻辑用到的属性的响应"""
+
+    def __init__(self, status_code=200, body=None, headers=None, content_type="application/json"):
+        self.status_code = status_code
+        self._body = body
+        self.headers = dict(headers or {})
+        if content_type:
+            self.headers.setdefault("Content-Type", content_type)
+        self.closed = False
+
+    def json(self):
+        if isinstance(self._body, Exception):
+            raise self._body
+        return self._body
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        item = self.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    policy = RetryPolicy(max_retries=2, backoff_base=0.5, backoff_max=30)
+    monkeypatch.setattr(retry, "_policy", policy)
+    return policy
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr(transport.time, "sleep", waits.append)
+    return waits
+
+
+@pytest.mark.parametrize("status, code, expected", [
+    (429, None, "rate_limit"),
+    (200, 99991400, "rate_limit"),
+    (400, 1254290, "rate_limit"),
+    (500, None, "transient"),
+    (503, None, "transient"),
+    (200, 1254291, "transient"),
+    (200, 1061045, "transient"),
+    (200, 0, None),
+    (404, None, None),
+    (400, 99991663, None),
+])
+def test_classify(status, code, expected):
+    assert retry.classify(status, code) == expected
+
+
+def test_classify_rate_limit_wins_over_transient():
+    assert retry.classify(500, 99991400) == "rate_limit"
+
+
+def test_response_failure_reads_business_code():
+    assert retry.response_failure(FakeResponse(400, {"code": 99991400, "msg": "too many"})) == "rate_limit"
+    assert retry.response_failure(FakeResponse(200, {"code": 1254291})) == "transient"
+    assert retry.response_failure(FakeResponse(200, {"code": 0})) is None
+
+
+def test_response_failure_non_json_body():
+    # 非 JSON 的 Content-Type 不读响应体，只看状态码
+    body = ValueError("should not be read")
+    assert retry.response_failure(FakeResponse(502, body, content_type="text/html")) == "transient"
+    assert retry.response_failure(FakeResponse(200, body, content_type="application/octet-stream")) is None
+
+
+def test_response_failure_invalid_json():
+    assert retry.response_failure(FakeResponse(503, ValueError("bad json"))) == "transient"
+    assert retry.response_failure(FakeResponse(200, ValueError("bad json"))) is None
+    assert retry.response_failure(FakeResponse(200, ["not", "a", "dict"])) is None
+
+
+@pytest.mark.parametrize("kind, idempotent, expected", [
+    ("rate_limit", False, True),
+    ("rate_limit", True, True),
+    ("transient", True, True),
+    ("transient", False, False),
+    (None, True, False),
+    (None, False, False),
+])
+def test_should_retry(kind, idempotent, expected):
+    assert retry.should_retry(kind, idempotent) is expected
+
+
+def test_is_idempotent():
+    assert retry.is_idempotent("GET")
+    assert retry.is_idempotent("delete")
+    assert retry.is_idempotent("PUT")
+    assert not retry.is_idempotent("POST")
+    assert not retry.is_idempotent("PATCH", {"page_size": 10})
+    assert not retry.is_idempotent("POST", {"client_token": ""})
+    assert retry.is_idempotent("POST", {"client_token": "8d6d1b8e"})
+
+
+def test_delay_honours_retry_after(monkeypatch):
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=30)
+    assert policy.delay(0, {"Retry-After": "3"}) == 3.5
+    # 头部名称大小写不敏感
+    assert policy.delay(5, {"retry-after": "2"}) == 2.5
+    assert policy.delay(0, {"x-ogw-ratelimit-reset": "7"}) == 7.5
+    # 两者都有时以 Retry-After 为准
+    assert policy.delay(0, {"Retry-After": "1", "x-ogw-ratelimit-reset": "9"}) == 1.5
+
+
+def test_delay_caps_hint_and_ignores_invalid(monkeypatch):
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=30)
+    assert policy.delay(0, {"Retry-After": "3600"}) == 30.5
+    assert policy.delay(0, {"Retry-After": "-5"}) == 0.5
+    # 无法解析的值退回指数退避
+    assert policy.delay(2, {"Retry-After": "soon"}) == 2.0
+    assert policy.delay(3) == 4.0
+    assert policy.delay(10) == 30
+
+
+def test_transport_gives_up_after_max_retries(policy, sleeps):
+    responses = [FakeResponse(429, {"code": 99991400}) for _ in range(policy.max_retries + 1)]
+    session = FakeSession(responses)
+    client = transport.Transport()
+    client.session = session
+
+    response = client.request("GET", "/drive/v1/files")
+
+    assert len(session.calls) == policy.max_retries + 1
+    assert len(sleeps) == policy.max_retries
+    assert response is responses[-1]
+    # 被重试丢弃的响应都已关闭，最后一次交给调用方
+    assert [r.closed for r in responses] == [True] * policy.max_retries + [False]
+    assert session.calls[0][1] == transport.BASE_URL + "/drive/v1/files"
+
+
+def test_transport_retries_until_success(policy, sleeps):
+    session = FakeSession([FakeResponse(503), FakeResponse(200, {"code": 0})])
+    client = transport.Transport()
+    client.session = session
+
+    response = client.request("GET", "/drive/v1/files")
+
+    assert response.status_code == 200
+    assert len(session.calls) == 2
+
+
+def test_transport_does_not_retry_transient_post(policy, sleeps):
+    session = FakeSession([FakeResponse(500), FakeResponse(200)])
+    client = transport.Transport()
+    client.session = session
+
+    assert client.request("POST", "/drive/v1/files/create_folder").status_code == 500
+    assert len(session.calls) == 1
+    assert sleeps == []
+
+
+def test_transport_network_error_after_max_retries(policy, sleeps):
+    errors = [requests.ConnectionError("reset") for _ in range(policy.max_retries + 1)]
+    client = transport.Transport()
+    client.session = FakeSession(errors)
+
+    with pytest.raises(requests.ConnectionError):
+        client.request("GET", "/drive/v1/files")
+    assert len(sleeps) == policy.max_retries
@@ -0,0 +1,161 @@
+"""
+plan_sync 的离线测试（不发起网络请求）
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from feishu_cli.sync import OP_DELETE, OP_MKDIR, OP_UPDATE, OP_UPLOAD, SyncManifest, plan_sync
+from feishu_cli.upload_dir import sha256_file
+
+
+@pytest.fixture
+def local_dir(tmp_path):
+    root = tmp_path / "local"
+    (root / "docs" / "2026").mkdir(parents=True)
+    (root / "a.txt").write_bytes(b"hello")
+    (root / "docs" / "b.txt").write_bytes(b"world!")
+    (root / "docs" / "2026" / "c.txt").write_bytes(b"q4")
+    return root
+
+
+@pytest.fixture
+def manifest(tmp_path, local_dir):
+    return SyncManifest(tmp_path / "manifest.json", str(local_dir), "fldroot")
+
+
+def scan(root: Path) -> dict:
+    files = {}
+    for path in root.rglob("*"):
+        if path.is_file():
+            stat = os.stat(path)
+            files[path.relative_to(root).as_posix()] = (str(path), stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def remote(token: str, modified_time: str = "100", size=None) -> dict:
+    return {"token": token, "modified_time": modified_time, "size": size}
+
+
+def synced(local_files: dict, rel_path: str, token: str, modified_time: str = "100") -> dict:
+    file_path, size, mtime_ns = local_files[rel_path]
+    return {"size": size, "mtime_ns": mtime_ns, "sha256": sha256_file(file_path),
+            "token": token, "modified_time": modified_time}
+
+
+def test_first_sync_uploads_and_creates_folders_parent_first(local_dir, manifest):
+    ops = plan_sync(scan(local_dir), {}, {}, manifest)
+
+    assert [(op["op"], op["path"]) for op in ops] == [
+        (OP_MKDIR, "docs"),
+        (OP_MKDIR, "docs/2026"),
+        (OP_UPLOAD, "a.txt"),
+        (OP_UPLOAD, "docs/2026/c.txt"),
+        (OP_UPLOAD, "docs/b.txt"),
+    ]
+
+
+def test_existing_remote_folders_are_not_created(local_dir, manifest):
+    ops = plan_sync(scan(local_dir), {}, {"docs": "fld1"}, manifest)
+
+    assert [op["path"] for op in ops if op["op"] == OP_MKDIR] == ["docs/2026"]
+
+
+def test_unchanged_file_is_skipped(local_dir, manifest):
+    local_files = scan(local_dir)
+    manifest.files["a.txt"] = synced(local_files, "a.txt", "boxA")
+
+    ops = plan_sync(local_files, {"a.txt": remote("boxA")}, {"docs": "f1", "docs/2026": "f2"}, manifest)
+
+    assert "a.txt" not in [op["path"] for op in ops]
+
+
+def test_mtime_only_change_updates_manifest_without_upload(local_dir, manifest):
+    local_files = scan(local_dir)
+    manifest.files["a.txt"] = dict(synced(local_files, "a.txt", "boxA"), mtime_ns=1)
+
+    ops = plan_sync(local_files, {"a.txt": remote("boxA")}, {}, manifest)
+
+    assert "a.txt" not in [op["path"] for op in ops]
+    assert manifest.files["a.txt"]["mtime_ns"] == local_files["a.txt"][2]
+
+
+def test_content_change_is_update(local_dir, manifest):
+    local_files = scan(local_dir)
+    manifest.files["a.txt"] = dict(synced(local_files, "a.txt", "boxA"), mtime_ns=1, sha256="0" * 64)
+
+    ops = plan_sync(local_files, {"a.txt": remote("boxA")}, {}, manifest)
+
+    assert {"op": OP_UPDATE, "path": "a.txt", "token": "boxA", "size": 5} in ops
+
+
+def test_remote_edit_is_update(local_dir, manifest):
+    local_files = scan(local_dir)
+    manifest.files["a.txt"] = synced(local_files, "a.txt", "boxA")
+
+    ops = plan_sync(local_files, {"a.txt": remote("boxA", modified_time="200")}, {}, manifest)
+
+    assert [op["op"] for op in ops if op["path"] == "a.txt"] == [OP_UPDATE]
+
+
+def test_missing_remote_modified_time_is_filled_in(local_dir, manifest):
+    local_files = scan(local_dir)
+    manifest.files["a.txt"] = synced(local_files, "a.txt", "boxA", modified_time=None)
+
+    ops = plan_sync(local_files, {"a.txt": remote("boxA", modified_time="300")}, {}, manifest)
+
+    assert "a.txt" not in [op["path"] for op in ops]
+    assert manifest.files["a.txt"]["modified_time"] == "300"
+
+
+def test_same_size_remote_is_adopted_without_manifest(local_dir, manifest):
+    local_files = scan(local_dir)
+
+    ops = plan_sync(local_files, {"a.txt": remote("boxA", size=5)}, {}, manifest)
+
+    assert "a.txt" not in [op["path"] for op in ops]
+    assert manifest.files["a.txt"] == synced(local_files, "a.txt", "boxA")
+
+
+def test_remote_with_different_or_unknown_size_is_update(local_dir, manifest):
+    remote_files = {"a.txt": remote("boxA", size=6), "docs/b.txt": remote("boxB")}
+
+    ops = plan_sync(scan(local_dir), remote_files, {}, manifest)
+
+    assert [(op["op"], op["token"]) for op in ops if op["op"] == OP_UPDATE] == [
+        (OP_UPDATE, "boxA"), (OP_UPDATE, "boxB")]
+    assert manifest.files == {}
+
+
+def test_adopt_disabled_reuploads(local_dir, manifest):
+    ops = plan_sync(scan(local_dir), {"a.txt": remote("boxA", size=5)}, {}, manifest, adopt=False)
+
+    assert {"op": OP_UPDATE, "path": "a.txt", "token": "boxA", "size": 5} in ops
+
+
+def test_replaced_remote_file_is_not_adopted(local_dir, manifest):
+    local_files = scan(local_dir)
+    manifest.files["a.txt"] = synced(local_files, "a.txt", "boxOld")
+
+    ops = plan_sync(local_files, {"a.txt": remote("boxNew", size=5)}, {}, manifest)
+
+    assert {"op": OP_UPDATE, "path": "a.txt", "token": "boxNew", "size": 5} in ops
+
+
+def test_delete_only_when_requested(local_dir, manifest):
+    local_files = scan(local_dir)
+    remote_files = {"gone.txt": remote("boxGone")}
+    manifest.files["gone.txt"] = {"size": 1, "mtime_ns": 1, "sha256": "", "token": "boxGone",
+                                  "modified_time": "100"}
+
+    assert OP_DELETE not in [op["op"] for op in plan_sync(local_files, remote_files, {}, manifest)]
+    ops = plan_sync(local_files, remote_files, {}, manifest, delete=True)
+
+    assert ops[-1] == {"op": OP_DELETE, "path": "gone.txt", "token": "boxGone", "size": None}
+    # 本地已不存在的文件不再跟踪
+    assert "gone.txt" not in manifest.files
@@ -0,0 +1,116 @@
+"""
+分页树遍历引擎的离线测试（假的分页数据，不发起网络请求）
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from feishu_cli.paging import PagingError
+from feishu_cli.treewalk import walk_tree
+
+
+# parent → 分页后的子项 (name, has_children)
+TREE = {
+    None: [[("a", True), ("b", False)], [("c", True)]],
+    "a": [[("a1", False), ("a2", True)]],
+    "a2": [[("a2x", False)]],
+    "c": [[("c1", False)]],
+}
+
+
+class FakeTree:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.requests = []
+
+    def fetch(self, parent, page_token):
+        self.requests.append((parent, page_token))
+        if parent in self.fail:
+            return None
+        pages = TREE[parent]
+        index = int(page_token or 0)
+        has_more = index + 1 < len(pages)
+        return SimpleNamespace(items=pages[index], has_more=has_more,
+                               page_token=str(index + 1) if has_more else None)
+
+    @staticmethod
+    def expand(page, path, depth):
+        for name, has_children in page.items:
+            entry = {"name": name, "path": f"{path}/{name}", "depth": depth}
+            yield entry, ((name, entry["path"]) if has_children else None)
+
+
+def names(entries):
+    return sorted(entry["name"] for entry in entries)
+
+
+def test_walks_all_pages_and_levels():
+    tree = FakeTree()
+    entries = list(walk_tree(None, tree.fetch, tree.expand, concurrency=3))
+
+    assert names(entries) == ["a", "a1", "a2", "a2x", "b", "c", "c1"]
+    assert {entry["path"]: entry["depth"] for entry in entries}["/a/a2/a2x"] == 3
+    # 叶子节点不发请求，每页只请求一次
+    assert sorted(tree.requests, key=str) == sorted([(None, None), (None, "1"), ("a", None),
+                                                     ("a2", None), ("c", None)], key=str)
+
+
+def test_max_depth_stops_expanding():
+    tree = FakeTree()
+    entries = list(walk_tree(None, tree.fetch, tree.expand, max_depth=1))
+
+    assert names(entries) == ["a", "b", "c"]
+    assert all(parent is None for parent, _ in tree.requests)
+
+
+def test_filtered_entries_are_still_expanded():
+    tree = FakeTree()
+
+    def only_leaves(page, path, depth):
+        for entry, child in FakeTree.expand(page, path, depth):
+            yield (None if child else entry), child
+
+    assert names(walk_tree(None, tree.fetch, only_leaves)) == ["a1", "a2x", "b", "c1"]
+
+
+def test_checkpoint_resume(tmp_path):
+    checkpoint = tmp_path / "walk.ckpt"
+    identity = {"root": None, "max_depth": None}
+    seen = []
+
+    with pytest.raises(PagingError, match="a2"):
+        for entry in walk_tree(None, FakeTree(fail={"a2"}).fetch, FakeTree.expand, concurrency=1,
+                               checkpoint=str(checkpoint), identity=identity,
+                               describe=lambda token: f"{token} 获取失败"):
+            seen.append(entry)
+
+    saved = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert saved["root"] is None and saved["max_depth"] is None
+    assert ["a2", "/a/a2", 3, None] in saved["pending"]
+
+    tree = FakeTree()
+    seen.extend(walk_tree(None, tree.fetch, tree.expand, checkpoint=str(checkpoint), identity=identity))
+
+    assert set(names(seen)) == {"a", "a1", "a2", "a2x", "b", "c", "c1"}
+    assert (None, None) not in tree.requests
+    assert not checkpoint.exists()
+
+
+def test_checkpoint_with_other_identity_is_not_resumed(tmp_path, capsys):
+    checkpoint = tmp_path / "walk.ckpt"
+    checkpoint.write_text(json.dumps({"root": None, "max_depth": 1, "pending": [["c", "/c", 2, None]]}),
+                          encoding="utf-8")
+    tree = FakeTree()
+
+    entries = list(walk_tree(None, tree.fetch, tree.expand, checkpoint=str(checkpoint),
+                             identity={"root": None, "max_depth": None}))
+
+    assert "max_depth" in capsys.readouterr().out
+    assert names(entries) == ["a", "a1", "a2", "a2x", "b", "c", "c1"]
+    assert (None, None) in tree.requests
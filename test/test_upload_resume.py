@@ -0,0 +1,192 @@
+"""
+分片上传续传的离线测试（retry.call_sdk 替换为直接调用假客户端，不发起网络请求）
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from feishu_cli import upload
+from feishu_cli.upload import UPLOAD_SESSION_TTL, UploadManifest, adler32, upload_media_multipart
+
+
+BLOCK_SIZE = 4
+
+
+class FakeResponse:
+    def __init__(self, data=None, code=0, msg="success"):
+        self.data = data
+        self.code = code
+        self.msg = msg
+
+    def success(self) -> bool:
+        return self.code == 0
+
+    def get_log_id(self) -> str:
+        return "log-id"
+
+
+class FakeMedia:
+    """记录调用的 client.drive.v1.media；expired 中的 upload_id 上传分片时返回失败"""
+
+    def __init__(self, expired=()):
+        self.expired = set(expired)
+        self.prepared = 0
+        self.parts = []
+        self.finished = []
+
+    def upload_prepare(self, request):
+        self.prepared += 1
+        size = request.request_body.size
+        return FakeResponse(SimpleNamespace(upload_id=f"upload-{self.prepared}", block_size=BLOCK_SIZE,
+                                            block_num=-(-size // BLOCK_SIZE)))
+
+    def upload_part(self, request):
+        body = request.request_body
+        if body.upload_id in self.expired:
+            return FakeResponse(code=1061002, msg="params error")
+        self.parts.append((body.upload_id, body.seq))
+        return FakeResponse()
+
+    def upload_finish(self, request):
+        body = request.request_body
+        self.finished.append((body.upload_id, body.block_num))
+        return FakeResponse(SimpleNamespace(file_token=f"box-{body.upload_id}"))
+
+
+@pytest.fixture(autouse=True)
+def manifest_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "manifests"
+    settings = {"upload_manifest_dir": str(directory)}
+    monkeypatch.setattr(upload, "get_config", lambda: SimpleNamespace(get=lambda key, default=None:
+                                                                       settings.get(key, default)))
+    monkeypatch.setattr(upload.retry, "call_sdk", lambda call, idempotent=True, family=None: call())
+    return directory
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"0123456789")
+    return path
+
+
+def fake_client(media: FakeMedia):
+    return SimpleNamespace(drive=SimpleNamespace(v1=SimpleNamespace(media=media)))
+
+
+def test_manifest_key(data_file, manifest_dir):
+    first = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    again = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    other_parent = UploadManifest.open(str(data_file), "docx_file", "doxB", "data.bin")
+    other_name = UploadManifest.open(str(data_file), "docx_file", "doxA", "renamed.bin")
+
+    assert first.path == again.path
+    assert first.path.parent == manifest_dir
+    assert len({first.path, other_parent.path, other_name.path}) == 3
+    stat = os.stat(data_file)
+    assert first.identity["size"] == stat.st_size
+    assert first.identity["mtime_ns"] == stat.st_mtime_ns
+
+
+def test_manifest_is_reloaded_for_same_file(data_file):
+    manifest = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    manifest.start("upload-1", BLOCK_SIZE, 3)
+    manifest.mark_done(0, "abc")
+
+    reopened = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+
+    assert reopened.resumable
+    assert reopened.data["upload_id"] == "upload-1"
+    assert reopened.checksum(0) == "abc"
+
+
+@pytest.mark.parametrize("change", ["size", "mtime"])
+def test_identity_mismatch_discards_manifest(data_file, change):
+    manifest = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    manifest.start("upload-1", BLOCK_SIZE, 3)
+
+    if change == "size":
+        data_file.write_bytes(b"0123456789abc")
+    else:
+        stat = os.stat(data_file)
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reopened = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+
+    assert reopened.data["upload_id"] is None
+    assert not reopened.resumable
+
+
+def test_session_expiry(data_file):
+    manifest = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    assert not manifest.resumable
+
+    manifest.start("upload-1", BLOCK_SIZE, 3)
+    assert manifest.resumable
+
+    manifest.data["created_at"] = time.time() - UPLOAD_SESSION_TTL - 1
+    assert not manifest.resumable
+
+
+def test_resume_only_sends_missing_parts(data_file):
+    manifest = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    manifest.start("upload-old", BLOCK_SIZE, 3)
+    manifest.mark_done(0, adler32(str(data_file), 0, BLOCK_SIZE))
+    # 内容已变化的分片（校验和不同）需要重新发送
+    manifest.mark_done(1, "stale")
+    media = FakeMedia()
+
+    result = upload_media_multipart("app", "secret", str(data_file), "docx_file", "doxA",
+                                    client=fake_client(media))
+
+    assert result.file_token == "box-upload-old"
+    assert media.prepared == 0
+    assert sorted(media.parts) == [("upload-old", 1), ("upload-old", 2)]
+    assert not manifest.path.exists()
+
+
+def test_failed_resume_falls_back_to_new_session(data_file):
+    manifest = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    manifest.start("upload-old", BLOCK_SIZE, 3)
+    media = FakeMedia(expired={"upload-old"})
+
+    result = upload_media_multipart("app", "secret", str(data_file), "docx_file", "doxA",
+                                    client=fake_client(media))
+
+    assert result.file_token == "box-upload-1"
+    assert media.prepared == 1
+    assert sorted(media.parts) == [("upload-1", 0), ("upload-1", 1), ("upload-1", 2)]
+    assert media.finished == [("upload-1", 3)]
+    assert not manifest.path.exists()
+
+
+def test_expired_session_is_not_resumed(data_file):
+    manifest = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    manifest.start("upload-old", BLOCK_SIZE, 3)
+    manifest.data["created_at"] = time.time() - UPLOAD_SESSION_TTL - 1
+    manifest._save()
+    media = FakeMedia()
+
+    result = upload_media_multipart("app", "secret", str(data_file), "docx_file", "doxA",
+                                    client=fake_client(media))
+
+    assert result.file_token == "box-upload-1"
+    assert all(upload_id == "upload-1" for upload_id, _ in media.parts)
+
+
+def test_failure_keeps_manifest_for_next_run(data_file):
+    media = FakeMedia(expired={"upload-1"})
+
+    result = upload_media_multipart("app", "secret", str(data_file), "docx_file", "doxA",
+                                    client=fake_client(media))
+
+    assert result is None
+    manifest = UploadManifest.open(str(data_file), "docx_file", "doxA", "data.bin")
+    assert manifest.data["upload_id"] == "upload-1"
@@ -5,22 +5,22 @@
 """
 
 import json
-import requests
+import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-def get_tenant_access_token(app_id: str, app_secret: str) -> str:
-    """获取 tenant_access_token"""
-    url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
-    response = requests.post(
-        url,
-        json={"app_id": app_id, "app_secret": app_secret}
-    )
-    return response.json().get("tenant_access_token")
+import lark_oapi as lark
+
+from feishu_cli import transport
+from feishu_cli.auth import get_tenant_access_token
+from feishu_cli.wiki_cache import get_wiki_node_cache
+from feishu_cli.wiki_nodes import resolve_node
 
 
 def get_wiki_node_info(app_id: str, app_secret: str, token: str) -> dict:
     """
-    获取 Wiki 节点信息
+    获取 Wiki 节点信息（经由本地缓存）
 
     Args:
         app_id: 应用 ID
@@ -30,28 +30,10 @@ def get_wiki_node_info(app_id: str, app_secret: str, token: str) -> dict:
     Returns:
         dict: 节点信息
     """
-    access_token = get_tenant_access_token(app_id, app_secret)
-
-    url = "https://open.feishu.cn/open-apis/wiki/v2/spaces/nodes/get_node"
-
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json"
-    }
-
-    body = {
-        "token": token
-    }
-
-    response = requests.post(url, headers=headers, json=body)
-    result = response.json()
-
-    if result.get("code") != 0:
-        print(f"❌ 获取失败: {result.get('code')} - {result.get('msg')}")
-        print(f"详细信息: {json.dumps(result, indent=2, ensure_ascii=False)}")
+    node = resolve_node(app_id, app_secret, token, cache=get_wiki_node_cache())
+    if node is None:
         return None
-
-    return result.get("data")
+    return json.loads(lark.JSON.marshal(node))
 
 
 def get_document_blocks(app_id: str, app_secret: str, document_id: str) -> dict:
@@ -74,7 +56,7 @@ def get_document_blocks(app_id: str, app_secret: str, document_id: str) -> dict:
         "Authorization": f"Bearer {access_token}"
     }
 
-    response = requests.get(url, headers=headers)
+    response = transport.get(url, headers=headers)
     result = response.json()
 
     if result.get("code") != 0:
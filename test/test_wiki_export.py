@@ -0,0 +1,246 @@
+"""
+知识库导出 Markdown 渲染的离线测试：文档块 → 期望的 Markdown
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from feishu_cli.wiki_export import escape_markdown, render_markdown, safe_name
+
+
+def run(content: str, **style) -> dict:
+    element = {"text_run": {"content": content}}
+    if style:
+        element["text_run"]["text_element_style"] = style
+    return element
+
+
+def block(block_id: str, key: str, *elements, children=None, **body) -> dict:
+    data = {"block_id": block_id, key: dict(body, elements=list(elements))}
+    if children:
+        data["children"] = children
+    return data
+
+
+def document(*blocks, title: str = "标题") -> list:
+    """以 page 块为根，blocks 依次为其直接子块（子块的 children 引用的块也放在 blocks 中）"""
+    nested = {child for item in blocks for child in item.get("children", [])}
+    page = block("page", "page", run(title), children=[item["block_id"] for item in blocks
+                                                       if item["block_id"] not in nested])
+    return [page, *blocks]
+
+
+def test_empty_document():
+    assert render_markdown([]) == ""
+    assert render_markdown(document(title="")) == "\n"
+
+
+def test_page_title_and_headings():
+    items = document(
+        block("h1", "heading1", run("一级")),
+        block("h2", "heading2", run("二级")),
+        block("h9", "heading9", run("九级")),
+        block("p", "text", run("正文")),
+    )
+
+    assert render_markdown(items) == (
+        "# 标题\n"
+        "\n"
+        "# 一级\n"
+        "\n"
+        "## 二级\n"
+        "\n"
+        "###### 九级\n"
+        "\n"
+        "正文\n"
+    )
+
+
+def test_lists_are_tight_and_nested():
+    items = document(
+        block("b1", "bullet", run("苹果"), children=["b2", "o1"]),
+        block("b2", "bullet", run("红富士")),
+        block("o1", "ordered", run("第一步")),
+        block("b3", "bullet", run("香蕉")),
+        block("p", "text", run("结束")),
+    )
+
+    assert render_markdown(items) == (
+        "# 标题\n"
+        "\n"
+        "- 苹果\n"
+        "    - 红富士\n"
+        "    1. 第一步\n"
+        "- 香蕉\n"
+        "\n"
+        "结束\n"
+    )
+
+
+def test_todo():
+    items = document(
+        block("t1", "todo", run("已完成"), style={"done": True}),
+        block("t2", "todo", run("未完成"), style={"done": False}),
+        block("t3", "todo", run("没有 style")),
+    )
+
+    assert render_markdown(items) == (
+        "# 标题\n"
+        "\n"
+        "- [x] 已完成\n"
+        "- [ ] 未完成\n"
+        "- [ ] 没有 style\n"
+    )
+
+
+def test_code_block_is_not_escaped():
+    items = document(
+        block("c", "code", run("def f(*args):\n"), run("    return args[0]  # _x_"), style={"language": 49}),
+    )
+
+    assert render_markdown(items) == (
+        "# 标题\n"
+        "\n"
+        "```\n"
+        "def f(*args):\n"
+        "    return args[0]  # _x_\n"
+        "```\n"
+    )
+
+
+def test_quote_and_quote_container():
+    items = document(
+        block("q", "quote", run("第一行\n第二行")),
+        {"block_id": "qc", "quote_container": {}, "children": ["x1", "x2"]},
+        block("x1", "text", run("段落一")),
+        block("x2", "text", run("段落二")),
+    )
+
+    assert render_markdown(items) == (
+        "# 标题\n"
+        "\n"
+        "> 第一行\n"
+        "> 第二行\n"
+        "\n"
+        "> 段落一\n"
+        ">\n"
+        "> 段落二\n"
+    )
+
+
+def test_inline_styles_and_links():
+    items = document(
+        block("p", "text",
+              run("粗体", bold=True), run(" "), run("斜体", italic=True), run(" "),
+              run("删除", strikethrough=True), run(" "), run("a*b", inline_code=True), run(" "),
+              run("链接", link={"url": "https%3A%2F%2Fexample.com%2Fa%3Fb%3D1"}), run(" "),
+              {"mention_doc": {"title": "设计_v2", "url": "https%3A%2F%2Fx.feishu.cn%2Fdocx%2Fabc"}},
+              {"equation": {"content": "E=mc^2\n"}}),
+    )
+
+    assert render_markdown(items).split("\n")[2] == (
+        "**粗体** *斜体* ~~删除~~ `a*b` [链接](https://example.com/a?b=1) "
+        "[设计\\_v2](https://x.feishu.cn/docx/abc)$E=mc^2$"
+    )
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("a*b*c", "a\\*b\\*c"),
+    ("snake_case_name", "snake\\_case\\_name"),
+    ("[不是链接](x)", "\\[不是链接\\](x)"),
+    ("<div>", "\\<div\\>"),
+    ("a | b", "a \\| b"),
+    ("`code`", "\\`code\\`"),
+    ("C:\\path", "C:\\\\path"),
+    ("~~", "\\~\\~"),
+    ("# 不是标题", "\\# 不是标题"),
+    ("## 也不是", "\\## 也不是"),
+    ("- 不是列表", "\\- 不是列表"),
+    ("+ 不是列表", "\\+ 不是列表"),
+    ("1. 不是有序列表", "1\\. 不是有序列表"),
+    ("2026 年", "2026 年"),
+    ("-5 度", "-5 度"),
+    ("#标签", "#标签"),
+    ("中间的 # 号和 1. 不转义", "中间的 # 号和 1. 不转义"),
+])
+def test_text_escaping(content, expected):
+    items = document(block("p", "text", run(content)))
+
+    assert render_markdown(items) == f"# 标题\n\n{expected}\n"
+
+
+def test_escaping_in_list_items_and_headings():
+    items = document(
+        block("h", "heading2", run("1. 概述")),
+        block("b", "bullet", run("- 嵌套符号 *重点*")),
+    )
+
+    assert render_markdown(items) == (
+        "# 标题\n"
+        "\n"
+        "## 1\\. 概述\n"
+        "\n"
+        "- \\- 嵌套符号 \\*重点\\*\n"
+    )
+
+
+def test_title_is_escaped():
+    assert render_markdown(document(title="a_b")) == "# a\\_b\n"
+
+
+def test_table_divider_and_image():
+    items = document(
+        {"block_id": "t", "table": {"property": {"row_size": 2, "column_size": 2},
+                                    "cells": ["c1", "c2", "c3", "c4"]},
+         "children": ["c1", "c2", "c3", "c4"]},
+        {"block_id": "c1", "table_cell": {}, "children": ["x1"]},
+        {"block_id": "c2", "table_cell": {}, "children": ["x2"]},
+        {"block_id": "c3", "table_cell": {}, "children": ["x3"]},
+        {"block_id": "c4", "table_cell": {}},
+        block("x1", "text", run("名称")),
+        block("x2", "text", run("a|b")),
+        block("x3", "text", run("值")),
+        {"block_id": "d", "divider": {}},
+        {"block_id": "i", "image": {"token": "boxImg", "width": 100}},
+    )
+
+    assert render_markdown(items) == (
+        "# 标题\n"
+        "\n"
+        "| 名称 | a\\|b |\n"
+        "| --- | --- |\n"
+        "| 值 |  |\n"
+        "\n"
+        "---\n"
+        "\n"
+        "![image](boxImg)\n"
+    )
+
+
+def test_unknown_block_renders_children():
+    items = document(
+        {"block_id": "grid", "grid": {"column_size": 2}, "children": ["col"]},
+        {"block_id": "col", "grid_column": {}, "children": ["p"]},
+        block("p", "text", run("分栏内容")),
+    )
+
+    assert render_markdown(items) == "# 标题\n\n分栏内容\n"
+
+
+def test_escape_markdown_leaves_plain_text():
+    assert escape_markdown("普通文本 123.") == "普通文本 123."
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("周报 2026/10", "周报 2026_10"),
+    ('a:b*c?"d"<e>|f', "a_b_c__d__e__f"),
+    ("..", "untitled"),
+    ("", "untitled"),
+    (" .hidden. ", "hidden"),
+])
+def test_safe_name(title, expected):
+    assert safe_name(title) == expected